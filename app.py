@@ -1,10 +1,16 @@
 import streamlit as st
 import snowflake.connector
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse
 from io import BytesIO
 from PIL import Image
 import json
@@ -12,16 +18,29 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import folium
 from streamlit_folium import st_folium
-from folium.plugins import MarkerCluster
+from folium.plugins import FastMarkerCluster
 import streamlit.components.v1 as components
 import os
+import csv
+import hashlib
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict
 import branca.colormap as cm
 import json
 from datetime import datetime
 import time
 import random
+import copy
+import functools
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from sklearn.neighbors import BallTree
+from sklearn.feature_extraction.text import TfidfVectorizer, ENGLISH_STOP_WORDS
 import google.generativeai as genai
-from dotenv import load_dotenv
 
 # Set page configuration
 st.set_page_config(
@@ -66,6 +85,152 @@ def add_indian_culture_footer():
         st.write("")  # Empty column for spacing
 
 
+GEMINI_MODEL_NAME = "gemini-1.5-flash"
+
+BHARAT_SYSTEM_INSTRUCTION = """
+    You are Bharat Explorer, an enthusiastic and knowledgeable AI assistant specializing in Indian culture, art, and tourism. 
+    
+    Your expertise includes:
+    - Indian cultural traditions, customs, and heritage
+    - Classical and folk art forms, dance, and music
+    - Festivals and celebrations across different regions
+    - Historical monuments, temples, and tourist destinations
+    - Regional cuisines and culinary traditions
+    - Traditional crafts and handicrafts
+    - Ancient philosophies and spiritual practices
+    
+    Always provide:
+    - Detailed, accurate, and engaging responses
+    - Cultural context and historical background
+    - Practical travel tips when relevant
+    - Respectful and culturally sensitive information
+    - Regional variations and diversity within India
+    
+    Use emojis appropriately to make responses more engaging and maintain a warm, conversational tone.
+    """
+
+
+@st.cache_resource
+def load_gemini_model(model_name, instruction_hash, api_key_hash, _system_instruction, _api_key):
+    # Configure the Gemini API once per process, and again whenever the key changes
+    genai.configure(api_key=_api_key)
+    return genai.GenerativeModel(model_name=model_name, system_instruction=_system_instruction)
+
+
+def get_gemini_model(model_name, system_instruction, api_key):
+    """The process-wide Gemini model for a model name, system instruction and API key."""
+    instruction_hash = hashlib.sha256(system_instruction.encode("utf-8")).hexdigest()
+    # Cache on a hash of the key so a rotated key takes effect without keeping it in the cache key
+    api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    return load_gemini_model(model_name, instruction_hash, api_key_hash, system_instruction, api_key)
+
+
+def normalize_question(text):
+    """Lowercase words without punctuation, with simple plurals folded so "Temples?" matches "temple"."""
+    words = re.sub(r"[^\w\s]", " ", text.lower().replace("&", " and ")).split()
+    return " ".join(
+        word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+        for word in words
+    )
+
+
+# Cosine similarity a first-turn question needs to reuse a cached answer
+RESPONSE_CACHE_SIMILARITY = 0.9
+# Seconds a cached answer stays reusable
+RESPONSE_CACHE_TTL_SECONDS = 24 * 3600
+# Most answers kept per model
+RESPONSE_CACHE_ENTRIES = 256
+
+
+class ResponseCache:
+    """
+    Answers to first-turn chatbot questions, looked up by exact normalized text and
+    then by TF-IDF cosine similarity. Entries expire after ttl_seconds and the least
+    recently used are dropped past max_entries.
+    """
+
+    def __init__(self, threshold, ttl_seconds, max_entries):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # normalized question -> (answer, stored_at)
+        self._lock = threading.Lock()
+        self._vectorizer = None
+        self._matrix = None
+        self._keys = []
+
+    def _expire(self):
+        cutoff = time.time() - self.ttl_seconds
+        expired = [key for key, (_, stored_at) in self._entries.items() if stored_at < cutoff]
+        for key in expired:
+            del self._entries[key]
+        if expired:
+            self._matrix = None
+
+    def _similar_key(self, key):
+        if not self._entries:
+            return None
+        if self._matrix is None:
+            # Refit lazily after puts and expiry; a few hundred short questions fit in milliseconds
+            self._keys = list(self._entries)
+            self._vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), sublinear_tf=True)
+            try:
+                self._matrix = self._vectorizer.fit_transform(self._keys)
+            except ValueError:
+                # Every cached question is stop words only
+                self._matrix = None
+                return None
+        scores = (self._vectorizer.transform([key]) @ self._matrix.T).toarray()[0]
+        best = int(scores.argmax())
+        if scores[best] < self.threshold:
+            return None
+        # A content word the cached question never mentions (another state, another festival) is a different question
+        candidate = self._keys[best]
+        if set(key.split()) - ENGLISH_STOP_WORDS - set(candidate.split()):
+            return None
+        return candidate
+
+    def get(self, question):
+        """The cached answer for question, or None."""
+        key = normalize_question(question)
+        with self._lock:
+            self._expire()
+            if key not in self._entries:
+                key = self._similar_key(key)
+                if key is None:
+                    return None
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, question, answer):
+        key = normalize_question(question)
+        if not key or not answer:
+            return
+        with self._lock:
+            self._entries[key] = (answer, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._matrix = None
+
+
+@st.cache_resource
+def get_response_cache(model_name):
+    """Process-wide cache of first-turn answers from one Gemini model."""
+    return ResponseCache(RESPONSE_CACHE_SIMILARITY, RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_ENTRIES)
+
+
+def bot_message_html(content, timestamp):
+    """Chat bubble for a Bharat Explorer reply, with the reply text HTML-escaped."""
+    clean_content = content.replace('<', '&lt;').replace('>', '&gt;')
+    return f"""
+    <div class="bot-message">
+        <strong>🇮🇳 Bharat Explorer</strong> <small>({timestamp})</small><br><br>
+        {clean_content}
+    
+    """
+
+
 def bharat_explorer():
     """
     A beautiful, modern Streamlit chatbot for exploring Indian culture, art, and tourism.
@@ -169,8 +334,6 @@ def bharat_explorer():
     </style>
     """, unsafe_allow_html=True)
     
-    # Load environment variables
-    load_dotenv()
     api_key = st.secrets["GOOGLE_API_KEY"]
     
     # Header
@@ -224,39 +387,12 @@ def bharat_explorer():
         st.info("💡 Get your API key from Google AI Studio and add it to your .env file")
         return
     
-    # Configure Gemini API
-    genai.configure(api_key=api_key)
-    
-    system_instruction = """
-    You are Bharat Explorer, an enthusiastic and knowledgeable AI assistant specializing in Indian culture, art, and tourism. 
-    
-    Your expertise includes:
-    - Indian cultural traditions, customs, and heritage
-    - Classical and folk art forms, dance, and music
-    - Festivals and celebrations across different regions
-    - Historical monuments, temples, and tourist destinations
-    - Regional cuisines and culinary traditions
-    - Traditional crafts and handicrafts
-    - Ancient philosophies and spiritual practices
-    
-    Always provide:
-    - Detailed, accurate, and engaging responses
-    - Cultural context and historical background
-    - Practical travel tips when relevant
-    - Respectful and culturally sensitive information
-    - Regional variations and diversity within India
-    
-    Use emojis appropriately to make responses more engaging and maintain a warm, conversational tone.
-    """
-    model = genai.GenerativeModel(
-        model_name="gemini-1.5-flash",
-        system_instruction=system_instruction
-    )
-
     # Initialize chat session and history
     if 'chat_history' not in st.session_state:
         st.session_state['chat_history'] = []
     if 'gemini_chat' not in st.session_state:
+        # Sessions only open a chat handle; the model itself is shared by the whole process
+        model = get_gemini_model(GEMINI_MODEL_NAME, BHARAT_SYSTEM_INSTRUCTION, api_key)
         st.session_state['gemini_chat'] = model.start_chat(history=[])
     
     # Suggested questions
@@ -319,27 +455,66 @@ def bharat_explorer():
             "timestamp": timestamp
         })
         
-        # Show typing indicator
-        with st.spinner("🤖 Bharat Explorer is thinking..."):
-            try:
-                # Get response from Gemini with streaming
-                response = st.session_state['gemini_chat'].send_message(user_input, stream=True)
+        # Lookups the app already holds are answered from its own data; first-turn questions
+        # come from the shared cache when someone has asked them before
+        fact_answer = get_fact_router().answer(user_input)
+        response_cache = get_response_cache(GEMINI_MODEL_NAME)
+        first_turn = len(st.session_state['chat_history']) == 1
+        cached_answer = response_cache.get(user_input) if first_turn and fact_answer is None else None
+        
+        # Show typing indicator until the first chunk arrives, then the reply as it streams
+        reply_placeholder = st.empty()
+        reply_placeholder.markdown(
+            '<div class="typing-indicator">🤖 Bharat Explorer is thinking...</div>', unsafe_allow_html=True
+        )
+        try:
+            if fact_answer is not None:
+                # Gemini still sees the exchange so follow-up questions keep their context
+                gemini_chat = st.session_state['gemini_chat']
+                gemini_chat.history = gemini_chat.history + [
+                    {'role': 'user', 'parts': [user_input]},
+                    {'role': 'model', 'parts': [fact_answer]},
+                ]
+                response_text = fact_answer
+            elif cached_answer is not None:
+                # Seed the session with the cached exchange so follow-up questions keep their context
+                model = get_gemini_model(GEMINI_MODEL_NAME, BHARAT_SYSTEM_INSTRUCTION, api_key)
+                st.session_state['gemini_chat'] = model.start_chat(history=[
+                    {'role': 'user', 'parts': [user_input]},
+                    {'role': 'model', 'parts': [cached_answer]},
+                ])
+                response_text = cached_answer
+            else:
+                # Get response from Gemini with streaming, grounded in the closest passages from our own content
+                prompt = grounded_prompt(user_input, get_passage_index().search(user_input))
+                response = st.session_state['gemini_chat'].send_message(prompt, stream=True)
                 
-                # Collect response text
                 response_text = ""
                 for chunk in response:
                     response_text += chunk.text
-                
-                # Add bot response to history
-                st.session_state['chat_history'].append({
-                    "role": "assistant", 
-                    "content": response_text, 
-                    "timestamp": datetime.now().strftime("%H:%M")
-                })
-                
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
-                st.info("💡 Please check your API key and try again.")
+                    reply_placeholder.markdown(bot_message_html(response_text + " ▌", timestamp), unsafe_allow_html=True)
+                if prompt != user_input:
+                    # The passages were for this turn only; keeping them in the session history would
+                    # resend every earlier turn's background with each new question
+                    gemini_chat = st.session_state['gemini_chat']
+                    history = list(gemini_chat.history)
+                    history[-2] = {'role': 'user', 'parts': [user_input]}
+                    gemini_chat.history = history
+                if first_turn:
+                    response_cache.put(user_input, response_text)
+            
+            # Add bot response to history; the conversation below shows it from here on
+            st.session_state['chat_history'].append({
+                "role": "assistant", 
+                "content": response_text, 
+                "timestamp": datetime.now().strftime("%H:%M")
+            })
+            reply_placeholder.empty()
+            
+        except Exception as e:
+            reply_placeholder.empty()
+            st.error(f"❌ Error: {str(e)}")
+            st.info("💡 Please check your API key and try again.")
     
     # Display chat history (newest messages first)
     if st.session_state['chat_history']:
@@ -359,14 +534,7 @@ def bharat_explorer():
                     </div>
                     """, unsafe_allow_html=True)
                 else:
-                    # Clean the bot response to avoid HTML rendering issues
-                    clean_content = message['content'].replace('<', '&lt;').replace('>', '&gt;')
-                    st.markdown(f"""
-                    <div class="bot-message">
-                        <strong>🇮🇳 Bharat Explorer</strong> <small>({message['timestamp']})</small><br><br>
-                        {clean_content}
-                    
-                    """, unsafe_allow_html=True)
+                    st.markdown(bot_message_html(message['content'], message['timestamp']), unsafe_allow_html=True)
     
     else:
         # Welcome message using Streamlit components
@@ -476,8 +644,126 @@ st.markdown("""
 
 
 
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one in-flight call;
+    the callers that arrive while it runs wait for it and share its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.collapsed = {}  # function name -> duplicate loads that were collapsed
+
+    def do(self, key, name, func):
+        counted = False
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = {'done': threading.Event()}
+                    leader = True
+                else:
+                    # A caller that retries after an interrupted leader is still one collapsed load
+                    if not counted:
+                        counted = True
+                        self.collapsed[name] = self.collapsed.get(name, 0) + 1
+                        logger.debug("Collapsed a duplicate %s load into the one in flight (%d so far)",
+                                     name, self.collapsed[name])
+                    leader = False
+            if leader:
+                break
+            call['done'].wait()
+            if 'error' in call:
+                raise call['error']
+            if 'value' in call:
+                return call['value']
+            # The leader's session was interrupted (a Streamlit rerun or stop, which are not
+            # Exceptions) before it had a result; that belongs to its session, so load again here
+        try:
+            call['value'] = func()
+            return call['value']
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['done'].set()
+
+
+@st.cache_resource
+def get_single_flight():
+    return SingleFlight()
+
+
+@st.cache_resource
+def get_swr_cache():
+    """Process-wide storage for stale_while_revalidate, kept across script reruns."""
+    return {}, threading.Lock()
+
+
+def stale_while_revalidate(ttl, on_error=None):
+    """
+    Cache a loader for ttl seconds. Once the value expires it is still served right away,
+    while a single background thread reloads it and swaps the fresh value in when done.
+    Only the very first call for a given set of arguments waits on the loader, and
+    concurrent first calls share a single load.
+    Loaders raise on failure so a background reload never replaces a good value. When the
+    first load fails, on_error(error, *args, **kwargs) supplies the value shown to the caller
+    instead; it is not cached, so the next call tries the loader again.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache, lock = get_swr_cache()
+            key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+
+            def refresh():
+                try:
+                    value = func(*args, **kwargs)
+                    with lock:
+                        cache[key] = {'value': value, 'loaded_at': time.monotonic(), 'refreshing': False}
+                except Exception:
+                    # Keep serving the stale value; the next expired read will retry
+                    with lock:
+                        cache[key]['refreshing'] = False
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and not entry['refreshing'] and time.monotonic() - entry['loaded_at'] > ttl:
+                    entry['refreshing'] = True
+                    threading.Thread(target=refresh, name=f"swr-{func.__name__}", daemon=True).start()
+            if entry is None:
+                try:
+                    value = get_single_flight().do(key, func.__qualname__, lambda: func(*args, **kwargs))
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    return on_error(e, *args, **kwargs)
+                with lock:
+                    cache[key] = {'value': value, 'loaded_at': time.monotonic(), 'refreshing': False}
+            else:
+                value = entry['value']
+            # Callers add columns to the frames they get back, so never hand out the cached object
+            return copy.deepcopy(value)
+
+        def clear():
+            cache, lock = get_swr_cache()
+            with lock:
+                for key in [key for key in cache if key[:2] == (func.__module__, func.__qualname__)]:
+                    del cache[key]
+
+        wrapper.clear = clear
+        return wrapper
+    return decorator
+
+
 # Function to load and cache data
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_tourism_data():
     data = {
         'State/UT': ['Tamil Nadu', 'Maharashtra', 'Uttar Pradesh', 'Delhi', 'Rajasthan', 
@@ -495,7 +781,7 @@ def load_tourism_data():
     }
     return pd.DataFrame(data)
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_domestic_tourism_data():
     data = {
         'State/UT': ['Uttar Pradesh', 'Tamil Nadu', 'Karnataka', 'Andhra Pradesh', 'Telangana', 
@@ -513,7 +799,7 @@ def load_domestic_tourism_data():
     }
     return pd.DataFrame(data)
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_monuments_data():
     data = {
         'State/UT': ['Uttar Pradesh', 'Karnataka', 'Tamil Nadu', 'Maharashtra', 'Madhya Pradesh', 
@@ -527,7 +813,7 @@ def load_monuments_data():
     }
     return pd.DataFrame(data)
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_cultural_funding_data():
     data = {
         'Scheme': ['Archaeological Survey of India', 'Museums', 'Archives and Records', 
@@ -541,7 +827,7 @@ def load_cultural_funding_data():
     return pd.DataFrame(data)
 
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_arts_data():
     data = {
         'Art_Form': [
@@ -603,7 +889,7 @@ def load_arts_data():
     }
     return pd.DataFrame(data)
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_crafts_data():
     data = {
         'Craft': [
@@ -649,7 +935,7 @@ def load_crafts_data():
     }
     return pd.DataFrame(data)
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_heritage_site_data():
     data = {
         'Site': ['Cellular Jail', 'Tirupati Temple', 'Tawang Monastery', 'Kamakhya Temple', 'Mahabodhi Temple',
@@ -711,7 +997,7 @@ def load_heritage_site_data():
     }
     return pd.DataFrame(data)
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_seasonal_tourism_data():
     data = {
         'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
@@ -724,7 +1010,7 @@ def load_seasonal_tourism_data():
     df = df.melt(id_vars=['Month'], var_name='Region', value_name='Tourism_Index')
     return df
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_cultural_events_data():
     data = {
         'Event': [
@@ -781,7 +1067,7 @@ def load_cultural_events_data():
     return pd.DataFrame(data)
 
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_handicraft_export_data():
     data = {
         'Year': [2017, 2018, 2019, 2020, 2021, 2022, 2023],
@@ -798,7 +1084,7 @@ def load_handicraft_export_data():
     df['Total'] = df.iloc[:, 1:].sum(axis=1)
     return df
 
-@st.cache_data(ttl=3600)
+@stale_while_revalidate(ttl=3600)
 def load_responsible_tourism_data():
     data = {
         'State': ['Kerala', 'Rajasthan', 'Himachal Pradesh', 'Uttarakhand', 'Karnataka', 
@@ -813,131 +1099,1956 @@ def load_responsible_tourism_data():
 
 
 
-@st.cache_data(ttl=3600)
-def load_csv_data():
-    try:
-        # Connect to Snowflake using secrets.toml
-        conn = snowflake.connector.connect(
-            user=st.secrets["snowflake"]["user"],
-            password=st.secrets["snowflake"]["password"],
-            account=st.secrets["snowflake"]["account"],
-            warehouse=st.secrets["snowflake"]["warehouse"],
-            database=st.secrets["snowflake"]["database"],
-            schema=st.secrets["snowflake"]["schema"]
-        )
-        
-        cursor = conn.cursor()
-
-        # Query for RS_Session_258_AU_1095_1 (Tourism Visitors Data)
-        query_visitors = """
+# Warehouse tables the pages read, keyed by the name the pages use
+WAREHOUSE_QUERIES = {
+    # RS_Session_258_AU_1095_1 (Tourism Visitors Data)
+    'visitors': """
         SELECT SL_NO, STATE_UT, "DTVS_2019", "FTVS_2019", "DTVS_2020", "FTVS_2020", "DTVS_2021", "FTVS_2021"
         FROM TOURIST_VISITS
-        """
-        cursor.execute(query_visitors)
-        visitors_df = pd.DataFrame.from_records(
-            cursor.fetchall(),
-            columns=[desc[0] for desc in cursor.description]
-        ).rename(columns={
-            'STATE_UT': 'State/UT',
-            'DTVS_2019': '2019 - DTVs',
-            'FTVS_2019': '2019 - FTVs',
-            'DTVS_2020': '2020 - DTVs',
-            'FTVS_2020': '2020 - FTVs',
-            'DTVS_2021': '2021 - DTVs',
-            'FTVS_2021': '2021 - FTVs'
-        })
-
-        # Query for RS_Session_258_AU_1773_1 (Monuments Data)
-        query_monuments = """
+        """,
+    # RS_Session_258_AU_1773_1 (Monuments Data)
+    'monuments': """
         SELECT SL_NO, STATE_UT, NOS_OF_MONUMENTS
         FROM MONUMENTS
-        """
-        cursor.execute(query_monuments)
-        monuments_df = pd.DataFrame.from_records(
-            cursor.fetchall(),
-            columns=[desc[0] for desc in cursor.description]
-        ).rename(columns={'STATE_UT': 'State/UT', 'NOS_OF_MONUMENTS': 'No_of_Monuments'})
-
-        # Query for RS_Session_259_AU_2079_1 (GI State Data)
-        query_gi_state = """
+        """,
+    # RS_Session_259_AU_2079_1 (GI State Data)
+    'gi_state': """
         SELECT SL_NO, STATE_UT, "YEAR_2014_2015", "YEAR_2015_2016", "YEAR_2016_2017", "YEAR_2017_2018", 
                "YEAR_2018_2019", "YEAR_2019_2020", "YEAR_2020_2021", "YEAR_2021_2022", "YEAR_2022_2023", TOTAL
         FROM HERITAGE_SITES
-        """
-        cursor.execute(query_gi_state)
-        gi_state_df = pd.DataFrame.from_records(
-            cursor.fetchall(),
-            columns=[desc[0] for desc in cursor.description]
-        ).rename(columns={'STATE_UT': 'State/UT',
-                            'TOTAL': 'Total'})
-
-        # Query for RS_Session_259_AU_1971_A (GI Year Data)
-        query_gi_year = """
+        """,
+    # RS_Session_259_AU_1971_A (GI Year Data)
+    'gi_year': """
         SELECT YEAR, NO_OF_GI_APPLICATIONS NUMBER
         FROM GI_APPLICATIONS
-        """
-        cursor.execute(query_gi_year)
-        gi_year_df = pd.DataFrame.from_records(
-            cursor.fetchall(),
-            columns=[desc[0] for desc in cursor.description]
-        )
-
-        # Query for RS_Session_256_AU_173_A_and_B (Budget Data)
-        query_budget = """
+        """,
+    # RS_Session_256_AU_173_A_and_B (Budget Data)
+    'budget': """
         SELECT SL_NO, YEAR, ALLOCATION, EXPENDITURE
         FROM BUDGET
-        """
-        cursor.execute(query_budget)
-        budget_df = pd.DataFrame.from_records(
-            cursor.fetchall(),
-            columns=[desc[0] for desc in cursor.description]
-        ).rename(columns={
-            'YEAR': 'Year',
-            'ALLOCATION': 'Allocation',
-            'EXPENDITURE': 'Expenditure'
-        })
-
-        # Query for asi_monuments_visitors (ASI Visitors Data)
-        query_asi_visitors = """
+        """,
+    # asi_monuments_visitors (ASI Visitors Data)
+    'asi_visitors': """
         SELECT YEAR,NO_OF_TICKETED_MONUMENTS,DOMESTIC_VISITORS,
                 FOREIGN_VISITORS,TOTAL_VISITORS,GROWTH_RATE_DOMESTIC,
                 GROWTH_RATE_FOREIGN,GROWTH_RATE_TOTAL
         FROM ASI_VISITORS
-        """
-        cursor.execute(query_asi_visitors)
-        asi_visitors_df = pd.DataFrame.from_records(
-            cursor.fetchall(),
-            columns=[desc[0] for desc in cursor.description]
+        """,
+}
+
+WAREHOUSE_RENAMES = {
+    'visitors': {
+        'STATE_UT': 'State/UT',
+        'DTVS_2019': '2019 - DTVs',
+        'FTVS_2019': '2019 - FTVs',
+        'DTVS_2020': '2020 - DTVs',
+        'FTVS_2020': '2020 - FTVs',
+        'DTVS_2021': '2021 - DTVs',
+        'FTVS_2021': '2021 - FTVs'
+    },
+    'monuments': {'STATE_UT': 'State/UT', 'NOS_OF_MONUMENTS': 'No_of_Monuments'},
+    'gi_state': {'STATE_UT': 'State/UT', 'TOTAL': 'Total'},
+    'budget': {
+        'YEAR': 'Year',
+        'ALLOCATION': 'Allocation',
+        'EXPENDITURE': 'Expenditure'
+    },
+}
+
+
+def normalize_asi_visitors_columns(table):
+    # Normalize column names for the ASI visitors table
+    columns = [re.sub(r'\s+', ' ', col.strip()) for col in table.column_names]
+    
+    # Check for 'Year' column and map possible variations
+    possible_year_columns = [col for col in columns if col.lower() in ['year', 'fiscal year', 'period']]
+    # Check for visitor columns
+    possible_domestic_cols = [col for col in columns if 'domestic' in col.lower()]
+    possible_foreign_cols = [col for col in columns if 'foreign' in col.lower()]
+    
+    renames = {}
+    if possible_year_columns:
+        renames[possible_year_columns[0]] = 'Year'
+    if possible_domestic_cols:
+        renames[possible_domestic_cols[0]] = 'Number of Visitors - Domestic'
+    if possible_foreign_cols:
+        renames[possible_foreign_cols[0]] = 'Number of Visitors - Foreign'
+    table = table.rename_columns([renames.get(col, col) for col in columns])
+    
+    if not possible_year_columns:
+        st.warning("No 'Year' column found in asi_monuments_visitors.csv. Skipping ASI visitors plot.")
+        table = table.append_column('Year', pa.nulls(table.num_rows))  # Empty column to prevent errors
+    return table
+
+
+def cast_decimal_columns(table):
+    """Snowflake NUMBER(p, s) columns arrive as Arrow decimals; chart them as float64."""
+    schema = pa.schema([
+        pa.field(field.name, pa.float64()) if pa.types.is_decimal(field.type) else field
+        for field in table.schema
+    ])
+    return table.cast(schema)
+
+
+def fetch_arrow_table(cursor):
+    """Fetch a result set as an Arrow table, column by column rather than row by row."""
+    if hasattr(cursor, 'fetch_arrow_all'):
+        return cursor.fetch_arrow_all(force_return_table=True)
+    # DB-API cursors without an Arrow result path (e.g. the local SQLite backend)
+    rows = cursor.fetchall()
+    return pa.table({
+        desc[0]: pa.array([row[i] for row in rows])
+        for i, desc in enumerate(cursor.description)
+    })
+
+
+def execute_arrow(conn, sql, params=None):
+    """Run one statement on its own cursor and return the raw Arrow table."""
+    cursor = conn.cursor()
+    try:
+        if params is None:
+            cursor.execute(sql)
+        else:
+            cursor.execute(sql, params)
+        return fetch_arrow_table(cursor)
+    finally:
+        cursor.close()
+
+
+def run_warehouse_query(conn, name, where="", params=None):
+    """Run one table query on its own cursor and return the raw Arrow table."""
+    if params is None:
+        return execute_arrow(conn, WAREHOUSE_QUERIES[name])
+    return execute_arrow(conn, WAREHOUSE_QUERIES[name] + where, params)
+
+
+def prepare_warehouse_table(name, table):
+    """Apply the renames and dtype handling on the Arrow table."""
+    renames = WAREHOUSE_RENAMES.get(name, {})
+    table = table.rename_columns([renames.get(col, col) for col in table.column_names])
+    if name == 'asi_visitors':
+        table = normalize_asi_visitors_columns(table)
+    return cast_decimal_columns(table)
+
+
+def fetch_warehouse_tables(conn, names):
+    """
+    Send the table queries together, one cursor per query on a shared connection,
+    and finish each Arrow table as its result arrives.
+    """
+    frames = {}
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        futures = {executor.submit(run_warehouse_query, conn, name): name for name in names}
+        for future in as_completed(futures):
+            name = futures[future]
+            frames[name] = prepare_warehouse_table(name, future.result())
+    return frames
+
+
+# Snowflake error codes for a session that has expired or been dropped server-side
+SESSION_EXPIRED_ERRNOS = {390111, 390112, 390114}
+
+# Table layout of the local warehouse backend (same names and columns as Snowflake)
+LOCAL_WAREHOUSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS TOURIST_VISITS (SL_NO INTEGER, STATE_UT TEXT, DTVS_2019 REAL, FTVS_2019 REAL,
+    DTVS_2020 REAL, FTVS_2020 REAL, DTVS_2021 REAL, FTVS_2021 REAL);
+CREATE TABLE IF NOT EXISTS MONUMENTS (SL_NO INTEGER, STATE_UT TEXT, NOS_OF_MONUMENTS INTEGER);
+CREATE TABLE IF NOT EXISTS HERITAGE_SITES (SL_NO INTEGER, STATE_UT TEXT, YEAR_2014_2015 INTEGER,
+    YEAR_2015_2016 INTEGER, YEAR_2016_2017 INTEGER, YEAR_2017_2018 INTEGER, YEAR_2018_2019 INTEGER,
+    YEAR_2019_2020 INTEGER, YEAR_2020_2021 INTEGER, YEAR_2021_2022 INTEGER, YEAR_2022_2023 INTEGER, TOTAL INTEGER);
+CREATE TABLE IF NOT EXISTS GI_APPLICATIONS (YEAR TEXT, NO_OF_GI_APPLICATIONS INTEGER);
+CREATE TABLE IF NOT EXISTS BUDGET (SL_NO INTEGER, YEAR TEXT, ALLOCATION REAL, EXPENDITURE REAL);
+CREATE TABLE IF NOT EXISTS ASI_VISITORS (YEAR TEXT, NO_OF_TICKETED_MONUMENTS INTEGER, DOMESTIC_VISITORS REAL,
+    FOREIGN_VISITORS REAL, TOTAL_VISITORS REAL, GROWTH_RATE_DOMESTIC REAL, GROWTH_RATE_FOREIGN REAL,
+    GROWTH_RATE_TOTAL REAL);
+"""
+
+
+def get_secrets_section(section):
+    """An optional secrets section as a dict; empty when there is no secrets.toml or no such section."""
+    # Reading st.secrets without a secrets file shows an st.error before raising, so check for one quietly first
+    if not st.secrets.load_if_toml_exists():
+        return {}
+    try:
+        return dict(st.secrets.get(section, {}))
+    except Exception:
+        return {}
+
+
+def get_snowflake_setting(key, default=None):
+    """Read an optional key from the [snowflake] secrets section."""
+    return get_secrets_section("snowflake").get(key, default)
+
+
+class SqliteHashAgg:
+    """Order-independent row checksum, standing in for Snowflake's HASH_AGG in SQLite."""
+
+    def __init__(self):
+        self.total = 0
+
+    def step(self, *values):
+        digest = hashlib.blake2b(repr(values).encode("utf-8"), digest_size=8).digest()
+        self.total = (self.total + int.from_bytes(digest, "big")) % 2 ** 64
+
+    def finalize(self):
+        # SQLite integers are signed 64-bit
+        return self.total - 2 ** 64 if self.total >= 2 ** 63 else self.total
+
+
+class WarehouseBackend(ABC):
+    """
+    The database the six warehouse table queries run against.
+    Backends hand out DB-API connections and say how to write a named bind variable.
+    """
+
+    name = None
+
+    @abstractmethod
+    def connect(self):
+        """A new DB-API connection to the warehouse."""
+
+    @abstractmethod
+    def placeholder(self, name):
+        """The bind variable syntax for a named parameter in this backend's SQL."""
+
+
+class SnowflakeBackend(WarehouseBackend):
+    name = "snowflake"
+
+    def connect(self):
+        # Connect to Snowflake using secrets.toml
+        return snowflake.connector.connect(
+            user=st.secrets["snowflake"]["user"],
+            password=st.secrets["snowflake"]["password"],
+            account=st.secrets["snowflake"]["account"],
+            warehouse=st.secrets["snowflake"]["warehouse"],
+            database=st.secrets["snowflake"]["database"],
+            schema=st.secrets["snowflake"]["schema"],
+            client_session_keep_alive=True
         )
 
-        # Close cursor and connection
+    def placeholder(self, name):
+        return f"%({name})s"
+
+
+class LocalBackend(WarehouseBackend):
+    """
+    An in-process SQLite copy of the warehouse, seeded from the <TABLE>.csv files in data_dir.
+    Lets the data pages run, be benchmarked and load-tested without Snowflake credentials.
+    """
+
+    name = "local"
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+
+    def _seed(self, conn):
+        for table in re.findall(r"CREATE TABLE IF NOT EXISTS (\w+)", LOCAL_WAREHOUSE_SCHEMA):
+            path = os.path.join(self.data_dir, f"{table}.csv")
+            if not os.path.exists(path):
+                continue
+            with open(path, newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                columns = next(reader, None)
+                if not columns:
+                    continue
+                rows = [[value if value != "" else None for value in row] for row in reader]
+            conn.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                rows
+            )
+        conn.commit()
+
+    def connect(self):
+        conn = sqlite3.connect("file:local_warehouse?mode=memory&cache=shared", uri=True, check_same_thread=False)
+        conn.create_aggregate("HASH_AGG", -1, SqliteHashAgg)
+        with self._lock:
+            # The shared in-memory database lives as long as one connection to it is open
+            is_new = conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0
+            conn.executescript(LOCAL_WAREHOUSE_SCHEMA)
+            if is_new:
+                self._seed(conn)
+        return conn
+
+    def placeholder(self, name):
+        return f":{name}"
+
+
+@st.cache_resource
+def get_warehouse_backend():
+    """Pick the backend from WAREHOUSE_BACKEND or [warehouse] backend in secrets; Snowflake by default."""
+    settings = get_secrets_section("warehouse")
+    name = os.environ.get("WAREHOUSE_BACKEND") or settings.get("backend", "snowflake")
+    if name.lower() == "local":
+        default_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "warehouse")
+        return LocalBackend(settings.get("local_data_dir", default_dir))
+    return SnowflakeBackend()
+
+
+def is_session_expired(error):
+    return getattr(error, 'errno', None) in SESSION_EXPIRED_ERRNOS
+
+
+class WarehouseConnectionPool:
+    """
+    A fixed-size pool of warehouse connections shared by every loader in the process.
+    Idle connections are health-checked before reuse and replaced when their session has expired.
+    """
+
+    def __init__(self, backend, size=4, keepalive_seconds=900):
+        self.backend = backend
+        self.size = size
+        self.keepalive_seconds = keepalive_seconds
+        self._idle = []  # (connection, last_used) pairs, most recently used last
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _is_healthy(self, conn):
+        is_closed = getattr(conn, 'is_closed', None)
+        if callable(is_closed) and is_closed():
+            return False
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _checkout(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            # Only ping connections that sat idle past the keepalive window
+            if time.monotonic() - last_used < self.keepalive_seconds or self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+        return self.backend.connect()
+
+    def _checkin(self, conn):
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; it goes back to the pool unless its session expired."""
+        self._slots.acquire()
+        conn = None
+        try:
+            conn = self._checkout()
+            yield conn
+        except Exception as e:
+            if conn is not None and is_session_expired(e):
+                self._discard(conn)
+                conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._checkin(conn)
+            self._slots.release()
+
+    def run(self, func):
+        """Call func(conn) on a pooled connection, reconnecting once if the session has expired."""
+        try:
+            with self.connection() as conn:
+                return func(conn)
+        except Exception as e:
+            if not is_session_expired(e):
+                raise
+        with self.connection() as conn:
+            return func(conn)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
+
+@st.cache_resource
+def get_warehouse_pool():
+    """Process-wide connection pool over the configured warehouse backend."""
+    return WarehouseConnectionPool(
+        get_warehouse_backend(),
+        size=int(get_snowflake_setting("pool_size", 4)),
+        keepalive_seconds=float(get_snowflake_setting("pool_keepalive_seconds", 900))
+    )
+
+
+def write_atomic(path, data):
+    """Write bytes to path through a temporary file, so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class SnapshotStore:
+    """
+    On-disk Parquet snapshots of the warehouse tables: one file per table and a
+    manifest.json recording when each was fetched and the SHA-256 of its file.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self._lock = threading.Lock()
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def entry(self, name):
+        with self._lock:
+            return self._read_manifest().get(name)
+
+    def read(self, name):
+        """Return (table, manifest entry) for the last good snapshot, or None if missing or corrupt."""
+        entry = self.entry(name)
+        if entry is None:
+            return None
+        try:
+            with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            return None
+        return pq.read_table(BytesIO(data)), entry
+
+    def write(self, name, table, **metadata):
+        buffer = BytesIO()
+        pq.write_table(table, buffer)
+        data = buffer.getvalue()
+        file_name = f"{name}.parquet"
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            write_atomic(os.path.join(self.directory, file_name), data)
+            manifest = self._read_manifest()
+            manifest[name] = {
+                "file": file_name,
+                "fetched_at": time.time(),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "rows": table.num_rows,
+                **metadata
+            }
+            write_atomic(self.manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+
+
+@st.cache_resource
+def get_snapshot_store():
+    # Snapshots are kept per backend so local runs never stand in for Snowflake data
+    snapshot_dir = get_snowflake_setting(
+        "snapshot_dir", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "snapshots")
+    )
+    return SnapshotStore(os.path.join(snapshot_dir, get_warehouse_backend().name))
+
+
+# Append-only tables that can be refreshed past a high-watermark instead of re-read in full:
+# warehouse table, key column, key column in the prepared frame, and the columns the checksum covers
+INCREMENTAL_TABLES = {
+    'asi_visitors': ('ASI_VISITORS', 'YEAR', 'Year',
+                     'YEAR, NO_OF_TICKETED_MONUMENTS, DOMESTIC_VISITORS, FOREIGN_VISITORS, TOTAL_VISITORS, '
+                     'GROWTH_RATE_DOMESTIC, GROWTH_RATE_FOREIGN, GROWTH_RATE_TOTAL'),
+    'gi_year': ('GI_APPLICATIONS', 'YEAR', 'YEAR', 'YEAR, NO_OF_GI_APPLICATIONS'),
+    'budget': ('BUDGET', 'SL_NO', 'SL_NO', 'SL_NO, YEAR, ALLOCATION, EXPENDITURE'),
+}
+
+
+def query_checksum(conn, backend, name, watermark):
+    """Row count and HASH_AGG of every row at or below the watermark."""
+    table, key, _, columns = INCREMENTAL_TABLES[name]
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            f"SELECT COUNT(*), HASH_AGG({columns}) FROM {table} WHERE {key} <= {backend.placeholder('last')}",
+            {'last': watermark}
+        )
+        count, checksum = cursor.fetchone()
+        return [int(count), None if checksum is None else int(checksum)]
+    finally:
         cursor.close()
-        conn.close()
 
-        # Normalize column names for asi_visitors_df
-        asi_visitors_df.columns = asi_visitors_df.columns.str.strip().str.replace('\s+', ' ', regex=True)
-        
-        # Check for 'Year' column and map possible variations
-        possible_year_columns = [col for col in asi_visitors_df.columns if col.lower() in ['year', 'fiscal year', 'period']]
-        if possible_year_columns:
-            asi_visitors_df = asi_visitors_df.rename(columns={possible_year_columns[0]: 'Year'})
+
+def watermark_metadata(conn, backend, name, table):
+    """High-watermark and checksum to store alongside an append-only table's snapshot."""
+    if name not in INCREMENTAL_TABLES or table.num_rows == 0:
+        return {}
+    watermark = pc.max(table[INCREMENTAL_TABLES[name][2]]).as_py()
+    if watermark is None:
+        return {}
+    return {"watermark": watermark, "checksum": query_checksum(conn, backend, name, watermark)}
+
+
+def refresh_incrementally(conn, backend, name, snapshot):
+    """
+    Fetch only the rows past the snapshot's watermark and append them to it.
+    Returns None when the earlier rows changed (or there is no watermark) and a full reload is needed.
+    """
+    if snapshot is None or "watermark" not in snapshot[1]:
+        return None
+    old_table, entry = snapshot
+    if query_checksum(conn, backend, name, entry["watermark"]) != entry["checksum"]:
+        return None
+    key = INCREMENTAL_TABLES[name][1]
+    new_rows = prepare_warehouse_table(name, run_warehouse_query(
+        conn, name, f" WHERE {key} > {backend.placeholder('last')}", {'last': entry["watermark"]}
+    ))
+    if new_rows.num_rows == 0:
+        return old_table
+    return pa.concat_tables([old_table, new_rows], promote_options="permissive")
+
+
+def refresh_tables(conn, backend, store, names, snapshots):
+    """Refresh stale tables into the snapshot store, incrementally where a watermark allows it."""
+    tables = {}
+    full_reload = []
+    incremental = get_snowflake_setting("incremental_refresh", True)
+    for name in names:
+        table = None
+        if incremental and name in INCREMENTAL_TABLES:
+            table = refresh_incrementally(conn, backend, name, snapshots[name])
+        if table is None:
+            full_reload.append(name)
         else:
-            st.warning("No 'Year' column found in asi_monuments_visitors.csv. Skipping ASI visitors plot.")
-            asi_visitors_df['Year'] = pd.Series(dtype='object')  # Empty column to prevent errors
-        
-        # Check for visitor columns
-        possible_domestic_cols = [col for col in asi_visitors_df.columns if 'domestic' in col.lower()]
-        possible_foreign_cols = [col for col in asi_visitors_df.columns if 'foreign' in col.lower()]
-        
-        if possible_domestic_cols:
-            asi_visitors_df = asi_visitors_df.rename(columns={possible_domestic_cols[0]: 'Number of Visitors - Domestic'})
-        if possible_foreign_cols:
-            asi_visitors_df = asi_visitors_df.rename(columns={possible_foreign_cols[0]: 'Number of Visitors - Foreign'})
-        
-        return visitors_df, monuments_df, gi_state_df, gi_year_df, budget_df, asi_visitors_df
-    except Exception as e:
-        st.error(f"Error loading CSV data: {e}")
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+            tables[name] = table
+    if full_reload:
+        tables.update(fetch_warehouse_tables(conn, full_reload))
+    for name, table in tables.items():
+        store.write(name, table, **watermark_metadata(conn, backend, name, table))
+    return tables
+
+
+def load_tables(names):
+    """
+    Serve warehouse tables from the Parquet snapshot tier, querying the warehouse only
+    for tables whose snapshot is missing or older than snapshot_max_age_seconds.
+    If the warehouse fails, the last good snapshot is served instead; with no snapshot
+    to serve, the warehouse error is raised.
+    """
+    store = get_snapshot_store()
+    max_age = float(get_snowflake_setting("snapshot_max_age_seconds", 3600))
+    tables = {}
+    snapshots = {}
+    for name in names:
+        snapshot = store.read(name)
+        if snapshot is not None and time.time() - snapshot[1]["fetched_at"] <= max_age:
+            tables[name] = snapshot[0]
+        else:
+            snapshots[name] = snapshot
+
+    stale = list(snapshots)
+    if stale:
+        try:
+            pool = get_warehouse_pool()
+            tables.update(pool.run(lambda conn: refresh_tables(conn, pool.backend, store, stale, snapshots)))
+        except Exception:
+            if any(snapshots[name] is None for name in stale):
+                # Nothing to fall back on; the loader's caller decides how to show the failure
+                raise
+            for name in stale:
+                table, entry = snapshots[name]
+                tables[name] = table
+                st.warning(f"Warehouse unavailable; showing {name} data saved "
+                           f"{datetime.fromtimestamp(entry['fetched_at']).strftime('%Y-%m-%d %H:%M')}.")
+
+    return {name: tables[name].to_pandas() if name in tables else pd.DataFrame() for name in names}
+
+
+def warehouse_error_frame(error, name, *args, **kwargs):
+    """First-load fallback for the warehouse loaders: report the error and chart nothing."""
+    if isinstance(error, ValueError):
+        # A column or filter the query layer rejected is a bug in the page, not an outage
+        raise error
+    st.error(f"Error loading {name} data: {error}")
+    return pd.DataFrame()
+
+
+@stale_while_revalidate(ttl=3600, on_error=warehouse_error_frame)
+def load_warehouse_table(name):
+    return load_tables([name])[name]
+
+
+# Tables the query layer can filter and rank in the warehouse:
+# (table, state column, year column, selectable columns)
+QUERYABLE_TABLES = {
+    'visitors': ('TOURIST_VISITS', 'STATE_UT', None,
+                 ('SL_NO', 'STATE_UT', 'DTVS_2019', 'FTVS_2019', 'DTVS_2020', 'FTVS_2020', 'DTVS_2021', 'FTVS_2021')),
+    'monuments': ('MONUMENTS', 'STATE_UT', None, ('SL_NO', 'STATE_UT', 'NOS_OF_MONUMENTS')),
+    'gi_state': ('HERITAGE_SITES', 'STATE_UT', None,
+                 ('SL_NO', 'STATE_UT', 'YEAR_2014_2015', 'YEAR_2015_2016', 'YEAR_2016_2017', 'YEAR_2017_2018',
+                  'YEAR_2018_2019', 'YEAR_2019_2020', 'YEAR_2020_2021', 'YEAR_2021_2022', 'YEAR_2022_2023', 'TOTAL')),
+    'budget': ('BUDGET', None, 'YEAR', ('SL_NO', 'YEAR', 'ALLOCATION', 'EXPENDITURE')),
+    'asi_visitors': ('ASI_VISITORS', None, 'YEAR',
+                     ('YEAR', 'NO_OF_TICKETED_MONUMENTS', 'DOMESTIC_VISITORS', 'FOREIGN_VISITORS', 'TOTAL_VISITORS',
+                      'GROWTH_RATE_DOMESTIC', 'GROWTH_RATE_FOREIGN', 'GROWTH_RATE_TOTAL')),
+}
+
+
+def compile_table_query(backend, name, columns=(), state=None, year_range=None, order_by=None, top_n=None):
+    """
+    Compile a table request into SQL plus bind variables. Column names can't be bound,
+    so they are checked against QUERYABLE_TABLES; every value goes in as a bind variable.
+    """
+    table, state_column, year_column, selectable = QUERYABLE_TABLES[name]
+    columns = tuple(columns) or selectable
+    for column in columns + ((order_by,) if order_by else ()):
+        if column not in selectable:
+            raise ValueError(f"Column '{column}' is not queryable on {name}")
+    if state is not None and state_column is None:
+        raise ValueError(f"{name} has no state column to filter on")
+    if year_range is not None and year_column is None:
+        raise ValueError(f"{name} has no year column to filter on")
+
+    sql = f"SELECT {', '.join(columns)} FROM {table}"
+    conditions = []
+    params = {}
+    if state is not None:
+        conditions.append(f"{state_column} = {backend.placeholder('state')}")
+        params['state'] = state
+    if year_range is not None:
+        conditions.append(f"{year_column} BETWEEN {backend.placeholder('year_from')} "
+                          f"AND {backend.placeholder('year_to')}")
+        params['year_from'], params['year_to'] = year_range
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    if order_by:
+        sql += f" ORDER BY {order_by} DESC NULLS LAST"
+    if top_n:
+        sql += f" LIMIT {backend.placeholder('top_n')}"
+        params['top_n'] = int(top_n)
+    return sql, params
+
+
+def filter_table_frame(name, frame, columns=(), state=None, year_range=None, order_by=None, top_n=None):
+    """Apply a table request to an already-loaded frame (the snapshot fallback for query_table)."""
+    _, state_column, year_column, selectable = QUERYABLE_TABLES[name]
+    # Map warehouse column names to the names prepare_warehouse_table gives them
+    empty = pa.table({column: pa.nulls(0) for column in selectable})
+    prepared = dict(zip(selectable, prepare_warehouse_table(name, empty).column_names))
+    if state is not None:
+        frame = frame[frame[prepared[state_column]] == state]
+    if year_range is not None:
+        years = frame[prepared[year_column]].astype(str)
+        frame = frame[(years >= str(year_range[0])) & (years <= str(year_range[1]))]
+    if order_by:
+        frame = frame.sort_values(prepared[order_by], ascending=False, na_position='last')
+    if top_n:
+        frame = frame.head(int(top_n))
+    return frame[[prepared[column] for column in (tuple(columns) or selectable)]].reset_index(drop=True)
+
+
+@stale_while_revalidate(ttl=3600, on_error=warehouse_error_frame)
+def query_table(name, columns=(), state=None, year_range=None, order_by=None, top_n=None):
+    """
+    Read only the rows and columns a chart or detail panel needs: top-N by a column,
+    a single state, or a year range, filtered and ordered in the warehouse.
+    Results are cached per parameter set, and each one is saved as its own snapshot
+    so the chart keeps its last good data while the warehouse is down.
+    """
+    store = get_snapshot_store()
+    request = (tuple(columns), state, None if year_range is None else tuple(year_range), order_by, top_n)
+    snapshot_name = f"{name}-query-{hashlib.sha256(repr(request).encode('utf-8')).hexdigest()[:16]}"
+    try:
+        pool = get_warehouse_pool()
+        sql, params = compile_table_query(pool.backend, name, columns, state, year_range, order_by, top_n)
+        table = prepare_warehouse_table(name, pool.run(lambda conn: execute_arrow(conn, sql, params)))
+    except ValueError:
+        raise
+    except Exception:
+        snapshot = store.read(snapshot_name)
+        if snapshot is None:
+            # Never answered before: filter the full table, which falls back to its own snapshot
+            frame = load_tables([name])[name]
+            return filter_table_frame(name, frame, columns, state, year_range, order_by, top_n)
+        table, entry = snapshot
+        st.warning(f"Warehouse unavailable; showing {name} data saved "
+                   f"{datetime.fromtimestamp(entry['fetched_at']).strftime('%Y-%m-%d %H:%M')}.")
+        return table.to_pandas()
+    store.write(snapshot_name, table)
+    return table.to_pandas()
+
+
+# Warehouse tables each page reads; pages not listed here never touch the warehouse
+PAGE_DATASETS = {
+    "Home": ('asi_visitors',),
+    "Traditional Art Forms": ('gi_state',),
+    "Cultural Heritage Sites": ('monuments',),
+    "Cultural Economy": ('budget',),
+}
+
+
+class PageDatasets:
+    """The warehouse tables a page declared, each loaded on first access."""
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        self._frames = {}
+
+    def __getitem__(self, name):
+        if name not in self.names:
+            raise KeyError(f"Table '{name}' is not declared for this page in PAGE_DATASETS")
+        if name not in self._frames:
+            self._frames[name] = load_warehouse_table(name)
+        return self._frames[name]
+
+
+# Renders one marker row [lat, lon, popup, tooltip, color, icon] in the browser
+MARKER_CALLBACK = """
+var callback = function (row) {
+    var icon = L.AwesomeMarkers.icon({icon: row[5], markerColor: row[4], prefix: 'fa', iconColor: 'white'});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup(row[2], {maxWidth: 300});
+    marker.bindTooltip(row[3], {sticky: true});
+    return marker;
+};
+"""
+
+
+def marker_rows(frame, title, fields, color, icon):
+    """
+    Build marker rows for a frame column by column: a bold title followed by one
+    "label: value" line per field. A field is a column name or a Series; rows where
+    its value is missing skip that line. color and icon are one value or a Series.
+    """
+    frame = frame.dropna(subset=['lat', 'lon'])
+    names = frame[title].astype(str)
+    popup = '<b>' + names + '</b><br>'
+    for label, values in fields:
+        if isinstance(values, str):
+            values = frame[values]
+        values = values.reindex(frame.index)
+        popup = popup + (label + ': ' + values.astype(str) + '<br>').where(values.notna(), '')
+    return pd.DataFrame({
+        'lat': frame['lat'].astype(float),
+        'lon': frame['lon'].astype(float),
+        'popup': popup,
+        'tooltip': names,
+        'color': color,
+        'icon': icon,
+    }, index=frame.index)
+
+
+def marker_layer(*rows):
+    """One clustered layer for all marker rows, drawn client-side instead of one folium.Marker each."""
+    data = pd.concat(rows, ignore_index=True) if rows else pd.DataFrame()
+    return FastMarkerCluster(data.values.tolist(), callback=MARKER_CALLBACK)
+
+
+class HtmlLRU:
+    """
+    Rendered HTML kept in least-recently-used order and bounded by total size in bytes;
+    adding an entry evicts the oldest ones until the cache fits again.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+            return html
+
+    def put(self, key, html):
+        size = len(html.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size -= len(self._entries.pop(key).encode("utf-8"))
+            self._entries[key] = html
+            self.size += size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.encode("utf-8"))
+
+
+@st.cache_resource
+def get_map_html_cache():
+    return HtmlLRU(max_bytes=64 * 1024 * 1024)
+
+
+def dataset_version(frame):
+    """Content hash of a frame, so cached renders are dropped when its data changes."""
+    return hashlib.sha256(pd.util.hash_pandas_object(frame, index=False).values.tobytes()).hexdigest()[:16]
+
+
+# The viewport map shows per-cell counts below this zoom or above this many visible places
+VIEWPORT_CLUSTER_ZOOM = 7
+VIEWPORT_MAX_MARKERS = 500
+MAX_MAP_ZOOM = 18
+# India, used until the browser reports the map's bounds
+DEFAULT_BOUNDS = (6.0, 68.0, 37.5, 97.5)
+
+
+def cluster_cells(rows, zoom):
+    """Aggregate rows into grid cells a quarter of a map tile wide: count and centroid per cell."""
+    cell = 360 / 2 ** zoom / 4
+    grouped = rows[['lat', 'lon']].groupby([np.floor(rows['lat'] / cell), np.floor(rows['lon'] / cell)])
+    return grouped.agg(lat=('lat', 'mean'), lon=('lon', 'mean'), count=('lat', 'size')).reset_index(drop=True)
+
+
+class PointIndex:
+    """
+    Points sorted by latitude, so a bounding box is a binary search plus a longitude mask,
+    and a cluster pyramid: cell centroids and counts for every zoom level, computed up front.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows.sort_values('lat', kind='mergesort').reset_index(drop=True)
+        self.lat = self.rows['lat'].to_numpy(dtype=float)
+        self.lon = self.rows['lon'].to_numpy(dtype=float)
+        self.levels = {zoom: cluster_cells(self.rows, zoom) for zoom in range(MAX_MAP_ZOOM + 1)}
+
+    def within(self, south, west, north, east):
+        start = np.searchsorted(self.lat, south, side='left')
+        stop = np.searchsorted(self.lat, north, side='right')
+        lon = self.lon[start:stop]
+        return self.rows.iloc[start:stop][(lon >= west) & (lon <= east)]
+
+    def clusters(self, zoom, south, west, north, east):
+        """The pyramid level for a zoom, limited to cells centred inside the box."""
+        cells = self.levels[min(max(int(zoom), 0), MAX_MAP_ZOOM)]
+        return cells[cells['lat'].between(south, north) & cells['lon'].between(west, east)]
+
+
+@st.cache_resource
+def get_point_indexes():
+    return OrderedDict(), threading.Lock()
+
+
+def point_index(map_key, build_rows):
+    """The PointIndex for a map, calling build_rows for its marker rows only when map_key is new."""
+    indexes, lock = get_point_indexes()
+    with lock:
+        if map_key not in indexes:
+            indexes[map_key] = PointIndex(build_rows())
+            if len(indexes) > 32:
+                indexes.popitem(last=False)
+        indexes.move_to_end(map_key)
+        return indexes[map_key]
+
+
+def map_view(view):
+    """Zoom and (south, west, north, east) box from what st_folium returned; India at zoom 5 until it reports."""
+    view = view or {}
+    zoom = view.get('zoom') or 5
+    bounds = view.get('bounds') or {}
+    south_west = bounds.get('_southWest') or {}
+    north_east = bounds.get('_northEast') or {}
+    box = (south_west.get('lat'), south_west.get('lng'), north_east.get('lat'), north_east.get('lng'))
+    if None in box:
+        box = DEFAULT_BOUNDS
+    return int(zoom), box
+
+
+def viewport_map(map_key, build_rows, key, height=600):
+    """
+    A map that sends the browser only what is on screen: the marker rows inside the
+    bounds it last reported, or that zoom's level of the cluster pyramid when zoomed
+    out or the view is crowded.
+    The base map stays mounted; only its marker layer is replaced as the view moves.
+    """
+    # st_folium keeps its widget state under a hash of the map script, not under key,
+    # so the view it returns is kept here for the next run
+    view_key = f"{key}_view"
+    zoom, box = map_view(st.session_state.get(view_key))
+
+    index = point_index(map_key, build_rows)
+    visible = index.within(*box)
+    layer = folium.FeatureGroup(name='In view')
+    if zoom < VIEWPORT_CLUSTER_ZOOM or len(visible) > VIEWPORT_MAX_MARKERS:
+        for cell in index.clusters(zoom, *box).itertuples(index=False):
+            folium.CircleMarker(
+                location=[cell.lat, cell.lon],
+                radius=8 + 4 * np.log2(cell.count),
+                color='#764ba2', fill=True, fill_opacity=0.6,
+                tooltip=f"{cell.count} places"
+            ).add_to(layer)
+    else:
+        marker_layer(visible).add_to(layer)
+
+    m = folium.Map(location=[20.5937, 78.9629], zoom_start=5, tiles='cartodbpositron')
+    view = st_folium(m, key=key, height=height, use_container_width=True,
+                     feature_group_to_add=layer, returned_objects=['bounds', 'zoom'])
+    st.session_state[view_key] = view
+    if map_view(view) != (zoom, box):
+        # The user panned or zoomed since the layer was built: redraw it for the view they now see
+        st.rerun()
+    st.caption(f"{len(visible)} of {len(index.rows)} places in view")
+
+
+def show_marker_map(map_key, count, build_rows, key, height=600):
+    """
+    Show a map of count places whose marker rows come from build_rows, which is called
+    only when map_key is not cached yet. Up to VIEWPORT_MAX_MARKERS places render as one
+    cached, clustered map; larger sets use the viewport map, which sends only the
+    precomputed cluster level for the current zoom instead of every point.
+    """
+    if count > VIEWPORT_MAX_MARKERS:
+        viewport_map(map_key, build_rows, key, height=height)
+        return
+    map_cache = get_map_html_cache()
+    map_html = map_cache.get(map_key)
+    if map_html is None:
+        m = folium.Map(location=[20.5937, 78.9629], zoom_start=5, tiles='cartodbpositron')
+        marker_layer(build_rows()).add_to(m)
+        map_html = m._repr_html_()
+        map_cache.put(map_key, map_html)
+    components.html(map_html, height=height)
+
+
+# Approximate state centroids, used to place crafts that carry only a state
+STATE_CENTROIDS = {
+    'Jammu & Kashmir': [34.0837, 74.7973],
+    'Uttar Pradesh': [26.8467, 80.9462],
+    'Rajasthan': [26.9124, 75.7873],
+    'Karnataka': [15.3173, 75.7139],
+    'Tamil Nadu': [11.1271, 78.6569],
+    'Gujarat': [23.0225, 72.5714],
+    'Punjab': [31.1471, 75.3412],
+    'West Bengal': [22.5726, 88.3639],
+    'Chhattisgarh': [21.2787, 81.8661],
+    'Madhya Pradesh': [23.2599, 77.4126]
+}
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def load_geo_entities():
+    """Every geolocated place in one frame (Name, Kind, State, lat, lon): heritage sites, art forms and crafts."""
+    heritage = load_heritage_site_data()
+    arts = load_arts_data()
+    crafts = load_crafts_data()
+    entities = pd.concat([
+        pd.DataFrame({'Name': heritage['Site'], 'Kind': 'Heritage Site', 'State': heritage['State'],
+                      'lat': heritage['lat'], 'lon': heritage['lon']}),
+        pd.DataFrame({'Name': arts['Art_Form'], 'Kind': 'Art Form', 'State': arts['Region'],
+                      'lat': arts['lat'], 'lon': arts['lon']}),
+        # Crafts sit at their state's centroid; crafts from states without one are left out
+        pd.DataFrame({'Name': crafts['Craft'], 'Kind': 'Craft', 'State': crafts['State'],
+                      'lat': crafts['State'].map(lambda x: STATE_CENTROIDS.get(x, [None, None])[0]),
+                      'lon': crafts['State'].map(lambda x: STATE_CENTROIDS.get(x, [None, None])[1])}),
+    ], ignore_index=True)
+    return entities.dropna(subset=['lat', 'lon']).reset_index(drop=True)
+
+
+class SpatialIndex:
+    """A haversine BallTree over geolocated places for radius and k-nearest queries."""
+
+    def __init__(self, entities):
+        self.entities = entities
+        self.tree = BallTree(np.radians(entities[['lat', 'lon']].to_numpy(dtype=float)), metric='haversine')
+
+    def _places(self, indices, distances):
+        places = self.entities.iloc[indices].copy()
+        places['Distance_km'] = (distances * EARTH_RADIUS_KM).round(1)
+        return places.reset_index(drop=True)
+
+    def within(self, lat, lon, radius_km):
+        indices, distances = self.tree.query_radius(
+            np.radians([[lat, lon]]), r=radius_km / EARTH_RADIUS_KM, return_distance=True, sort_results=True
+        )
+        return self._places(indices[0], distances[0])
+
+    def nearest(self, lat, lon, k=5):
+        distances, indices = self.tree.query(np.radians([[lat, lon]]), k=min(k, len(self.entities)))
+        return self._places(indices[0], distances[0])
+
+
+@st.cache_resource(max_entries=4)
+def build_spatial_index(version, _entities):
+    return SpatialIndex(_entities)
+
+
+def get_spatial_index():
+    """The spatial index for the current places, rebuilt only when their dataset version changes."""
+    entities = load_geo_entities()
+    return build_spatial_index(dataset_version(entities), entities)
+
+
+# Longest question the fact router answers; longer ones usually ask for more than one lookup
+FACT_QUESTION_MAX_WORDS = 12
+# Rows listed for "top states" questions
+FACT_TOP_N = 5
+
+
+def load_fact_frames():
+    """The frames the chatbot answers lookup questions from, keyed by name."""
+    return {
+        'monuments': load_monuments_data(),
+        'foreign': load_tourism_data(),
+        'domestic': load_domestic_tourism_data(),
+        'events': load_cultural_events_data(),
+        'sites': load_heritage_site_data(),
+        'arts': load_arts_data(),
+    }
+
+
+class FactRouter:
+    """
+    Answers entity + metric questions ("how many monuments in Karnataka", "when is
+    Hornbill Festival", "top states for foreign tourists") straight from the loaded
+    frames. answer() returns None for anything else so the question goes to Gemini.
+    """
+
+    def __init__(self, frames):
+        # Every frame is indexed by normalized name so "Jammu & Kashmir" and "Jammu and Kashmir" meet
+        def by_name(frame, column):
+            return frame.set_index(frame[column].map(normalize_question))
+        self.monuments = by_name(frames['monuments'], 'State/UT')
+        self.foreign = by_name(frames['foreign'], 'State/UT')
+        self.domestic = by_name(frames['domestic'], 'State/UT')
+        self.events = by_name(frames['events'], 'Event')
+        self.sites = by_name(frames['sites'], 'Site')
+        self.arts = by_name(frames['arts'], 'Art_Form')
+        states = set(self.monuments.index) | set(self.foreign.index) | set(self.domestic.index)
+        states |= {normalize_question(state) for frame, column in [(self.events, 'State'), (self.sites, 'State'),
+                                                                  (self.arts, 'Region')] for state in frame[column]}
+        # Longest names first so "Diwali in Varanasi" is matched before anything inside it
+        self.names = {
+            kind: sorted(names, key=len, reverse=True)
+            for kind, names in [('state', states), ('event', set(self.events.index)),
+                                ('site', set(self.sites.index)), ('art', set(self.arts.index))]
+        }
+
+    def _find(self, kind, text):
+        # Normalized names of kind mentioned in text as whole words, and text with them removed;
+        # text is normalized and padded with spaces
+        found = []
+        for name in self.names[kind]:
+            if f" {name} " in text:
+                found.append(name)
+                text = text.replace(f" {name} ", " ")
+        return found, text
+
+    @staticmethod
+    def _top_states(frame, column, label, fmt):
+        top = frame.sort_values(column, ascending=False).head(FACT_TOP_N)
+        lines = [f"{rank}. **{state}**: {fmt(value)}"
+                 for rank, (state, value) in enumerate(zip(top['State/UT'], top[column]), start=1)]
+        return f"{label}:\n\n" + "\n".join(lines)
+
+    def answer(self, question):
+        """A markdown answer built from the frames, or None when the question is not a lookup."""
+        normalized = normalize_question(question)
+        words = normalized.split()
+        if not words or len(words) > FACT_QUESTION_MAX_WORDS:
+            return None
+        # Places and events are matched before states so "Ladakh Festival" is not also the state Ladakh
+        events, remaining = self._find('event', f" {normalized} ")
+        sites, remaining = self._find('site', remaining)
+        arts, remaining = self._find('art', remaining)
+        states, _ = self._find('state', remaining)
+        entities = events + sites + arts
+        # Comparisons and multi-entity questions need more than one lookup
+        if len(states) > 1 or len(entities) > 1:
+            return None
+        text = f" {normalized} "
+        asks_top = any(f" {word} " in text for word in ("top", "most", "highest", "which state", "best"))
+
+        if events and any(f" {word} " in text for word in ("when", "what month", "which month", "date")):
+            event = self.events.loc[events[0]]
+            if event['Month'] == 'Rotational':
+                timing = "rotates between its host cities rather than falling in a fixed month"
+            else:
+                timing = f"is held in **{event['Month']}**"
+            return (f"📅 **{event['Event']}** ({event['State']}) {timing}. "
+                    f"It draws around {event['Visitors_Estimate']:,} visitors.")
+
+        if " monument " in text:
+            if states and not entities:
+                if states[0] not in self.monuments.index:
+                    return None
+                row = self.monuments.loc[states[0]]
+                return f"🏛️ **{row['State/UT']}** has **{row['No_of_Monuments']}** ASI-protected monuments."
+            if asks_top and not states and not entities:
+                return self._top_states(self.monuments, 'No_of_Monuments', "🏛️ States with the most ASI-protected monuments",
+                                        lambda value: f"{value} monuments")
+            return None
+
+        for keyword, frame, column, label, fmt in [
+            (" foreign ", self.foreign, 'FTV_2022', "Foreign Tourist Visits (2022)",
+             lambda value: f"{value:,} visits"),
+            (" domestic ", self.domestic, 'DTV_2022_millions', "Domestic Tourist Visits (2022)",
+             lambda value: f"{value:.2f} million visits"),
+        ]:
+            if keyword not in text or not any(f" {word} " in text for word in ("tourist", "tourism", "visitor", "visit", "arrival")):
+                continue
+            if states and not entities:
+                if states[0] not in frame.index:
+                    return None
+                return (f"✈️ {label} to **{frame.at[states[0], 'State/UT']}**: **{fmt(frame.at[states[0], column])}** "
+                        f"({frame.at[states[0], 'Percentage_Share_2022']}% of the national total).")
+            if asks_top and not states and not entities:
+                return self._top_states(frame, column, f"✈️ Top states by {label}", fmt)
+            return None
+
+        if " where " in text and not states:
+            if sites:
+                site = self.sites.loc[sites[0]]
+                return (f"📍 **{site['Site']}** is a {site['Type'].lower()} heritage site in **{site['State']}**, "
+                        f"drawing around {site['Visitors_Annual']:,} visitors a year.")
+            if events:
+                event = self.events.loc[events[0]]
+                return f"📍 **{event['Event']}** is celebrated in **{event['State']}**."
+            if arts:
+                art = self.arts.loc[arts[0]]
+                return f"📍 **{art['Art_Form']}** is a {art['Category'].lower()} tradition from **{art['Region']}**."
+        return None
+
+
+@st.cache_resource(max_entries=4)
+def build_fact_router(version, _frames):
+    return FactRouter(_frames)
+
+
+def get_fact_router():
+    """The fact router for the current frames, rebuilt only when their dataset versions change."""
+    frames = load_fact_frames()
+    version = tuple(dataset_version(frame) for frame in frames.values())
+    return build_fact_router(version, frames)
+
+
+# Curated descriptions and images for the painting styles on the Traditional Art Forms page
+PAINTING_INFO = {
+    'Madhubani': {
+        'description': 'Madhubani painting, also known as Mithila painting, originates from Bihar’s Mithila region. It uses geometric patterns, natural dyes, and vibrant colors to depict mythological themes and daily life.',
+        'image_url': 'https://media-cdn.tripadvisor.com/media/photo-s/1b/39/bf/a2/madhubani-painting-is.jpg'
+    },
+    'Warli': {
+        'description': 'Warli painting is a tribal art form from Maharashtra, using simple geometric shapes like circles, triangles, and squares. Painted with white pigment on a mud base, it illustrates social events and nature.',
+        'image_url': 'https://cdn.magicdecor.in/com/2024/01/17124731/Village-Life-Ancient-Indian-Warli-Art-Wallpaper-for-Wall-710x488.jpg'
+    },
+    'Kalamkari': {
+        'description': 'Kalamkari, from Andhra Pradesh, is an ancient hand-painting style on cotton or silk using a bamboo pen. Its 23-step process creates intricate designs, often depicting mythological narratives.',
+        'image_url': 'https://i.pinimg.com/736x/ad/35/65/ad35659c094db9a255bd57255da7d3a3.jpg'
+    },
+    'Tanjore': {
+        'description': 'Tanjore painting, from Thanjavur, Tamil Nadu, is a classical art form known for vibrant colors, gold foil, and inlaid gems. It typically portrays Hindu deities and religious themes.',
+        'image_url': 'https://img1.wsimg.com/isteam/ip/bd95d888-15fd-4e22-9514-3b3e7856faa7/d1fc0d4d-12eb-4019-a7aa-f00566d84891.jpg'
+    },
+    'Pattachitra': {
+        'description': 'Pattachitra, a cloth-based scroll painting from Odisha and West Bengal, features intricate details and vibrant colors, depicting Hindu mythological stories and folktales.',
+        'image_url': 'https://i0.wp.com/www.craftsodisha.com/wp-content/uploads/2019/03/p00628-141323-radha-krishna-dancing-monochrome-pattachitra-art.jpg'
+    },
+    'Gond': {
+        'description': 'Gond painting, a tribal art from Madhya Pradesh, uses intricate patterns of dots, dashes, and lines to represent nature, folklore, and tribal life in vibrant colors.',
+        'image_url': 'https://m.media-amazon.com/images/I/61Kv77ptK1L._AC_UF1000,1000_QL80_.jpg'
+    },
+    'Phad': {
+        'description': 'Phad painting is a religious scroll painting from Rajasthan, depicting folk epics and local deities on long cloth pieces, using bold colors and narrative storytelling.',
+        'image_url': 'https://www.bridgebharat.com/cdn/shop/files/BBP0002RPHD00023_533x.jpg?v=1720843220'
+    },
+    'Miniature': {
+        'description': 'Miniature painting, prominent in Rajasthan, features intricate details and delicate brushwork. Rajput and Mughal styles depict royal life, mythology, and nature.',
+        'image_url': 'https://m.media-amazon.com/images/I/61tUr+HkaoL._AC_UF1000,1000_QL80_.jpg'
+    },
+    "Pahari Painting": {
+        "description": "Pahari painting, originating from the hill states of Himachal Pradesh and Jammu, is known for its delicate, lyrical style, vibrant colors, and themes of love, mythology, and nature, often depicting Krishna and Radha.",
+        "image_url": "https://hpgeneralstudies.com/wp-content/uploads/2016/11/Pahari-Styles-of-Painting-Kangra-painting-himachal-pradesh-general-knowledge.jpg"
+    }
+}
+
+# Curated descriptions and images for the performing arts on the Traditional Art Forms page
+PERFORMING_ART_INFO = {
+    'Carnatic': {
+        'description': 'Carnatic music is a system of music commonly associated with South India, including the modern states of Karnataka, Andhra Pradesh, Telangana, Kerala and Tamil Nadu.',
+        'image_url': 'https://centerforworldmusic.org/wp-content/uploads/2021/02/Subbulakshmi-Concert.jpg'
+    },
+    'Kathakali': {
+        'description': 'Kathakali is a classical dance form from Kerala that combines dance, music, and acting. Performers use elaborate costumes, makeup, and face masks to portray characters from Hindu epics.',
+        'image_url': 'https://miro.medium.com/v2/resize:fit:1024/1*lhWHQ6Oq1gowqn_uOtlfbg.jpeg'
+    },
+    'Bharatanatyam': {
+        'description': 'Bharatanatyam is one of the oldest classical dance forms of India, originating in Tamil Nadu. It is known for its grace, purity, tenderness, and sculpturesque poses.',
+        'image_url': 'https://5.imimg.com/data5/BM/CE/WE/SELLER-92722583/bharatanatyam-arangetram-photoshoot.jpg'
+    },
+    'Kathak': {
+        'description': 'Kathak is one of the eight major forms of Indian classical dance that originated from North India. It is characterized by rhythmic footwork, rapid spins, and expressive storytelling.',
+        'image_url': 'https://i.pinimg.com/564x/8b/94/fc/8b94fc84c81c6acddddf1644db60990f.jpg'
+    },
+    'Odissi': {
+        'description': 'Odissi is a classical dance form from Odisha that emphasizes fluid movements, emotional expressions, and intricate footwork. It primarily portrays themes related to Lord Jagannath and other regional deities.',
+        'image_url': 'https://lotusarise.com/wp-content/uploads/2024/03/Odissi_Performance-632x1024.jpeg'
+    },
+    'Kuchipudi': {
+        'description': 'Kuchipudi is a classical dance form from Andhra Pradesh that involves rituals, invocations, rhythm, and expressive communication of spiritual ideas.',
+        'image_url': 'https://i.pinimg.com/1200x/6a/44/d2/6a44d248445f651f482248f39119bf78.jpg'
+    },
+    'Hindustani': {
+        'description': 'Hindustani classical music is a North Indian classical music tradition that evolved from ancient Hindu musical traditions, Vedic philosophy, and Persian influences.',
+        'image_url': 'https://blogs.lawrence.edu/news/files/2017/04/Zahir-Hussain_newsblog.jpg'
+    },
+    "Bihu": {
+        "description": "Bihu is a folk dance from Assam, performed during the Bihu festival. It is characterized by brisk steps, rapid hand movements, and vibrant costumes, celebrating the Assamese New Year and agricultural cycles.",
+        "image_url": "https://i.pinimg.com/736x/4c/88/94/4c8894faf7b15fc026f98f646436c6b2.jpg"
+    },
+    "Ghoomar": {
+        "description": "Ghoomar is a traditional folk dance from Rajasthan, performed by women in swirling skirts. It is known for its graceful movements and vibrant attire, often performed during festivals and celebrations.",
+        "image_url": "https://i.pinimg.com/736x/d9/83/4a/d9834af8475da9aa305f679dcbb6f3e5.jpg"
+    },
+    "Chhau": {
+        "description": "Chhau is a semi-classical dance form from eastern India, particularly Jharkhand, Odisha, and West Bengal. It combines martial arts, acrobatics, and storytelling, often depicting scenes from Hindu epics.",
+        "image_url": "https://photos.smugmug.com/Photography-still-life-culture/Photography-Dances-of-India-Chhau-Dance/i-qxgH7fs/0/NNnxW5vFTFPQrbZDdZfVsPTxt4dqSpH2nPc7B77Wm/XL/Kartik%201-XL.jpg"
+    },
+    "Garba": {
+        "description": "Garba is a folk dance from Gujarat, performed during the Navratri festival. It involves circular movements and rhythmic clapping, symbolizing devotion to Goddess Durga.",
+        "image_url": "https://www.livemint.com/lm-img/img/2024/10/03/600x338/2-0-305167323--ABH0216-men-0_1680607324691_1727968179214.jpg"
+    },
+    "Lavani": {
+        "description": "Lavani is a traditional folk dance from Maharashtra, known for its energetic and sensuous movements. It is often performed to the beats of the dholki and combines dance with storytelling.",
+        "image_url": "https://static.toiimg.com/photo/51616060.cms?imgsize=111336"
+    },
+    "Bodo Dance": {
+        "description": "Bodo dance is a folk dance performed by the Bodo community of Assam. It is characterized by vibrant costumes and rhythmic movements, often celebrating agricultural and cultural festivals.",
+        "image_url": "https://www.contentgarden.in/PICTURES/270123/WATERMARK/20230127002L.jpg"
+    },
+    "Sattriya": {
+        "description": "Sattriya is a classical dance form from Assam, originating in the Vaishnavite monasteries. It combines grace, spirituality, and storytelling, depicting themes from Hindu mythology.",
+        "image_url": "https://i0.wp.com/rotarynewsonline.org/wp-content/uploads/2019/07/545px-Satriya_dance_performance_at_Guwahati_Rabindra_Bhawan.jpg?ssl=1"
+    },
+    "Yakshagana": {
+        "description": "Yakshagana is a traditional theatre form from Karnataka, combining dance, music, and drama. Performers wear elaborate costumes and makeup to enact stories from Indian epics.",
+        "image_url": "https://orunewculture.com/wp-content/uploads/2025/01/yaksh.webp"
+    },
+    "Thang-Ta": {
+        "description": "Thang-Ta is a martial art dance form from Manipur, combining graceful movements with combat techniques. It is performed with swords and spears, showcasing strength and agility.",
+        "image_url": "https://cdn-images.prepp.in/public/image/5fa7ca05557ad47e2753cde27c4431ef.png?tr=w-512,h-327,c-force"
+    },
+    "Bhangra": {
+        "description": "Bhangra is a lively folk dance from Punjab, traditionally performed by men during harvest festivals. It is characterized by energetic movements, vibrant costumes, and the beat of the dhol.",
+        "image_url": "https://cdn.britannica.com/04/60404-050-77D978DF/Bhangra-folk-dance-region-Punjab-India-Pakistan.jpg"
+    },
+    "Giddha": {
+        "description": "Giddha is a folk dance performed by women in Punjab, known for its lively and expressive movements. It often involves singing traditional songs and storytelling through dance.",
+        "image_url": "https://indianetzone.wordpress.com/wp-content/uploads/2023/06/1541273538_giddha-dance1.jpg?w=1024"
+    },
+    "Cheraw": {
+        "description": "Cheraw is a traditional bamboo dance from Mizoram, performed by women. It involves rhythmic stepping between moving bamboo sticks, showcasing coordination and grace.",
+        "image_url": "https://pbs.twimg.com/media/FCnyH-YVQAQ3kOz?format=jpg&name=large"
+    },
+    "Fugdi": {
+        "description": "Fugdi is a folk dance from Goa, performed by women during festivals like Ganesh Chaturthi. It involves circular movements and singing, reflecting joy and community spirit.",
+        "image_url": "https://media.assettype.com/gomantaktimes%2F2022-11%2F69306823-68e1-4166-8eb3-698d0d1e473f%2F1.png"
+    },
+    "Dalkhai": {
+        "description": "Dalkhai is a folk dance from Odisha, performed by women during festivals. It is known for its vibrant movements and songs that narrate stories of love and nature.",
+        "image_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Sambalpuri_Dance.JPG/1200px-Sambalpuri_Dance.JPG"
+    },
+    "Tharu Folk": {
+        "description": "Tharu folk dance is performed by the Tharu community in Uttar Pradesh and Uttarakhand. It reflects their cultural heritage, with rhythmic movements celebrating agricultural life.",
+        "image_url": "https://staticimg.amarujala.com/assets/images/gaonjunction.com/2023/11/16/jhamara-lkanataya-ka-parasatata-thata-vavasha-lkashhama-va-anaya-thanpr-janajata-ka-lga_1700144716.jpeg?w=414&dpr=1.0&q=50"
+    },
+    "Santhali Dance": {
+        "description": "Santhali dance is a tribal folk dance performed by the Santhal community in Jharkhand, Odisha, and West Bengal. It is characterized by vibrant group movements and traditional music.",
+        "image_url": "https://live.staticflickr.com/7606/16147402643_4586ed4b6f_c.jpg"
+    },
+    "Rabindra Sangeet": {
+        "description": "Rabindra Sangeet refers to songs composed by Rabindranath Tagore, often accompanied by dance in West Bengal. The dance complements the soulful music, expressing poetic themes.",
+        "image_url": "https://assets.thehansindia.com/hansindia-bucket/7460_Rabindra_Sangeet.jpg"
+    },
+    "Koli Dance": {
+        "description": "Koli dance is a folk dance performed by the Koli fishing community in Maharashtra. It reflects their coastal culture with lively steps and songs about the sea.",
+        "image_url": "https://i.pinimg.com/736x/e2/08/18/e20818253fc1a887292f163b6882b904.jpg"
+    },
+    "Tusu Parab": {
+        "description": "Tusu Parab is a folk dance performed during the Tusu festival in Jharkhand and West Bengal. It involves singing and dancing to celebrate the harvest season.",
+        "image_url": "https://utsav.gov.in/public/uploads/event_picture_image/event_686/16607352252119234166.jpg"
+    }
+}
+
+# Curated descriptions and images for the crafts on the Traditional Art Forms page
+CRAFT_INFO = {
+    'Kanjivaram Silk': {
+        'description': 'Kanjivaram silk sarees are woven from pure mulberry silk and are known for their heavy body, vibrant colors, wide contrast borders, and rich pallu adorned with intricate zari work.',
+        'image_url': 'https://www.singhanias.in/cdn/shop/articles/1e31d5353b95970dd2d9f4c8a4abc755.jpg?v=1646740243'
+    },
+    'Pashmina': {
+        'description': 'Pashmina refers to a fine type of Kashmir wool and the textiles made from it. Known for its exceptional warmth, softness, and lightweight quality, it is derived from the fine undercoat fibers of the Changthangi goat.',
+        'image_url': 'https://media.istockphoto.com/id/1429359526/photo/lao-silk-scarf-at-night-market-at-lunag-prabang-with-wat-may-souvannapoumaram-in-the.jpg?s=612x612&w=0&k=20&c=ITcJxlyoupDZznv-X3qOxwBB74FASOXm5oPDSjfFyzc='
+    },
+    'Chikankari': {
+        'description': 'Chikankari is a traditional embroidery style from Lucknow, Uttar Pradesh. It involves white thread embroidery on fine white cotton fabric, creating a shadow work effect.',
+        'image_url': 'https://t3.ftcdn.net/jpg/12/14/79/94/360_F_1214799416_Jqnavj8Hc866yW3JZS1z1icxcOWs4l8B.jpg'
+    },
+    'Blue Pottery': {
+        'description': 'Blue Pottery is a traditional craft of Jaipur, Rajasthan. It is made from quartz stone powder, not clay, and is known for its vibrant blue dye and distinctive Persian patterns.',
+        'image_url': 'https://media.istockphoto.com/id/497537972/photo/chinese-style-porcelain-pottery.jpg?s=612x612&w=0&k=20&c=hr702O-4YrezRL6L4ZyotCNSMdM9jT5cwPf0EVsK2xU='
+    },
+    'Brass Work': {
+        'description': 'Brass work is a significant craft tradition in Uttar Pradesh, particularly in Moradabad, which is known as the "Brass City." Artisans create intricately designed utensils, decorative items, and religious artifacts.',
+        'image_url': 'https://www.gitagged.com/wp-content/uploads/2022/10/MBC-002-RAM-DARBHAR-BIG-2.jpg'
+    },
+    'Bidriware': {
+        'description': 'Bidriware is a metal handicraft from Bidar, Karnataka. It involves inlaying silver or gold on a blackened metal alloy of zinc and copper, creating striking contrast designs.',
+        'image_url': 'https://www.ibef.org/experienceindia/images/bidriware/bidri-image-1.png'
+    },
+    'Bandhani': {
+        'description': 'Bandhani is a tie-dye textile technique from Gujarat and Rajasthan. It involves tying portions of cloth before dyeing, resulting in intricate patterns of dots.',
+        'image_url': 'https://t3.ftcdn.net/jpg/09/49/56/84/360_F_949568481_ZVT2qxC7FmtZwOyDoBndGiVbV6ha5ZQF.jpg'
+    },
+    'Phulkari': {
+        'description': 'Phulkari is an embroidery technique from Punjab, where colorful threads are used to create floral patterns on shawls and other garments. The term means "flower work" in Punjabi.',
+        'image_url': 'https://static.fibre2fashion.com//articleresources/images/57/5630/AdobeStock_968996166-s_Small.jpg'
+    },
+    'Terracotta': {
+        'description': 'Terracotta crafts involve creating objects from baked clay. In West Bengal, particularly in Bankura district, artisans are famous for creating the Bankura horse and other figurines.',
+        'image_url': 'https://cdn.shopify.com/s/files/1/0486/7712/6297/files/Add-a-subheading_2_600x600.webp?v=1687850806'
+    },
+    'Dokra': {
+        'description': 'Dokra is a non-ferrous metal casting technique using the lost-wax casting method. It is practiced in tribal areas of Chhattisgarh, West Bengal, and Odisha, creating distinctive figurines.',
+        'image_url': 'https://www.gitagged.com/wp-content/uploads/2020/10/Bastar-Dhokra-Swan-Art-GiTAGGED-4.jpg'
+    },
+    'Chanderi': {
+        'description': 'Chanderi is a traditional handwoven fabric made in Chanderi, Madhya Pradesh. Known for its sheer texture and lightweight, it often features gold and silver zari work.',
+        'image_url': 'https://www.shutterstock.com/image-photo/hand-weaving-silk-handloom-sarees-600nw-2552045721.jpg'
+    },
+    'Zardozi': {
+        'description': 'Zardozi is a form of heavy and elaborate metal embroidery on fabric. It originated in Persia and was brought to India during the Mughal era. It uses gold and silver threads to create intricate designs.',
+        'image_url': 'https://5.imimg.com/data5/WW/TR/YB/ANDROID-49526605/imtemp1573397807473-png-500x500.png'
+    },
+    'Meenakari': {
+        'description': 'Meenakari is the art of coloring and ornamenting the surface of metals by fusing brilliant colors in an intricate design. Rajasthan, particularly Jaipur, is famous for this craft.',
+        'image_url': 'https://i.pinimg.com/736x/5d/75/5e/5d755e1d31fd4dbe44fe3827c869c0e7.jpg'
+    },
+    'Aari Work': {
+        'description': 'Aari work is a type of embroidery done using a hooked needle (aari) from Kashmir. It produces a chain stitch on the fabric surface and is characterized by minute detailing and elaborate patterns.',
+        'image_url': 'https://i.ytimg.com/vi/HXkfSlhzb0A/hq720.jpg?sqp=-oaymwEhCK4FEIIDSFryq4qpAxMIARUAAAAAGAElAADIQj0AgKJD&rs=AOn4CLDyDZqGgBth1bQP_4-_7BS_zjtBUg'
+    },
+    'Kasuti': {
+        'description': 'Kasuti is a traditional form of folk embroidery from Karnataka. It involves intricate stitches to create geometric patterns on clothing, particularly sarees.',
+        'image_url': 'https://www.hunarcourses.com/blog/wp-content/uploads/2022/08/Image-1-13.jpg'
+    },
+    'Bamboo Craft': {
+        'description': 'Bamboo Craft is a traditional art form widely practiced in Assam and other northeastern states of India. Artisans create intricate baskets, mats, furniture, and decorative items using sustainable bamboo, known for its flexibility and strength.',
+        'image_url': 'https://5.imimg.com/data5/IH/OU/MY-12266299/bamboo-work-handicraft-500x500.jpg'
+    },
+    'Assam Silk': {
+        'description': 'Assam Silk, particularly Eri, Muga, and Pat silk, is renowned for its rich texture and natural sheen. Woven in Assam, these silks are used for traditional garments like Mekhela Chador, celebrated for their durability and elegance.',
+        'image_url': 'https://media.assettype.com/outlooktraveller%2Fimport%2Foutlooktraveller%2Fpublic%2Fuploads%2Farticles%2Ftravelnews%2F2018%2F06%2Fassamese-traditional-assam-silk-featured.jpg'
+    },
+    'Stone Carving': {
+        'description': 'Stone Carving is a traditional craft practiced across India, especially in Odisha and Rajasthan. Artisans sculpt intricate designs on marble, sandstone, and other stones to create statues, temple architecture, and decorative pieces.',
+        'image_url': 'https://i.pinimg.com/564x/0b/41/26/0b4126948b738c40103e957585eb05b3.jpg'
+    },
+    'Kalamkari': {
+        'description': 'Kalamkari is a traditional hand-painting or block-printing technique from Andhra Pradesh and Telangana, using natural dyes to create intricate narrative designs on cotton or silk, often depicting mythological themes.',
+        'image_url': 'https://curatorscart.com/cdn/shop/files/hand-painted-blue-orange-red-kalamkari-wall-plate.jpg?v=1695364899'
+    },
+    'Puppetry': {
+        'description': 'Puppetry, particularly Kathputli from Rajasthan, is a traditional performing art using wooden puppets adorned with colorful costumes. These puppets are used to narrate folktales and historical stories through performances.',
+        'image_url': 'https://media.licdn.com/dms/image/v2/D5612AQH7Wryn-xzTog/article-cover_image-shrink_600_2000/article-cover_image-shrink_600_2000/0/1726808503325?e=2147483647&v=beta&t=TO0eLlFZljF5niQfbkn5APvpMp9Ou4EXh4krCPu8kPg'
+    },
+    'Applique Work': {
+        'description': 'Applique Work, prominent in Gujarat and Odisha, involves stitching colorful fabric patches onto a base cloth to create vibrant patterns, often used for wall hangings, canopies, and traditional garments like Pipli applique.',
+        'image_url': 'https://www.utsavpedia.com/wp-content/uploads/2013/05/3429d5d3507b40c594d235c73e13a5c7.jpg'
+    },
+    'Muga Silk': {
+        'description': 'Muga Silk, exclusive to Assam, is a golden-yellow silk known for its natural luster and durability. Used in traditional Assamese attire, it is one of the costliest silks, prized for its cultural significance.',
+        'image_url': 'https://www.utsavpedia.com/wp-content/uploads/2013/06/Muga-Silk-Fabric3.jpg'
+    },
+    'Wood Carving': {
+        'description': 'Wood Carving is a traditional craft in states like Kerala and Karnataka, where artisans create detailed sculptures, furniture, and decorative panels, often featuring mythological figures and intricate floral patterns.',
+        'image_url': 'https://www.shutterstock.com/image-photo/wood-carving-tools-carpenters-hands-600nw-2403216529.jpg'
+    },
+    'Kani Shawl': {
+        'description': 'Kani Shawls from Jammu & Kashmir are woven with fine Pashmina wool using the twill-tapestry technique, featuring intricate multicolored patterns that reflect the region’s rich textile heritage.',
+        'image_url': 'https://www.pashwrap.com/cdn/shop/articles/Pashmina_Kani_Shawl.jpg?v=1697614181'
+    },
+    'Dhokra': {
+        'description': 'Dhokra is an ancient metal casting craft from Chhattisgarh and Odisha, using the lost-wax technique to create intricate brass figurines, jewelry, and decorative items with a rustic aesthetic.',
+        'image_url': 'https://i0.wp.com/utkalikaodisha.com/wp-content/uploads/2024/07/11.jpg?resize=600%2C600&ssl=1'
+    },
+    'Bagh Print': {
+        'description': 'Bagh Print is a traditional block-printing technique from Madhya Pradesh, using natural dyes and hand-carved wooden blocks to create vibrant geometric and floral patterns on cotton and silk fabrics.',
+        'image_url': 'https://s7ap1.scene7.com/is/image/incredibleindia/bagh-prints-of-madhya-pradesh-1-craft-body?qlt=82&ts=1726641261156'
+    },
+    'Kashida': {
+        'description': 'Kashida is an embroidery style from Jammu & Kashmir, featuring intricate thread work with floral and paisley motifs, often used to embellish shawls, sarees, and home furnishings.',
+        'image_url': 'https://i.pinimg.com/736x/03/3e/96/033e96a5f80ac0b85abf69de11346b02.jpg'
+    },
+    'Sujani': {
+        'description': 'Sujani is a traditional quilt-making craft from Bihar, where layers of old cloth are stitched together with colorful threads to create vibrant quilts and bedspreads, often depicting social themes.',
+        'image_url': 'https://akm-img-a-in.tosshub.com/indiatoday/images/story/202404/sujani-084407387-16x9_0.jpg?VersionId=LeAtqhxQCWQthiG.ezumwiO0IRl2rY3V'
+    },
+    'Marble Inlay': {
+        'description': 'Marble Inlay, practiced in Rajasthan, involves embedding semi-precious stones into marble to create intricate floral and geometric designs, commonly seen in tabletops and decorative items.',
+        'image_url': 'https://themarbleartstudio.com/wp-content/uploads/2022/08/Patten-Inlay-Work3.jpg'
+    },
+    'Kullu Shawl': {
+        'description': 'Kullu Shawls from Himachal Pradesh are handwoven woolen shawls known for their vibrant geometric patterns and bright colors, often used for warmth and cultural expression.',
+        'image_url': 'https://5.imimg.com/data5/SELLER/Default/2020/11/GW/DK/NO/117116792/kullu-shawls-500x500.jpg'
+    },
+    'Pithora Painting': {
+        'description': 'Pithora Painting is a ritualistic tribal art form from Gujarat, created by the Rathwa and Bhil tribes. These vibrant wall paintings depict mythological stories and are considered sacred.',
+        'image_url': 'https://www.memeraki.com/cdn/shop/articles/the-ritual-art-of-pithora-wall-paintings-420449_1200x1200.jpg?v=1661329608'
+    },
+    'Jute Craft': {
+        'description': 'Jute Craft, popular in West Bengal, involves creating eco-friendly products like bags, mats, and home decor using durable jute fibers, known for their sustainability and rustic appeal.',
+        'image_url': 'https://images-na.ssl-images-amazon.com/images/I/616PjMqbBpL.jpg'
+    },
+    'Shell Craft': {
+        'description': 'Shell Craft, practiced in coastal regions like Goa, uses seashells to create decorative items, jewelry, and home furnishings, showcasing intricate designs inspired by marine life.',
+        'image_url': 'https://i.pinimg.com/474x/62/93/1b/62931bb9db2d7ed6d20a355586896c04.jpg'
+    },
+    'Sohrai Painting': {
+        'description': 'Sohrai Painting is a tribal art form from Jharkhand, traditionally painted on mud walls during festivals. It features natural motifs like animals and plants, using earth-based colors.',
+        'image_url': 'https://dirumsbucket.blob.core.windows.net/dirumsbucket/download-2022.1.23_19.7.26-dirums-(dirums.com)/media/sohrai-painting-peacock-natural-color-on-handmade-paper-painting-for-living-room-office-worspace-dirums-frame-1.jpg'
+    },
+    'Leather Craft': {
+        'description': 'Leather Craft, prevalent in Andhra Pradesh and Rajasthan, involves creating durable goods like footwear, bags, and decorative items using embossed and dyed leather, often with intricate patterns.',
+        'image_url': 'https://www.truetridentleather.com/wp-content/uploads/2020/04/custom-leather-working.jpg'
+    }
+}
+
+# Curated descriptions, images and facts for the Cultural Heritage Sites page
+SITE_INFO = {
+    'Taj Mahal': {
+        'description': 'Built by Emperor Shah Jahan in memory of his beloved wife Mumtaz Mahal, the Taj Mahal is a masterpiece of Mughal architecture, combining elements from Persian, Ottoman Turkish, and Indian architectural styles.',
+        'image_url': 'https://static.toiimg.com/photo/62022874.cms',
+        'year': '1983',
+        'fact': 'The Taj Mahal changes its color subtly throughout the day, appearing pinkish in the morning, white during the day, and golden at night under moonlight.'
+    },
+    'Ajanta Caves': {
+        'description': 'The Ajanta Caves are 30 rock-cut Buddhist cave monuments dating from the 2nd century BCE to about 480 CE. The caves include paintings and sculptures considered to be masterpieces of Buddhist religious art.',
+        'image_url': 'https://cdn.getyourguide.com/img/tour/5b881032cf989.jpeg/146.jpg',
+        'year': '1983',
+        'fact': 'The Ajanta Caves were forgotten until 1819 when a British officer accidentally discovered them while hunting tigers.'
+    },
+    'Ellora Caves': {
+        'description': 'The Ellora Caves are a UNESCO World Heritage Site featuring Buddhist, Hindu and Jain cave temples and monasteries, built between the 6th and 10th century CE. The most remarkable is the Kailasa Temple, a huge monolithic structure carved out of a single rock.',
+        'image_url': 'https://www.worldhistory.org/img/c/p/1200x900/4565.jpg',
+        'year': '1983',
+        'fact': 'The Kailasa Temple at Ellora is carved out of a single rock, making it one of the largest monolithic structures in the world.'
+    },
+    'Agra Fort': {
+        'description': 'Agra Fort is a historical fort built by Akbar in 1565. It was the main residence of the emperors of the Mughal Dynasty until 1638 when the capital was shifted from Agra to Delhi.',
+        'image_url': 'https://www.holidify.com/images/cmsuploads/compressed/6799416268_822e8d98f5_b_20180814155943.jpg',
+        'year': '1983',
+        'fact': 'Shah Jahan, who built the Taj Mahal, was imprisoned by his son Aurangzeb in Agra Fort. He spent his last years gazing at the Taj Mahal from a window in the fort.'
+    },
+    'Khajuraho': {
+        'description': 'The Khajuraho Group of Monuments are a group of Hindu and Jain temples known for their nagara-style architectural symbolism and erotic sculptures. Built between 950 and 1050 by the Chandela dynasty, only about 20 temples remain from the original 85.',
+        'image_url': 'https://theindosphere.com/wp-content/uploads/2024/08/image-4.jpg',
+        'year': '1986',
+        'fact': 'Only about 10% of the sculptures at Khajuraho are erotic in nature, while the rest depict various aspects of everyday life and mythological narratives.'
+    },
+    'Fatehpur Sikri': {
+        'description': 'Fatehpur Sikri, built by Emperor Akbar in the late 16th century, served as the capital of the Mughal Empire for a short time. The city is an architectural masterpiece blending Persian, Indian, and Islamic influences.',
+        'image_url': 'https://www.raffaeleferrari.com/wp-content/uploads/2020/03/Fateh.jpg',
+        'year': '1986',
+        'fact': 'Fatehpur Sikri was abandoned shortly after its completion due to water scarcity in the region.'
+    },
+    'Mahabalipuram': {
+        'description': 'Mahabalipuram, also known as Mamallapuram, is famous for its rock-cut temples and sculptures created by the Pallava dynasty in the 7th and 8th centuries. The site features the Shore Temple and remarkable bas-relief carvings.',
+        'image_url': 'https://live.staticflickr.com/5654/23173189005_86a20afdf6_b.jpg',
+        'year': '1984',
+        'fact': 'The “Descent of the Ganges” sculpture at Mahabalipuram is one of the largest open-air rock reliefs in the world.'
+    },
+    'Kaziranga National Park': {
+        'description': 'Kaziranga National Park, located in Assam, is home to the largest population of the Indian one-horned rhinoceros. The park is a biodiversity hotspot and also shelters tigers, elephants, and a variety of bird species.',
+        'image_url': 'https://kaziranganationalparkassam.in/wp-content/uploads/2024/09/IMG_20240719_074806_954-2.jpg',
+        'year': '1985',
+        'fact': 'Kaziranga hosts over two-thirds of the world’s population of the Indian one-horned rhinoceros.'
+    },
+    'Qutub Minar': {
+        'description': 'Qutub Minar in Delhi is a 73-meter tall tower built in the early 13th century by Qutb-ud-din Aibak and his successors. It is a UNESCO World Heritage Site known for its intricate carvings and towering presence.',
+        'image_url': 'https://imgmediagumlet.lbb.in/media/2019/10/5d99cb588780ab0635aed883_1570360152711.jpg',
+        'year': '1993',
+        'fact': 'Qutub Minar is the tallest brick minaret in the world and has survived several earthquakes.'
+    },
+    'Jantar Mantar': {
+        'description': 'Jantar Mantar in Jaipur is an astronomical observatory built in the 18th century by Maharaja Jai Singh II. It features the world’s largest stone sundial and numerous instruments for measuring time, predicting eclipses, and tracking stars.',
+        'image_url': 'https://media.istockphoto.com/id/486396268/photo/historic-observatory.jpg?s=612x612&w=0&k=20&c=3D6GNFqEba-wnA4oLgelezGKSfl1FxOEYf_pU90B8qI=',
+        'year': '2010',
+        'fact': 'The instruments at Jantar Mantar are so large and precise that they can be used with the naked eye for accurate astronomical measurements.'
+    },
+    'Red Fort': {
+        'description': 'The Red Fort in Delhi was the main residence of the Mughal emperors for nearly 200 years. Built in 1648 by Shah Jahan, it is an outstanding example of Mughal architecture, combining Persian, Timurid, and Indian elements.',
+        'image_url': 'https://rukminim2.flixcart.com/image/850/1000/xif0q/poster/y/b/k/small-red-fort-poster-437-red-fort-poster-multicolor-photo-paper-original-imaghwgpmybwuu8e.jpeg?q=90&crop=false',
+        'year': '2007',
+        'fact': 'The Indian Prime Minister hoists the national flag at the Red Fort every Independence Day since 1947.'
+    },
+    'Humayun\'s Tomb': {
+        'description': 'Humayun’s Tomb in Delhi, built in 1572, is the first garden-tomb in the Indian subcontinent. It inspired several major architectural innovations, including the Taj Mahal.',
+        'image_url': 'https://cdn.britannica.com/57/91457-050-CEC85B47/Humayun-tomb-Delhi-India.jpg',
+        'year': '1993',
+        'fact': 'Humayun’s Tomb was the first structure in India to use red sandstone on such a grand scale.'
+    },
+    'Konark Sun Temple': {
+        'description': 'The Konark Sun Temple, built in the 13th century by King Narasimhadeva I of the Eastern Ganga dynasty, is designed in the shape of a colossal chariot with intricately carved stone wheels, pillars, and walls. It is dedicated to the Sun God, Surya.',
+        'image_url': 'https://media.istockphoto.com/id/96668487/photo/ancient-hindu-sun-temple-at-konark.jpg?s=612x612&w=0&k=20&c=tfjyAU_J1jmhxXTIu31E-6WcH3vcedUOhN-a2Z-YtCY=',
+        'year': '1984',
+        'fact': 'The temple’s 24 carved wheels are not just decorative — they also function as sundials.'
+    },
+    'Western Ghats': {
+        'description': 'The Western Ghats, also known as the Sahyadri Hills, is a mountain range along the western coast of India. It is one of the world’s eight “hottest hotspots” of biological diversity and includes numerous protected areas and endemic species.',
+        'image_url': 'https://plus.unsplash.com/premium_photo-1697730334419-fba83fe143b7?fm=jpg&q=60&w=3000&ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxzZWFyY2h8NXx8d2VzdGVybiUyMGdoYXRzfGVufDB8fDB8fHww',
+        'year': '2012',
+        'fact': 'The Western Ghats influence the Indian monsoon weather pattern and are older than the Himalayas.'
+    },
+    'Hampi': {
+        'description': 'Hampi, located in Karnataka, was the capital of the Vijayanagara Empire in the 14th century. The site is known for its well-preserved ruins, majestic temples like the Virupaksha Temple, and unique architecture blending Hindu and Islamic styles.',
+        'image_url': 'https://www.solitarytraveller.com/wp-content/uploads/2023/03/package_hampi_banner.jpg',
+        'year': '1986',
+        'fact': 'Hampi was once one of the richest cities in the world, attracting traders from Persia and Portugal.'
+    },
+    "Cellular Jail": {
+        "description": "Located in Port Blair, Andaman and Nicobar Islands, the Cellular Jail, also known as Kala Pani, was a colonial prison used by the British to exile political prisoners. It is now a national memorial showcasing India’s freedom struggle.",
+        "image_url": "https://s7ap1.scene7.com/is/image/incredibleindia/cellular-jail-port-blair-andaman-and-nicobar-islands-1-attr-hero?qlt=82&ts=1726816912863",
+        "year": "1998",
+        "fact": "The Cellular Jail had 698 cells designed to prevent communication between prisoners, symbolizing its role in isolating freedom fighters."
+    },
+    "Tirupati Temple": {
+        "description": "Sri Venkateswara Temple in Tirupati, Andhra Pradesh, is one of the most revered Hindu pilgrimage sites, dedicated to Lord Vishnu. It is renowned for its Dravidian architecture and massive devotee footfall.",
+        "image_url": "https://thefederal.com/file/2023/01/Tirupatitemple.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "The temple is one of the richest religious institutions in the world, receiving millions of devotees and donations annually."
+    },
+    "Tawang Monastery": {
+        "description": "Located in Arunachal Pradesh, Tawang Monastery is the largest Buddhist monastery in India, founded in the 17th century. It is a significant spiritual center for Tibetan Buddhism.",
+        "image_url": "https://i.cdn.newsbytesapp.com/images/l33420241024094000.jpeg",
+        "year": "Not a UNESCO site",
+        "fact": "The monastery houses a 28-foot-high golden statue of Lord Buddha, making it a focal point for Buddhist pilgrims."
+    },
+    "Kamakhya Temple": {
+        "description": "Situated in Guwahati, Assam, the Kamakhya Temple is a major Shakti Peetha dedicated to Goddess Kamakhya. It is known for its unique tantric worship practices.",
+        "image_url": "https://s7ap1.scene7.com/is/image/incredibleindia/kamakhya-temple-dispur-assam-2-attr-hero?qlt=82&ts=1726741392778",
+        "year": "Not a UNESCO site",
+        "fact": "The temple hosts the annual Ambubachi Mela, attracting thousands to celebrate the goddess’s menstruation cycle."
+    },
+    "Mahabodhi Temple": {
+        "description": "Located in Bodh Gaya, Bihar, the Mahabodhi Temple marks the spot where Gautama Buddha attained enlightenment. It is a UNESCO World Heritage Site and a major Buddhist pilgrimage destination.",
+        "image_url": "https://s7ap1.scene7.com/is/image/incredibleindia/mahabodhi-temple-gaya-bihar-4-attr-hero?qlt=82&ts=1726740645749",
+        "year": "2002",
+        "fact": "The temple’s Bodhi Tree is a direct descendant of the original tree under which Buddha meditated."
+    },
+    "Rock Garden": {
+        "description": "The Rock Garden in Chandigarh, created by Nek Chand, is a unique sculpture garden made from recycled materials like ceramics, stones, and industrial waste, showcasing artistic ingenuity.",
+        "image_url": "https://www.gardendesign.com/pictures/images/650x490Exact_48x0/site_3/asian-style-rock-garden-rock-garden-with-blue-screen-garden-design_15639.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "The garden spans 40 acres and was secretly built by Nek Chand over decades before being officially recognized."
+    },
+    "Chitrakoot Falls": {
+        "description": "Located in Chhattisgarh, Chitrakoot Falls is one of India’s widest waterfalls, often called the 'Niagara Falls of India,' surrounded by lush greenery.",
+        "image_url": "https://static.toiimg.com/photo/38796013.cms",
+        "year": "Not a UNESCO site",
+        "fact": "The falls are named after the nearby Chitrakoot, associated with Lord Rama’s exile in the Ramayana."
+    },
+    "Diu Fort": {
+        "description": "Built by the Portuguese in 1535, Diu Fort in Diu is a well-preserved coastal fortress, reflecting colonial architecture and strategic maritime history.",
+        "image_url": "https://makeithappen.co.in/wp-content/uploads/2021/12/Diu-Fort-G1-4.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "The fort houses a lighthouse and cannons, offering panoramic views of the Arabian Sea."
+    },
+    "Basilica of Bom Jesus": {
+        "description": "Located in Goa, the Basilica of Bom Jesus is a UNESCO World Heritage Site famous for housing the mortal remains of St. Francis Xavier, showcasing Baroque architecture.",
+        "image_url": "https://cdn-iladmib.nitrocdn.com/htBCYuNetSQrkeDEiUPoyTCbyIlIyAQV/assets/images/optimized/rev-0efd0da/www.soultravelling.in/blog/wp-content/uploads/2024/12/4-6-1024x685.jpg",
+        "year": "1986",
+        "fact": "The body of St. Francis Xavier, preserved in the basilica, is displayed every 10 years during a public exposition."
+    },
+    "Somnath Temple": {
+        "description": "Located in Gujarat, the Somnath Temple is one of the twelve Jyotirlinga shrines of Lord Shiva, known for its historical significance and coastal location.",
+        "image_url": "https://dynamic-media-cdn.tripadvisor.com/media/photo-o/0e/61/81/52/il-tempio.jpg?w=900&h=500&s=1",
+        "year": "Not a UNESCO site",
+        "fact": "The temple has been rebuilt multiple times after being destroyed by invaders, symbolizing resilience."
+    },
+    "Kurukshetra": {
+        "description": "Kurukshetra in Haryana is a historic city associated with the Mahabharata, known for its sacred sites like Jyotisar, where the Bhagavad Gita was delivered.",
+        "image_url": "https://static.toiimg.com/thumb/50366039,width-96,height-65.cms",
+        "year": "Not a UNESCO site",
+        "fact": "The city is believed to be the battlefield of the epic Mahabharata war between the Pandavas and Kauravas."
+    },
+    "Kullu Valley": {
+        "description": "Nestled in Himachal Pradesh, Kullu Valley is known for its scenic beauty, adventure sports, and vibrant Dussehra festival, surrounded by the Himalayas.",
+        "image_url": "https://i0.wp.com/traveltoyournature.com/wp-content/uploads/2023/10/nature-activities-with-views-in-Kullu-Valley-1024x768.jpg?resize=1024%2C768",
+        "year": "Not a UNESCO site",
+        "fact": "Kullu’s Dussehra festival is unique, celebrating Lord Raghunath with grand processions."
+    },
+    "Vaishno Devi Temple": {
+        "description": "Located in Katra, Jammu and Kashmir, the Vaishno Devi Temple is a major Hindu pilgrimage site dedicated to Goddess Vaishno Devi, situated in the Trikuta Mountains.",
+        "image_url": "https://thetempleguru.com/wp-content/uploads/2024/08/Vaishno-Devi-Temple-katra-jk-3.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "Devotees trek 12 km to reach the cave shrine, which is one of India’s most visited pilgrimage sites."
+    },
+    "Betla National Park": {
+        "description": "Located in Jharkhand, Betla National Park is a tiger reserve known for its biodiversity, waterfalls, and historic forts amidst dense forests.",
+        "image_url": "https://site.outlookindia.com/traveller/wp-content/uploads/2017/06/jharkhand1_Betla-NP_FI.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "The park is home to the 16th-century Betla Fort, adding historical significance to its natural beauty."
+    },
+    "Periyar National Park": {
+        "description": "Situated in Kerala, Periyar National Park is a biodiversity hotspot and tiger reserve, famous for its elephant and tiger populations and scenic Periyar Lake.",
+        "image_url": "https://www.periyarnationalparkonline.in/images/wildlife-wonders-periyar.jpg",
+        "year": "2010",
+        "fact": "The park’s lake, formed by the Mullaperiyar Dam, offers unique boat safaris for wildlife viewing."
+    },
+    "Leh Palace": {
+        "description": "Located in Ladakh, Leh Palace is a 17th-century royal palace built in Tibetan architectural style, offering panoramic views of the Himalayas.",
+        "image_url": "https://www.go2ladakh.in/img/shared/gallery/28a3d6951d94be8c08426de8da80e78b.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "The palace, resembling a smaller Potala Palace, was once home to the Namgyal dynasty."
+    },
+    "Agatti Island": {
+        "description": "Part of Lakshadweep, Agatti Island is known for its coral reefs, turquoise lagoons, and pristine beaches, making it a paradise for water sports and marine life enthusiasts.",
+        "image_url": "https://static.tripzilla.in/media/51542/conversions/df4b93dd-5f80-4e21-a4fa-e7d530506ed1-w768.webp",
+        "year": "Not a UNESCO site",
+        "fact": "Agatti has one of the few airports in Lakshadweep, serving as a gateway to the islands."
+    },
+    "Khajuraho Temples": {
+        "description": "The Khajuraho Temples in Madhya Pradesh, a UNESCO World Heritage Site, are renowned for their intricate erotic carvings and Nagara-style architecture, built between 950-1050 CE.",
+        "image_url": "https://www.holidify.com/images/cmsuploads/compressed/shutterstock_1032564361_20200219140048.jpg",
+        "year": "1986",
+        "fact": "Only about 20 of the original 85 temples remain, showcasing exquisite medieval Indian art."
+    },
+    "Loktak Lake": {
+        "description": "Located in Manipur, Loktak Lake is the largest freshwater lake in Northeast India, famous for its floating phumdis (vegetation islands) and Keibul Lamjao National Park.",
+        "image_url": "https://www.savaari.com/blog/wp-content/uploads/2022/12/loktak-lake-in-india.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "Keibul Lamjao, on the lake, is the world’s only floating national park, home to the endangered Sangai deer."
+    },
+    "Living Root Bridges": {
+        "description": "Found in Meghalaya, the Living Root Bridges are hand-crafted by the Khasi and Jaintia tribes using the roots of rubber trees, creating sustainable natural bridges.",
+        "image_url": "https://faw-marketing.transforms.svdcdn.com/production/images/A-living-root-bridge.jpg?w=600&h=400&q=80&auto=format&fit=crop&crop=focalpoint&fp-x=0.5&fp-y=0.5&dm=1542707094&s=a6f7365df9bdffff06bce06f32310013",
+        "year": "Not a UNESCO site",
+        "fact": "The double-decker root bridge in Nongriat is one of the most iconic, taking decades to grow."
+    },
+    "Vantawng Falls": {
+        "description": "Located in Mizoram, Vantawng Falls is the state’s highest waterfall, cascading through lush forests and offering breathtaking views.",
+        "image_url": "https://cdn.tripuntold.com/media/photos/location/2018/08/14/fbd0dbd7-7cdc-4f46-8394-e97485dab7dc.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "The falls are named after Vantawnga, a legendary Mizo hunter who discovered them."
+    },
+    "Kohima War Cemetery": {
+        "description": "In Kohima, Nagaland, this cemetery commemorates Allied soldiers who died in the 1944 Battle of Kohima, a turning point in World War II.",
+        "image_url": "https://travelsetu.com/apps/uploads/new_destinations_photos/destination/2024/01/18/e6b0b1fd4bb207ec797bc528045e21b2_1000x1000.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "The cemetery’s epitaph reads, ‘When you go home, tell them of us and say, for your tomorrow, we gave our today.’"
+    },
+    "Auroville": {
+        "description": "Located in Puducherry, Auroville is an experimental township founded in 1968, aiming to be a universal community based on peace and human unity, centered around the Matrimandir.",
+        "image_url": "https://static.toiimg.com/thumb/99391984/Matrimandir-in-Puducherry.jpg?width=1200&height=900",
+        "year": "Not a UNESCO site",
+        "fact": "The Matrimandir, a golden spherical meditation center, is Auroville’s spiritual and architectural highlight."
+    },
+    "Golden Temple": {
+        "description": "Located in Amritsar, Punjab, the Golden Temple (Harmandir Sahib) is the holiest Sikh shrine, known for its stunning golden architecture and communal kitchen serving free meals.",
+        "image_url": "https://www.whyweseek.com/wp-content/uploads/2020/01/facebook-amritsar.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "The temple’s langar serves up to 100,000 meals daily, open to all regardless of faith or status."
+    },
+    "Amber Fort": {
+        "description": "Situated in Jaipur, Rajasthan, Amber Fort is a majestic hilltop fortress known for its Rajput architecture, intricate mirror work, and stunning views.",
+        "image_url": "https://www.rajasthanbhumitours.com/blog/wp-content/uploads/2024/08/Amber-Fort-and-Palace-The-Guardian-of-Rajput-Glory.jpg",
+        "year": "2013",
+        "fact": "The fort’s Sheesh Mahal features thousands of tiny mirrors, creating a dazzling effect when lit."
+    },
+    "Rumtek Monastery": {
+        "description": "Located in Sikkim, Rumtek Monastery is a key center for Tibetan Buddhism, known for its traditional architecture and as the seat of the Karmapa.",
+        "image_url": "https://www.elginhotels.com/wp-content/uploads/2020/03/rumtek-monastery-01.jpg.webp",
+        "year": "Not a UNESCO site",
+        "fact": "The monastery houses rare Buddhist relics, including a golden stupa containing the remains of the 16th Karmapa."
+    },
+    "Meenakshi Temple": {
+        "description": "Located in Madurai, Tamil Nadu, the Meenakshi Temple is a historic Dravidian temple dedicated to Goddess Meenakshi and Lord Sundareswarar, famous for its towering gopurams.",
+        "image_url": "https://thrillingtravel.in/wp-content/uploads/2018/02/Golden-Lotus-Pond-at-Meenakshi-Temple.jpg",
+        "year": "Not a UNESCO site",
+        "fact": "The temple’s 14 gopurams are adorned with over 33,000 sculptures, showcasing intricate craftsmanship."
+    },
+    "Charminar": {
+        "description": "Built in 1591 in Hyderabad, Telangana, the Charminar is an iconic monument and mosque, known for its four minarets and vibrant surrounding markets.",
+        "image_url": "https://media1.thrillophilia.com/filestore/3g77vc5tt9qxuuorsmeudjjscqtu_Charminar.jpg?w=400&dpr=2",
+        "year": "Not a UNESCO site",
+        "fact": "The Charminar was built to commemorate the end of a deadly plague in Hyderabad."
+    },
+    "Ujjayantha Palace": {
+        "description": "Located in Agartala, Tripura, Ujjayantha Palace is a 19th-century royal palace, now a museum, showcasing the history and culture of Tripura.",
+        "image_url": "https://dynamic-media-cdn.tripadvisor.com/media/photo-o/17/9f/9b/ef/img-20190308-132059-largejpg.jpg?w=900&h=500&s=1",
+        "year": "Not a UNESCO site",
+        "fact": "The palace was named by Rabindranath Tagore, who was a frequent visitor."
+    },
+    "Valley of Flowers": {
+        "description": "Located in Uttarakhand, the Valley of Flowers is a UNESCO World Heritage Site known for its vibrant alpine meadows and rare flora, nestled in the Himalayas.",
+        "image_url": "https://www.holidify.com/images/bgImages/VALLEY-OF-FLOWERS.jpg",
+        "year": "2005",
+        "fact": "The valley is home to over 500 species of wildflowers, blooming vividly during the monsoon season."
+    },
+    "Victoria Memorial": {
+        "description": "Located in Kolkata, West Bengal, the Victoria Memorial is a grand marble monument built in memory of Queen Victoria, now a museum showcasing colonial history.",
+        "image_url": "https://images.unsplash.com/photo-1558431382-9b06d0507edc?ixid=MnwzODM4MzZ8MHwxfGFsbHx8fHx8fHx8fDE2NzAxNjMwNTg&ixlib=rb-4.0.3&fm=jpg&q=85&fit=crop&w=2560&h=1920",
+        "year": "Not a UNESCO site",
+        "fact": "The memorial houses a vast collection of artifacts, including paintings and manuscripts from the British Raj era."
+    }
+}
+
+# Curated descriptions and images for the Cultural Events Calendar
+EVENT_INFO = {
+    'Kumbh Mela': {
+        'description': 'The Kumbh Mela is a major Hindu pilgrimage and festival held every 12 years at four sacred river-bank locations. It is the world’s largest religious gathering, attracting millions of devotees.',
+        'image_url': 'https://images.theconversation.com/files/642200/original/file-20250114-15-oucsvl.jpg?ixlib=rb-4.1.0&rect=0%2C85%2C4063%2C2031&q=45&auto=format&w=1356&h=668&fit=crop'
+    },
+    'Pushkar Camel Fair': {
+        'description': 'The Pushkar Camel Fair is an annual livestock fair held in Pushkar, Rajasthan, featuring camel trading, cultural performances, and religious ceremonies.',
+        'image_url': 'https://blog.dookinternational.com/wp-content/uploads/2017/06/a24.jpg'
+    },
+    'Rann Utsav': {
+        'description': 'Rann Utsav is a cultural festival held in the Great Rann of Kutch, Gujarat, showcasing traditional crafts, folk music, and dance under the full moon in the white salt desert.',
+        'image_url': 'https://c.ndtvimg.com/2024-10/beukk88_rann-utsav_625x300_23_October_24.jpg?im=FaceCrop,algorithm=dnn,width=545,height=307'
+    },
+    'Hornbill Festival': {
+        'description': 'The Hornbill Festival in Nagaland is a vibrant celebration of Naga culture, featuring traditional dances, indigenous games, and tribal crafts, uniting all Naga tribes.',
+        'image_url': 'https://img.theweek.in/content/dam/week/week/news/tourism/images/2024/11/30/hornbill-file-photo.jpg'
+    },
+    'Onam': {
+        'description': 'Onam is a harvest festival in Kerala, marked by floral decorations, traditional feasts, snake boat races, and the mythical return of King Mahabali.',
+        'image_url': 'https://currentaffairs.adda247.com/wp-content/uploads/multisite/sites/5/2021/08/23081756/Onam-Celebration-in-Kerala-1024x660-1.jpg'
+    },
+    'Durga Puja': {
+        'description': 'Durga Puja is a major Hindu festival in West Bengal, celebrating the victory of Goddess Durga over Mahishasura, with elaborate pandals, idol immersions, and cultural performances.',
+        'image_url': 'https://surojitpalmal.com/wp-content/uploads/2023/10/Best-Durga-Puja-in-Hyderabad.webp'
+    },
+    'Diwali in Varanasi': {
+        'description': 'Diwali in Varanasi is a spectacular celebration with thousands of oil lamps lighting up the ghats, fireworks, and devotional music, symbolizing the victory of light over darkness.',
+        'image_url': 'https://www.nativeplanet.com/img/2023/09/illuminated-city-of-varanasi-during-the-divine-festival-of-dev-diwali_1695797197486-1200x675-20230927122601.jpg'
+    },
+    'Hemis Festival': {
+        'description': 'The Hemis Festival in Ladakh commemorates the birth of Guru Padmasambhava with vibrant masked dances, traditional music, and Buddhist rituals at the Hemis Monastery.',
+        'image_url': 'https://images.indianexpress.com/2023/06/hemis-new.png'
+    },
+    'Holi in Mathura': {
+        'description': 'Holi in Mathura, the birthplace of Lord Krishna, is a vibrant festival of colors with temple rituals, folk songs, and playful throwing of colored powders.',
+        'image_url': 'https://clubmahindra.gumlet.io/blog/media/section_images/holifestiv-a5b10b7c01f70d2.jpg?w=376&dpr=2.6'
+    },
+    'Pongal': {
+        'description': 'Pongal is a Tamil harvest festival dedicated to the Sun God, marked by cooking a special rice dish, traditional dances, and cattle worship over four days.',
+        'image_url': 'https://cdn.shopify.com/s/files/1/0525/5285/9819/files/4_2_1024x1024.jpg?v=1734523615'
+    },
+    'Bihu': {
+        'description': 'Bihu is Assam’s harvest festival, celebrated with vigorous Bihu dances, traditional music, and feasts, marking the Assamese New Year and agricultural cycles.',
+        'image_url': 'https://media.istockphoto.com/id/1482254684/photo/rongali-bihu-festival.jpg?s=612x612&w=0&k=20&c=OKRcAAc6HMqMluMBQFQmPypo5uZZ_AO6xIVkI-TV6Pw='
+    },
+    'Ganesh Chaturthi': {
+        'description': 'Ganesh Chaturthi in Maharashtra celebrates Lord Ganesha’s birth with grand idol installations, prayers, and processions, culminating in idol immersions.',
+        'image_url': 'https://images.mid-day.com/images/images/2022/aug/Ganesh-Chaturthi-Mumbai.jpg'
+    },
+    'Navratri': {
+        'description': 'Navratri is a nine-night Hindu festival celebrating Goddess Durga, with Garba and Dandiya dances in Gujarat, fasting, and vibrant worship across India.',
+        'image_url': 'https://www.travelandtourworld.com/wp-content/uploads/2024/09/pikaso_texttoimage_Navratri-Fest.jpg'
+    },
+    'Jaipur Literature Festival': {
+        'description': 'The Jaipur Literature Festival in Rajasthan is the world’s largest free literary festival, attracting global authors, poets, and intellectuals for discussions and cultural events.',
+        'image_url': 'https://akm-img-a-in.tosshub.com/indiatoday/images/story/201601/jaipur-lit-fest_647_012016104450.jpg?VersionId=smUFj19HBJPNugmvaxtHMaTxb_1tVQeh'
+    },
+    'Khajuraho Dance Festival': {
+        'description': 'The Khajuraho Dance Festival in Madhya Pradesh showcases classical Indian dance forms against the backdrop of the Khajuraho temples, celebrating India’s performing arts heritage.',
+        'image_url': 'https://www.theweek.in/content/dam/week/news/entertainment/images/2023/2/19/khajuraho-dance-fest.jpg.transform/schema-1x1/image.jpg'
+    },
+    'Thrissur Pooram': {
+        'description': 'Thrissur Pooram is a vibrant Hindu temple festival in Kerala, known for its spectacular elephant processions, traditional music, and fireworks, held at the Vadakkunnathan Temple.',
+        'image_url': 'https://thrissurpooramfestival.com/engine1/bnr_img/bnr01.jpg'
+    },
+    'Baisakhi': {
+        'description': 'Baisakhi is a harvest festival celebrated in Punjab, marking the Sikh New Year with vibrant processions, traditional dances like Bhangra, and communal feasts.',
+        'image_url': 'https://static.toiimg.com/thumb/msid-90802194,width-1280,height-720,imgsize-178800,resizemode-6,overlay-toi_sw,pt-32,y_pad-40/photo.jpg'
+    },
+    'Chhath Puja': {
+        'description': 'Chhath Pooja is a Hindu festival primarily in Bihar, dedicated to the Sun God, involving rituals, fasting, and offerings at riverbanks over four days.',
+        'image_url': 'https://121clicks.com/wp-content/uploads/2017/11/chhath_puja_mass_prayer_to_the_sun_photo_story_121_clicks_arup_biswas_27.jpg'
+    },
+    'Teej': {
+        'description': 'Teej is a women-centric festival celebrated in Rajasthan and other northern states, marked by fasting, colorful attire, and traditional dances to honor Goddess Parvati.',
+        'image_url': 'https://s7ap1.scene7.com/is/image/incredibleindia/teej%20festival-1-regional-fes-hero?qlt=82&ts=1726639479648'
+    },
+    'Losar': {
+        'description': 'Losar is the Tibetan New Year celebrated in Ladakh with Buddhist rituals, vibrant dances, and feasts, marking the beginning of the lunar calendar.',
+        'image_url': 'https://i0.wp.com/www.tusktravel.com/blog/wp-content/uploads/2021/02/Losar-Festival-Ladakh.jpg?fit=1024%2C683&ssl=1'
+    },
+    'Goa Carnival': {
+        'description': 'Goa Carnival is a lively pre-Lenten festival in Goa, featuring colorful parades, street dancing, and vibrant costumes, reflecting Portuguese cultural influences.',
+        'image_url': 'https://static.toiimg.com/photo/62649959.cms'
+    },
+    'Torgya Festival': {
+        'description': 'Torgya Festival in Arunachal Pradesh is a monastic festival at Tawang Monastery, featuring ritualistic dances to ward off evil spirits and promote prosperity.',
+        'image_url': 'https://currentaffairs.adda247.com/wp-content/uploads/multisite/sites/5/2022/02/03080344/arunachal-festival-01.jpg'
+    },
+    'Sangai Festival': {
+        'description': 'Sangai Festival in Manipur showcases the state’s cultural heritage with traditional dances, indigenous sports, and crafts, named after the endangered Sangai deer.',
+        'image_url': 'https://static2.tripoto.com/media/filter/tst/img/172710/TripDocument/1542010952_sangai_41.jpg'
+    },
+    'Konark Dance Festival': {
+        'description': 'Konark Dance Festival in Odisha celebrates classical Indian dance forms like Odissi and Bharatanatyam, set against the backdrop of the historic Konark Sun Temple.',
+        'image_url': 'https://odishatourism.gov.in/content/dam/tourism/home/upcoming-events/konark_dance_festival/stb/img1.jpg'
+    },
+    'Makar Sankranti': {
+        'description': 'Makar Sankranti is a harvest festival celebrated across India, marking the sun’s transition into Capricorn with kite flying, bonfires, and traditional sweets.',
+        'image_url': 'https://www.stmarys-school.in/wp-content/uploads/2023/01/1-1.jpg'
+    },
+    'Vishu': {
+        'description': 'Vishu is the Malayalam New Year in Kerala, celebrated with traditional rituals, Vishukkani arrangements, and feasts to mark prosperity and new beginnings.',
+        'image_url': 'https://cdn.pixabay.com/photo/2022/01/27/06/35/happy-vishu-6971252_960_720.jpg'
+    },
+    'Bathukamma': {
+        'description': 'Bathukamma is a floral festival in Telangana, where women create vibrant flower arrangements and sing folk songs to honor Goddess Gauri.',
+        'image_url': 'https://www.sakshi.com/gallery_images/2023/10/13/bathukamma%20celebrations%20in%20hyderabad-1.jpg'
+    },
+    'Wangala Festival': {
+        'description': 'Wangala Festival in Meghalaya is a harvest celebration of the Garo tribe, featuring traditional drum beating, dances, and offerings to the Sun God.',
+        'image_url': 'https://i0.wp.com/www.tusktravel.com/blog/wp-content/uploads/2023/11/100-Drums-Festival-of-Meghalay.jpg?fit=1024%2C768&ssl=1'
+    },
+    'Chapchar Kut': {
+        'description': 'Chapchar Kut is a spring festival in Mizoram, celebrating the sowing season with traditional Mizo dances, music, and feasts, showcasing tribal unity.',
+        'image_url': 'https://assamtribune.com/h-upload/2025/03/08/1694809-chapchar-kut-mizo-fest.jpg'
+    },
+    'Gudi Padwa': {
+        'description': 'Gudi Padwa marks the Marathi New Year in Maharashtra, celebrated with colorful rangolis, hoisting of Gudi flags, and traditional feasts.',
+        'image_url': 'https://cdn.cdnparenting.com/articles/2018/09/19150407/Gudi-Padwa-1.webp'
+    },
+    'Ambubachi Mela': {
+        'description': 'Ambubachi Mela in Assam is a tantric festival at Kamakhya Temple, celebrating the menstruation of Goddess Kamakhya with rituals and pilgrimages.',
+        'image_url': 'https://thehillstimes.in/wp-content/uploads/2024/06/image_editor_output_image1737499973-1652978579963.jpg'
+    },
+    'Sankranti': {
+        'description': 'Sankranti, celebrated in Andhra Pradesh, is a harvest festival with traditional rituals, kite flying, and offerings to mark the sun’s northward journey.',
+        'image_url': 'https://assets.thehansindia.com/h-upload/2025/01/07/1512814-haridasu.webp'
+    },
+    'Lohri': {
+        'description': 'Lohri is a Punjabi festival marking the winter solstice, celebrated with bonfires, folk songs, and dances like Bhangra, symbolizing harvest and prosperity.',
+        'image_url': 'https://i.pinimg.com/736x/e7/07/c5/e707c568aa174eae63e3fd677a81bb05.jpg'
+    },
+    'Modhera Dance Festival': {
+        'description': 'Modhera Dance Festival in Gujarat showcases classical dance forms like Garba and Dandiya, performed at the historic Sun Temple in Modhera.',
+        'image_url': 'https://creativeyatra.com/wp-content/uploads/2017/02/RDSC01292-1-bw.jpg'
+    },
+    'Ladakh Festival': {
+        'description': 'Ladakh Festival celebrates the region’s Buddhist heritage with traditional dances, polo matches, and cultural exhibitions in Leh and surrounding areas.',
+        'image_url': 'https://lifeontheplanetladakh.com/wp-content/uploads/2024/07/IMG_5991.jpeg'
+    },
+    'Tansen Samaroh': {
+        'description': 'Tansen Samaroh in Madhya Pradesh is a classical music festival honoring Tansen, featuring performances by renowned musicians near his tomb in Gwalior.',
+        'image_url': 'https://www.festivalsofindia.in/images/tansen.jpg'
+    },
+    'Lakshadweep Cultural Fest': {
+        'description': 'Lakshadweep Cultural Festival showcases the islands’ unique traditions with folk dances, music, and local crafts, celebrating the vibrant island culture.',
+        'image_url': 'https://tripxl.com/blog/wp-content/uploads/2024/10/Milad-un-Nabi.jpg'
+    }
+}
+
+
+# Passages from the app's own content appended to each chatbot question
+RETRIEVAL_TOP_K = 4
+# Cosine similarity a passage needs to be worth sending
+RETRIEVAL_MIN_SCORE = 0.1
+# Characters kept per passage so the prompt stays bounded whatever the catalog holds
+RETRIEVAL_PASSAGE_CHARS = 600
+
+
+def load_knowledge_passages():
+    """The curated descriptions and dataset rows as (Title, Text) passages for chatbot retrieval."""
+    titles, texts = [], []
+    for kind, info in [('painting', PAINTING_INFO), ('performing art', PERFORMING_ART_INFO), ('craft', CRAFT_INFO),
+                       ('heritage site', SITE_INFO), ('cultural event', EVENT_INFO)]:
+        for name, entry in info.items():
+            titles.append(f"{name} ({kind})")
+            texts.append(entry['description'] + (f" Interesting fact: {entry['fact']}" if 'fact' in entry else ""))
+    arts = load_arts_data()
+    for row in arts.itertuples(index=False):
+        titles.append(row.Art_Form)
+        texts.append(f"{row.Art_Form} is a {row.Category.lower()} tradition from {row.Region} "
+                     f"with a popularity score of {row.Popularity_Score}/100.")
+    crafts = load_crafts_data()
+    for row in crafts.itertuples(index=False):
+        titles.append(row.Craft)
+        texts.append(f"{row.Craft} is a craft of {row.State} practised by about {row.Artisans_Count:,} artisans, "
+                     f"earning around ₹{row.Annual_Revenue_Cr} crore a year.")
+    heritage = load_heritage_site_data()
+    for row in heritage.itertuples(index=False):
+        titles.append(row.Site)
+        texts.append(f"{row.Site} is a {row.Type.lower()} heritage site in {row.State} (year inscribed {row.Year_Inscribed}) "
+                     f"with about {row.Visitors_Annual:,} visitors a year.")
+    events = load_cultural_events_data()
+    for row in events.itertuples(index=False):
+        titles.append(row.Event)
+        texts.append(f"{row.Event} takes place in {row.State} ({row.Month}), drawing about {row.Visitors_Estimate:,} "
+                     f"visitors, with a cultural significance of {row.Cultural_Significance}/10.")
+    monuments = load_monuments_data()
+    for state, count in zip(monuments['State/UT'], monuments['No_of_Monuments']):
+        titles.append(f"{state} monuments")
+        texts.append(f"{state} has {count} ASI-protected monuments.")
+    foreign = load_tourism_data()
+    domestic = load_domestic_tourism_data()
+    for state, visits, share in zip(foreign['State/UT'], foreign['FTV_2022'], foreign['Percentage_Share_2022']):
+        titles.append(f"{state} foreign tourism")
+        texts.append(f"{state} received {visits:,} foreign tourist visits in 2022, {share}% of India's total.")
+    for state, visits, share in zip(domestic['State/UT'], domestic['DTV_2022_millions'], domestic['Percentage_Share_2022']):
+        titles.append(f"{state} domestic tourism")
+        texts.append(f"{state} received {visits:.2f} million domestic tourist visits in 2022, {share}% of India's total.")
+    return pd.DataFrame({'Title': titles, 'Text': texts})
+
+
+class PassageIndex:
+    """A TF-IDF index over knowledge passages for picking the few that ground a chatbot question."""
+
+    def __init__(self, passages):
+        self.passages = passages
+        self.vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), sublinear_tf=True)
+        self.matrix = self.vectorizer.fit_transform(
+            (passages['Title'] + " " + passages['Text']).map(normalize_question)
+        )
+
+    def search(self, question, k=RETRIEVAL_TOP_K, min_score=RETRIEVAL_MIN_SCORE):
+        """The k best passages for question scoring at least min_score, best first, with a Score column."""
+        scores = (self.vectorizer.transform([normalize_question(question)]) @ self.matrix.T).toarray()[0]
+        top = np.argsort(-scores, kind='stable')[:k]
+        top = top[scores[top] >= min_score]
+        passages = self.passages.iloc[top].copy()
+        passages['Score'] = scores[top].round(3)
+        return passages.reset_index(drop=True)
+
+
+@st.cache_resource(max_entries=4)
+def build_passage_index(version, _passages):
+    return PassageIndex(_passages)
+
+
+def get_passage_index():
+    """The passage index for the current content, rebuilt only when its dataset version changes."""
+    passages = load_knowledge_passages()
+    return build_passage_index(dataset_version(passages), passages)
+
+
+def grounded_prompt(question, passages):
+    """question with the retrieved passages prepended as background, or question alone when none matched."""
+    if passages.empty:
+        return question
+    background = "\n".join(f"- {title}: {text[:RETRIEVAL_PASSAGE_CHARS]}"
+                           for title, text in zip(passages['Title'], passages['Text']))
+    return (
+        "Background from the Bharat Explorer catalogue. Use it where it is relevant and "
+        "prefer it over general knowledge when they disagree:\n"
+        f"{background}\n\n"
+        f"Question: {question}"
+    )
 
 
 def create_animated_header():
@@ -1388,7 +3499,7 @@ def create_animated_header():
     </html>
     """
     
-    return animated_header_html
+    return localize_assets(animated_header_html)
     
 # Custom CSS for styling
 st.markdown("""
@@ -1625,12 +3736,347 @@ st.markdown("""
 def display_placeholder_image(width=600):
     st.image("https://img.freepik.com/free-vector/gradient-abstract-wireframe-background_23-2149009903.jpg?semt=ais_hybrid&w=740", width=width, caption="Image Not Available")
 
+# (connect, read) timeouts for image requests, in seconds
+IMAGE_TIMEOUT = (3.05, 10)
+# Cached images are served without a request for this long, then revalidated with ETag/Last-Modified
+IMAGE_FRESH_SECONDS = 24 * 3600
+IMAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+THUMBNAIL_CACHE_ENTRIES = 256
+# An image that could not be loaded is not requested again for this long
+IMAGE_FAILURE_TTL_SECONDS = 300
+# A host's circuit opens after this many consecutive failures and stays open for the cooldown
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 60
+# Background image prefetch: total worker threads, and concurrent requests allowed per host
+PREFETCH_WORKERS = 8
+PREFETCH_PER_HOST = 2
+# JPEG quality for resized derivatives
+DERIVATIVE_QUALITY = 80
+
+
+@st.cache_resource
+def get_http_session():
+    """One pooled session for all outbound image requests, retrying 502/503/504 answers a couple of times."""
+    session = requests.Session()
+    # Timeouts and refused connections are not retried: each would add another IMAGE_TIMEOUT to the
+    # page run, and the circuit breaker has to see every one of them
+    retry = Retry(total=2, connect=0, read=0, other=0, status=2, backoff_factor=0.3,
+                  status_forcelist=(502, 503, 504), allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class ImageCache:
+    """
+    Downloaded image bytes on disk, one file per URL, with an index.json recording each
+    entry's size, validators (ETag, Last-Modified) and last use. Least recently used
+    files are evicted once the total passes max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, "index.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+        except (OSError, ValueError):
+            self._index = {}
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+    def _save_index(self):
+        write_atomic(self.index_path, json.dumps(self._index).encode("utf-8"))
+
+    def get(self, url):
+        """Return (bytes, entry) for a cached URL, or None if missing."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+            try:
+                with open(self._path(url), "rb") as f:
+                    data = f.read()
+            except OSError:
+                del self._index[url]
+                return None
+            entry["used_at"] = time.time()
+            return data, dict(entry)
+
+    def put(self, url, data, etag=None, last_modified=None):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            write_atomic(self._path(url), data)
+            now = time.time()
+            self._index[url] = {"size": len(data), "etag": etag, "last_modified": last_modified,
+                                "fetched_at": now, "used_at": now}
+            total = sum(entry["size"] for entry in self._index.values())
+            for old_url, entry in sorted(self._index.items(), key=lambda item: item[1]["used_at"]):
+                if total <= self.max_bytes:
+                    break
+                total -= entry["size"]
+                del self._index[old_url]
+                try:
+                    os.remove(self._path(old_url))
+                except OSError:
+                    pass
+            self._save_index()
+
+    def revalidated(self, url):
+        """Mark a cached URL fresh again after the server answered 304 Not Modified."""
+        with self._lock:
+            if url in self._index:
+                self._index[url]["fetched_at"] = time.time()
+                self._save_index()
+
+
+class CircuitBreaker:
+    """
+    Per-host failure tracking. After failure_threshold consecutive failures a host's
+    circuit opens and requests to it are refused for cooldown_seconds; then a single
+    probe is let through, which closes the circuit on success or reopens it on failure.
+    """
+
+    def __init__(self, failure_threshold, cooldown_seconds):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._hosts = {}  # host -> {'failures', 'opened_at', 'probing'}
+
+    def allow(self, host):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state['opened_at'] is None:
+                return True
+            if state['probing'] or time.time() - state['opened_at'] < self.cooldown_seconds:
+                return False
+            state['probing'] = True
+            return True
+
+    def record_success(self, host):
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def record_failure(self, host):
+        with self._lock:
+            state = self._hosts.setdefault(host, {'failures': 0, 'opened_at': None, 'probing': False})
+            state['failures'] += 1
+            state['probing'] = False
+            if state['failures'] >= self.failure_threshold:
+                state['opened_at'] = time.time()
+
+
+@st.cache_resource
+def get_circuit_breaker():
+    return CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN_SECONDS)
+
+
+@st.cache_resource
+def get_image_cache():
+    return ImageCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "image_cache"),
+                      IMAGE_CACHE_MAX_BYTES)
+
+
+@st.cache_resource
+def get_thumbnail_cache():
+    """Encoded derivatives keyed by (url, width), in least-recently-used order."""
+    return OrderedDict(), threading.Lock()
+
+
+@st.cache_resource
+def get_image_failures():
+    """(url, width) -> when loading that image last failed, so broken URLs are skipped for a while."""
+    return {}, threading.Lock()
+
+
+def recently_failed(key):
+    failures, lock = get_image_failures()
+    with lock:
+        failed_at = failures.get(key)
+        if failed_at is None:
+            return False
+        if time.time() - failed_at < IMAGE_FAILURE_TTL_SECONDS:
+            return True
+        del failures[key]
+        return False
+
+
+def http_get(url, headers=None):
+    """
+    GET a URL through the shared session and its host's circuit breaker. Returns the
+    response, or None if the circuit is open or the request failed.
+    """
+    host = urlparse(url).netloc
+    breaker = get_circuit_breaker()
+    if not breaker.allow(host):
+        return None
+    try:
+        response = get_http_session().get(url, headers=headers, timeout=IMAGE_TIMEOUT)
+    except requests.RequestException:
+        breaker.record_failure(host)
+        return None
+
+    # A 4xx is the host answering promptly about one URL; only 5xx counts against it
+    if response.status_code >= 500:
+        breaker.record_failure(host)
+    else:
+        breaker.record_success(host)
+    return response
+
+
+def fetch_image_bytes(url):
+    """
+    Image bytes for a URL from the disk cache, going to the network only when the entry
+    is missing or older than IMAGE_FRESH_SECONDS; stale entries are revalidated with a
+    conditional GET and still served if the host can't be reached. Hosts whose circuit
+    is open are not contacted at all.
+    """
+    cache = get_image_cache()
+    cached = cache.get(url)
+    if cached is not None and time.time() - cached[1]["fetched_at"] < IMAGE_FRESH_SECONDS:
+        return cached[0]
+
+    headers = {}
+    if cached is not None:
+        if cached[1].get("etag"):
+            headers["If-None-Match"] = cached[1]["etag"]
+        if cached[1].get("last_modified"):
+            headers["If-Modified-Since"] = cached[1]["last_modified"]
+    response = http_get(url, headers=headers)
+    if response is None:
+        return cached[0] if cached is not None else None
+    if response.status_code == 304 and cached is not None:
+        cache.revalidated(url)
+        return cached[0]
+    if response.status_code == 200:
+        cache.put(url, response.content, etag=response.headers.get("ETag"),
+                  last_modified=response.headers.get("Last-Modified"))
+        return response.content
+    return None
+
+
+def make_derivative(data, width):
+    """
+    Resize image bytes to at most width pixels wide and re-encode them: JPEG at
+    DERIVATIVE_QUALITY, or PNG when the image has transparency. Streamlit passes both
+    formats through unchanged (WebP would be re-encoded by st.image).
+    """
+    img = Image.open(BytesIO(data))
+    # Let the JPEG decoder skip detail that would be thrown away by the resize
+    img.draft("RGB", (width, width))
+    img.thumbnail((width, width * 4))
+    buffer = BytesIO()
+    if img.mode in ("RGBA", "LA") or "transparency" in img.info:
+        img.convert("RGBA").save(buffer, "PNG", optimize=True)
+    else:
+        img.convert("RGB").save(buffer, "JPEG", quality=DERIVATIVE_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def load_derivative(url, width):
+    """
+    Display-ready bytes for an image at a given width. Derivatives are kept in memory by
+    (url, width) and on disk by (source hash, width), so each is encoded once. An image
+    that could not be fetched returns None without a request for IMAGE_FAILURE_TTL_SECONDS.
+    """
+    thumbnails, lock = get_thumbnail_cache()
+    key = (url, width)
+    with lock:
+        if key in thumbnails:
+            thumbnails.move_to_end(key)
+            return thumbnails[key]
+    if recently_failed(key):
+        return None
+
+    data = fetch_image_bytes(url)
+    if data is None:
+        failures, failures_lock = get_image_failures()
+        with failures_lock:
+            failures[key] = time.time()
+        return None
+    cache = get_image_cache()
+    derivative_key = f"derivative:{width}:{hashlib.sha256(data).hexdigest()}"
+    cached = cache.get(derivative_key)
+    if cached is not None:
+        derivative = cached[0]
+    else:
+        derivative = make_derivative(data, width)
+        cache.put(derivative_key, derivative)
+
+    with lock:
+        thumbnails[key] = derivative
+        while len(thumbnails) > THUMBNAIL_CACHE_ENTRIES:
+            thumbnails.popitem(last=False)
+    return derivative
+
+
+class ImagePrefetcher:
+    """
+    Warms the image caches from a bounded thread pool so a panel's images are ready
+    before they are selected; a semaphore per host caps concurrent requests to it.
+    """
+
+    def __init__(self, workers, per_host):
+        self.per_host = per_host
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-prefetch")
+        self._lock = threading.Lock()
+        self._host_slots = {}
+        self._pending = set()
+
+    def _host_slot(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _warm(self, url, width):
+        try:
+            with self._host_slot(url):
+                load_derivative(url, width)
+        except Exception:
+            pass  # A failed prefetch just leaves the image to be fetched when selected
+        finally:
+            with self._lock:
+                self._pending.discard((url, width))
+
+    def warm(self, urls, width):
+        thumbnails, thumbnails_lock = get_thumbnail_cache()
+        for url in urls:
+            key = (url, width)
+            with thumbnails_lock:
+                if key in thumbnails:
+                    continue
+            if recently_failed(key):
+                continue
+            with self._lock:
+                if key in self._pending:
+                    continue
+                self._pending.add(key)
+            self._executor.submit(self._warm, url, width)
+
+
+@st.cache_resource
+def get_image_prefetcher():
+    return ImagePrefetcher(PREFETCH_WORKERS, PREFETCH_PER_HOST)
+
+
+def prefetch_images(info, width=600):
+    """Start warming the images of every option in an info dict (name -> {'image_url': ...})."""
+    get_image_prefetcher().warm([item['image_url'] for item in info.values() if item.get('image_url')], width)
+
+
 # Function to fetch and display an image from URL
 def display_image_from_url(url, caption="", width=600):
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            img = Image.open(BytesIO(response.content))
+        img = load_derivative(url, width)
+        if img is not None:
             st.image(img, width=width, caption=caption)
         else:
             display_placeholder_image(width)
@@ -1639,8 +4085,156 @@ def display_image_from_url(url, caption="", width=600):
 
 
 
-# Load CSV data
-visitors_df, monuments_df, gi_state_df, gi_year_df, budget_df, asi_visitors_df = load_csv_data()
+# Third-party assets are vendored into Streamlit's static folder (served at /app/static
+# when server.enableStaticServing is on) under content-hashed names
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_URL_PATH = "/app/static"
+# The static folder is also registered as a component, whose route serves files with their
+# real MIME types; scripts and stylesheets are loaded from there
+STATIC_COMPONENT_NAME = "vendored_assets"
+SLIDE_IMAGE_WIDTH = 800
+# Google Fonts only serves woff2 files to browsers it recognises
+FONT_CSS_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                       "(KHTML, like Gecko) Chrome/124.0 Safari/537.36")
+
+
+class AssetBundle:
+    """
+    Scripts, stylesheets, fonts and slide images copied from their CDNs into the static
+    folder, with a manifest.json mapping each source URL to its content-hashed file.
+    Assets are vendored in the background the first time they are asked for.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="asset-bundle")
+        self._pending = set()
+        self._texts = {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self._manifest = json.load(f)
+        except (OSError, ValueError):
+            self._manifest = {}
+
+    def _fetch(self, url, headers=None):
+        response = http_get(url, headers=headers)
+        if response is None:
+            raise IOError(f"{url} is unavailable")
+        if response.status_code != 200:
+            raise IOError(f"{url} returned {response.status_code}")
+        return response.content
+
+    def _store(self, url, data, name, ext):
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        file_name = f"{name}.{digest}{ext}"
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            write_atomic(os.path.join(self.directory, file_name), data)
+            self._manifest[url] = {"file": file_name, "digest": digest}
+            write_atomic(self.manifest_path, json.dumps(self._manifest, indent=2).encode("utf-8"))
+
+    def _vendor(self, kind, url):
+        try:
+            url_name = hashlib.sha256(url.encode("utf-8")).hexdigest()[:10]
+            if kind == "text":
+                name, ext = os.path.splitext(os.path.basename(urlparse(url).path))
+                self._store(url, self._fetch(url), name, ext)
+            elif kind == "image":
+                data = make_derivative(self._fetch(url), SLIDE_IMAGE_WIDTH)
+                self._store(url, data, f"slide-{url_name}", ".png" if data.startswith(b"\x89PNG") else ".jpg")
+            elif kind == "fonts":
+                css = self._fetch(url, headers={"User-Agent": FONT_CSS_USER_AGENT}).decode("utf-8")
+                for font_url in sorted(set(re.findall(r"url\((https://[^)]+)\)", css))):
+                    name, ext = os.path.splitext(os.path.basename(urlparse(font_url).path))
+                    self._store(font_url, self._fetch(font_url), f"font-{name}", ext)
+                    css = css.replace(font_url, self.static_url(font_url))
+                self._store(url, css.encode("utf-8"), f"fonts-{url_name}", ".css")
+        except Exception:
+            pass  # The page keeps using the CDN copy; vendoring is retried on a later render
+        finally:
+            with self._lock:
+                self._pending.discard(url)
+
+    def ready(self, kind, url):
+        """True if url has been vendored; otherwise start vendoring it and return False."""
+        with self._lock:
+            entry = self._manifest.get(url)
+            if entry is not None and os.path.exists(os.path.join(self.directory, entry["file"])):
+                return True
+            if url not in self._pending:
+                self._pending.add(url)
+                self._executor.submit(self._vendor, kind, url)
+        return False
+
+    def static_url(self, url):
+        # The ?v= argument makes the static handler send a long-lived Cache-Control header
+        entry = self._manifest[url]
+        return f"{STATIC_URL_PATH}/{entry['file']}?v={entry['digest']}"
+
+    def component_url(self, url, component_name):
+        entry = self._manifest[url]
+        return f"/component/{component_name}/{entry['file']}?v={entry['digest']}"
+
+    def text(self, url):
+        file_name = self._manifest[url]["file"]
+        if file_name not in self._texts:
+            with open(os.path.join(self.directory, file_name), "r", encoding="utf-8") as f:
+                self._texts[file_name] = f.read()
+        return self._texts[file_name]
+
+
+@st.cache_resource
+def get_asset_bundle():
+    return AssetBundle(STATIC_DIR)
+
+
+@st.cache_resource
+def get_static_component():
+    # declare_component needs the directory to exist before anything is vendored into it
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    return components.declare_component(STATIC_COMPONENT_NAME, path=STATIC_DIR)
+
+
+def localize_assets(html):
+    """
+    Point a component's third-party assets at vendored copies. Stylesheets and scripts
+    are loaded from the static component's route, which sends their real MIME types, so
+    the browser caches them instead of receiving them with every render. Google Fonts
+    become @font-face rules over static font files, and <img> sources become resized
+    static images. Anything not vendored yet keeps its CDN URL.
+    """
+    bundle = get_asset_bundle()
+    component_name = get_static_component().name
+    static_serving = st.get_option("server.enableStaticServing")
+
+    def stylesheet(match):
+        if not bundle.ready("text", match.group(1)):
+            return match.group(0)
+        return f'<link rel="stylesheet" href="{bundle.component_url(match.group(1), component_name)}" />'
+
+    def script(match):
+        if not bundle.ready("text", match.group(1)):
+            return match.group(0)
+        return f'<script src="{bundle.component_url(match.group(1), component_name)}"></script>'
+
+    def fonts(match):
+        if not static_serving or not bundle.ready("fonts", match.group(1)):
+            return match.group(0)
+        return bundle.text(match.group(1))
+
+    def image(match):
+        if not static_serving or not bundle.ready("image", match.group(1)):
+            return match.group(0)
+        return f'<img src="{bundle.static_url(match.group(1))}"'
+
+    html = re.sub(r'<link rel="stylesheet" href="(https://[^"]+\.css)"\s*/>', stylesheet, html)
+    html = re.sub(r'<script src="(https://[^"]+\.js)"></script>', script, html)
+    html = re.sub(r"@import url\('(https://fonts\.googleapis\.com/[^']+)'\);", fonts, html)
+    html = re.sub(r'<img src="(https://[^"]+)"', image, html)
+    return html
+
 
 def create_responsible_tourism_swiper():
     # List of Indian states and Union Territories with 5 major tourist places each
@@ -1976,7 +4570,7 @@ def create_responsible_tourism_swiper():
       }});
     </script>
     """
-    return swiper_html
+    return localize_assets(swiper_html)
 
 
 # Enhanced Swiper component with web-accessible images
@@ -2216,7 +4810,7 @@ def create_enhanced_swiper():
       }});
     </script>
     """
-    return swiper_html
+    return localize_assets(swiper_html)
 
 # Custom CSS for modern navigation styling
 def load_custom_css():
@@ -2465,6 +5059,9 @@ def integrate_with_existing_app():
     
     # Create the modern navigation (replaces your old sidebar code)
     page = create_custom_navigation()
+
+    # Warehouse tables are only fetched when the page first reads them
+    datasets = PageDatasets(PAGE_DATASETS.get(page, ()))
     
     if page == "Bharat Bot":
         bharat_explorer()
@@ -2545,6 +5142,7 @@ def integrate_with_existing_app():
     
         # Additional Visual: ASI Visitors Trend from CSV
         st.markdown("<h2 class='sub-header'>ASI Monuments Visitor Trends</h2>", unsafe_allow_html=True)
+        asi_visitors_df = datasets['asi_visitors']
         if not asi_visitors_df.empty and 'Year' in asi_visitors_df.columns:
                 fig_asi = go.Figure()
                 if 'Number of Visitors - Domestic' in asi_visitors_df.columns:
@@ -2645,45 +5243,9 @@ def integrate_with_existing_app():
                     painting_data['Art_Form'].tolist()
                 )
             
-                art_info = {
-                    'Madhubani': {
-                        'description': 'Madhubani painting, also known as Mithila painting, originates from Bihar’s Mithila region. It uses geometric patterns, natural dyes, and vibrant colors to depict mythological themes and daily life.',
-                        'image_url': 'https://media-cdn.tripadvisor.com/media/photo-s/1b/39/bf/a2/madhubani-painting-is.jpg'
-                    },
-                    'Warli': {
-                        'description': 'Warli painting is a tribal art form from Maharashtra, using simple geometric shapes like circles, triangles, and squares. Painted with white pigment on a mud base, it illustrates social events and nature.',
-                        'image_url': 'https://cdn.magicdecor.in/com/2024/01/17124731/Village-Life-Ancient-Indian-Warli-Art-Wallpaper-for-Wall-710x488.jpg'
-                    },
-                    'Kalamkari': {
-                        'description': 'Kalamkari, from Andhra Pradesh, is an ancient hand-painting style on cotton or silk using a bamboo pen. Its 23-step process creates intricate designs, often depicting mythological narratives.',
-                        'image_url': 'https://i.pinimg.com/736x/ad/35/65/ad35659c094db9a255bd57255da7d3a3.jpg'
-                    },
-                    'Tanjore': {
-                        'description': 'Tanjore painting, from Thanjavur, Tamil Nadu, is a classical art form known for vibrant colors, gold foil, and inlaid gems. It typically portrays Hindu deities and religious themes.',
-                        'image_url': 'https://img1.wsimg.com/isteam/ip/bd95d888-15fd-4e22-9514-3b3e7856faa7/d1fc0d4d-12eb-4019-a7aa-f00566d84891.jpg'
-                    },
-                    'Pattachitra': {
-                        'description': 'Pattachitra, a cloth-based scroll painting from Odisha and West Bengal, features intricate details and vibrant colors, depicting Hindu mythological stories and folktales.',
-                        'image_url': 'https://i0.wp.com/www.craftsodisha.com/wp-content/uploads/2019/03/p00628-141323-radha-krishna-dancing-monochrome-pattachitra-art.jpg'
-                    },
-                    'Gond': {
-                        'description': 'Gond painting, a tribal art from Madhya Pradesh, uses intricate patterns of dots, dashes, and lines to represent nature, folklore, and tribal life in vibrant colors.',
-                        'image_url': 'https://m.media-amazon.com/images/I/61Kv77ptK1L._AC_UF1000,1000_QL80_.jpg'
-                    },
-                    'Phad': {
-                        'description': 'Phad painting is a religious scroll painting from Rajasthan, depicting folk epics and local deities on long cloth pieces, using bold colors and narrative storytelling.',
-                        'image_url': 'https://www.bridgebharat.com/cdn/shop/files/BBP0002RPHD00023_533x.jpg?v=1720843220'
-                    },
-                    'Miniature': {
-                        'description': 'Miniature painting, prominent in Rajasthan, features intricate details and delicate brushwork. Rajput and Mughal styles depict royal life, mythology, and nature.',
-                        'image_url': 'https://m.media-amazon.com/images/I/61tUr+HkaoL._AC_UF1000,1000_QL80_.jpg'
-                    },
-                    "Pahari Painting": {
-                        "description": "Pahari painting, originating from the hill states of Himachal Pradesh and Jammu, is known for its delicate, lyrical style, vibrant colors, and themes of love, mythology, and nature, often depicting Krishna and Radha.",
-                        "image_url": "https://hpgeneralstudies.com/wp-content/uploads/2016/11/Pahari-Styles-of-Painting-Kangra-painting-himachal-pradesh-general-knowledge.jpg"
-                    }
-                }
+                art_info = PAINTING_INFO
             
+                prefetch_images(art_info, width=400)
                 if selected_art in art_info:
                     st.markdown(f"### {selected_art} Painting")
                     st.markdown(art_info[selected_art]['description'])
@@ -2713,45 +5275,20 @@ def integrate_with_existing_app():
             if combined_data.empty:
                 st.error("No valid data with latitude and longitude available to display on the map.")
             else:
-                # Create the Folium map
-                m = folium.Map(location=[20.5937, 78.9629], zoom_start=5, tiles='cartodbpositron')
-                marker_cluster = MarkerCluster().add_to(m)
-
-                # Iterate through combined data to create markers
-                for _, row in combined_data.iterrows():
-                    # Initialize popup content
-                    popup_content = ""
-                    
-                    if row['source'] == 'art':
-                        # Art-related information
-                        popup_content = f"""
-                        <b>{row['Art_Form']}</b><br>
-                        Region: {row['Region']}<br>
-                        Popularity: {row['Popularity_Score']}<br>
-                        Category: {row['Category']}
-                        """
-                        tooltip = row['Art_Form']
-                    elif row['source'] == 'craft':
-                        # Craft-related information
-                        popup_content = f"""
-                        <b>{row['Craft']}</b><br>
-                        State: {row['State']}<br>
-                        Artisans Count: {row['Artisans_Count']}<br>
-                        Annual Revenue (Cr): {row['Annual_Revenue_Cr']}
-                        """
-                        tooltip = row['Craft']
-
-                    # Add marker to the map
-                    folium.Marker(
-                        location=[row['lat'], row['lon']],
-                        popup=folium.Popup(popup_content, max_width=300),
-                        tooltip=tooltip,
-                        icon=folium.Icon(color='orange' if row['source'] == 'art' else 'blue', icon='paint-brush' if row['source'] == 'art' else 'scissors', prefix='fa')
-                    ).add_to(marker_cluster)
-
-                # Render the map in Streamlit
-                map_html = m._repr_html_()
-                components.html(map_html, height=600)
+                # Art and craft markers on one map; the rows are built only when the map is not cached
+                show_marker_map(
+                    ('art_craft', dataset_version(combined_data)), len(combined_data),
+                    lambda: pd.concat([
+                        marker_rows(combined_data[combined_data['source'] == 'art'], 'Art_Form',
+                                    [('Region', 'Region'), ('Popularity', 'Popularity_Score'), ('Category', 'Category')],
+                                    color='orange', icon='paint-brush'),
+                        marker_rows(combined_data[combined_data['source'] == 'craft'], 'Craft',
+                                    [('State', 'State'), ('Artisans Count', 'Artisans_Count'),
+                                     ('Annual Revenue (Cr)', 'Annual_Revenue_Cr')],
+                                    color='blue', icon='scissors'),
+                    ], ignore_index=True),
+                    key='art_craft_map',
+                )
                 
     
         with art_category[1]:
@@ -2775,113 +5312,9 @@ def integrate_with_existing_app():
                     performing_arts['Art_Form'].tolist()
                 )
             
-                art_info = {
-                    'Carnatic': {
-                        'description': 'Carnatic music is a system of music commonly associated with South India, including the modern states of Karnataka, Andhra Pradesh, Telangana, Kerala and Tamil Nadu.',
-                        'image_url': 'https://centerforworldmusic.org/wp-content/uploads/2021/02/Subbulakshmi-Concert.jpg'
-                    },
-                    'Kathakali': {
-                        'description': 'Kathakali is a classical dance form from Kerala that combines dance, music, and acting. Performers use elaborate costumes, makeup, and face masks to portray characters from Hindu epics.',
-                        'image_url': 'https://miro.medium.com/v2/resize:fit:1024/1*lhWHQ6Oq1gowqn_uOtlfbg.jpeg'
-                    },
-                    'Bharatanatyam': {
-                        'description': 'Bharatanatyam is one of the oldest classical dance forms of India, originating in Tamil Nadu. It is known for its grace, purity, tenderness, and sculpturesque poses.',
-                        'image_url': 'https://5.imimg.com/data5/BM/CE/WE/SELLER-92722583/bharatanatyam-arangetram-photoshoot.jpg'
-                    },
-                    'Kathak': {
-                        'description': 'Kathak is one of the eight major forms of Indian classical dance that originated from North India. It is characterized by rhythmic footwork, rapid spins, and expressive storytelling.',
-                        'image_url': 'https://i.pinimg.com/564x/8b/94/fc/8b94fc84c81c6acddddf1644db60990f.jpg'
-                    },
-                    'Odissi': {
-                        'description': 'Odissi is a classical dance form from Odisha that emphasizes fluid movements, emotional expressions, and intricate footwork. It primarily portrays themes related to Lord Jagannath and other regional deities.',
-                        'image_url': 'https://lotusarise.com/wp-content/uploads/2024/03/Odissi_Performance-632x1024.jpeg'
-                    },
-                    'Kuchipudi': {
-                        'description': 'Kuchipudi is a classical dance form from Andhra Pradesh that involves rituals, invocations, rhythm, and expressive communication of spiritual ideas.',
-                        'image_url': 'https://i.pinimg.com/1200x/6a/44/d2/6a44d248445f651f482248f39119bf78.jpg'
-                    },
-                    'Hindustani': {
-                        'description': 'Hindustani classical music is a North Indian classical music tradition that evolved from ancient Hindu musical traditions, Vedic philosophy, and Persian influences.',
-                        'image_url': 'https://blogs.lawrence.edu/news/files/2017/04/Zahir-Hussain_newsblog.jpg'
-                    },
-                    "Bihu": {
-                        "description": "Bihu is a folk dance from Assam, performed during the Bihu festival. It is characterized by brisk steps, rapid hand movements, and vibrant costumes, celebrating the Assamese New Year and agricultural cycles.",
-                        "image_url": "https://i.pinimg.com/736x/4c/88/94/4c8894faf7b15fc026f98f646436c6b2.jpg"
-                    },
-                    "Ghoomar": {
-                        "description": "Ghoomar is a traditional folk dance from Rajasthan, performed by women in swirling skirts. It is known for its graceful movements and vibrant attire, often performed during festivals and celebrations.",
-                        "image_url": "https://i.pinimg.com/736x/d9/83/4a/d9834af8475da9aa305f679dcbb6f3e5.jpg"
-                    },
-                    "Chhau": {
-                        "description": "Chhau is a semi-classical dance form from eastern India, particularly Jharkhand, Odisha, and West Bengal. It combines martial arts, acrobatics, and storytelling, often depicting scenes from Hindu epics.",
-                        "image_url": "https://photos.smugmug.com/Photography-still-life-culture/Photography-Dances-of-India-Chhau-Dance/i-qxgH7fs/0/NNnxW5vFTFPQrbZDdZfVsPTxt4dqSpH2nPc7B77Wm/XL/Kartik%201-XL.jpg"
-                    },
-                    "Garba": {
-                        "description": "Garba is a folk dance from Gujarat, performed during the Navratri festival. It involves circular movements and rhythmic clapping, symbolizing devotion to Goddess Durga.",
-                        "image_url": "https://www.livemint.com/lm-img/img/2024/10/03/600x338/2-0-305167323--ABH0216-men-0_1680607324691_1727968179214.jpg"
-                    },
-                    "Lavani": {
-                        "description": "Lavani is a traditional folk dance from Maharashtra, known for its energetic and sensuous movements. It is often performed to the beats of the dholki and combines dance with storytelling.",
-                        "image_url": "https://static.toiimg.com/photo/51616060.cms?imgsize=111336"
-                    },
-                    "Bodo Dance": {
-                        "description": "Bodo dance is a folk dance performed by the Bodo community of Assam. It is characterized by vibrant costumes and rhythmic movements, often celebrating agricultural and cultural festivals.",
-                        "image_url": "https://www.contentgarden.in/PICTURES/270123/WATERMARK/20230127002L.jpg"
-                    },
-                    "Sattriya": {
-                        "description": "Sattriya is a classical dance form from Assam, originating in the Vaishnavite monasteries. It combines grace, spirituality, and storytelling, depicting themes from Hindu mythology.",
-                        "image_url": "https://i0.wp.com/rotarynewsonline.org/wp-content/uploads/2019/07/545px-Satriya_dance_performance_at_Guwahati_Rabindra_Bhawan.jpg?ssl=1"
-                    },
-                    "Yakshagana": {
-                        "description": "Yakshagana is a traditional theatre form from Karnataka, combining dance, music, and drama. Performers wear elaborate costumes and makeup to enact stories from Indian epics.",
-                        "image_url": "https://orunewculture.com/wp-content/uploads/2025/01/yaksh.webp"
-                    },
-                    "Thang-Ta": {
-                        "description": "Thang-Ta is a martial art dance form from Manipur, combining graceful movements with combat techniques. It is performed with swords and spears, showcasing strength and agility.",
-                        "image_url": "https://cdn-images.prepp.in/public/image/5fa7ca05557ad47e2753cde27c4431ef.png?tr=w-512,h-327,c-force"
-                    },
-                    "Bhangra": {
-                        "description": "Bhangra is a lively folk dance from Punjab, traditionally performed by men during harvest festivals. It is characterized by energetic movements, vibrant costumes, and the beat of the dhol.",
-                        "image_url": "https://cdn.britannica.com/04/60404-050-77D978DF/Bhangra-folk-dance-region-Punjab-India-Pakistan.jpg"
-                    },
-                    "Giddha": {
-                        "description": "Giddha is a folk dance performed by women in Punjab, known for its lively and expressive movements. It often involves singing traditional songs and storytelling through dance.",
-                        "image_url": "https://indianetzone.wordpress.com/wp-content/uploads/2023/06/1541273538_giddha-dance1.jpg?w=1024"
-                    },
-                    "Cheraw": {
-                        "description": "Cheraw is a traditional bamboo dance from Mizoram, performed by women. It involves rhythmic stepping between moving bamboo sticks, showcasing coordination and grace.",
-                        "image_url": "https://pbs.twimg.com/media/FCnyH-YVQAQ3kOz?format=jpg&name=large"
-                    },
-                    "Fugdi": {
-                        "description": "Fugdi is a folk dance from Goa, performed by women during festivals like Ganesh Chaturthi. It involves circular movements and singing, reflecting joy and community spirit.",
-                        "image_url": "https://media.assettype.com/gomantaktimes%2F2022-11%2F69306823-68e1-4166-8eb3-698d0d1e473f%2F1.png"
-                    },
-                    "Dalkhai": {
-                        "description": "Dalkhai is a folk dance from Odisha, performed by women during festivals. It is known for its vibrant movements and songs that narrate stories of love and nature.",
-                        "image_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/0/02/Sambalpuri_Dance.JPG/1200px-Sambalpuri_Dance.JPG"
-                    },
-                    "Tharu Folk": {
-                        "description": "Tharu folk dance is performed by the Tharu community in Uttar Pradesh and Uttarakhand. It reflects their cultural heritage, with rhythmic movements celebrating agricultural life.",
-                        "image_url": "https://staticimg.amarujala.com/assets/images/gaonjunction.com/2023/11/16/jhamara-lkanataya-ka-parasatata-thata-vavasha-lkashhama-va-anaya-thanpr-janajata-ka-lga_1700144716.jpeg?w=414&dpr=1.0&q=50"
-                    },
-                    "Santhali Dance": {
-                        "description": "Santhali dance is a tribal folk dance performed by the Santhal community in Jharkhand, Odisha, and West Bengal. It is characterized by vibrant group movements and traditional music.",
-                        "image_url": "https://live.staticflickr.com/7606/16147402643_4586ed4b6f_c.jpg"
-                    },
-                    "Rabindra Sangeet": {
-                        "description": "Rabindra Sangeet refers to songs composed by Rabindranath Tagore, often accompanied by dance in West Bengal. The dance complements the soulful music, expressing poetic themes.",
-                        "image_url": "https://assets.thehansindia.com/hansindia-bucket/7460_Rabindra_Sangeet.jpg"
-                    },
-                    "Koli Dance": {
-                        "description": "Koli dance is a folk dance performed by the Koli fishing community in Maharashtra. It reflects their coastal culture with lively steps and songs about the sea.",
-                        "image_url": "https://i.pinimg.com/736x/e2/08/18/e20818253fc1a887292f163b6882b904.jpg"
-                    },
-                    "Tusu Parab": {
-                        "description": "Tusu Parab is a folk dance performed during the Tusu festival in Jharkhand and West Bengal. It involves singing and dancing to celebrate the harvest season.",
-                        "image_url": "https://utsav.gov.in/public/uploads/event_picture_image/event_686/16607352252119234166.jpg"
-                    }
-                }
+                art_info = PERFORMING_ART_INFO
                             
+                prefetch_images(art_info, width=400)
                 if selected_art in art_info:
                     st.markdown(f"### {selected_art}")
                     st.markdown(art_info[selected_art]['description'])
@@ -2933,149 +5366,9 @@ def integrate_with_existing_app():
                     crafts_data['Craft'].tolist()
                 )
             
-                craft_info = {
-                    'Kanjivaram Silk': {
-                        'description': 'Kanjivaram silk sarees are woven from pure mulberry silk and are known for their heavy body, vibrant colors, wide contrast borders, and rich pallu adorned with intricate zari work.',
-                        'image_url': 'https://www.singhanias.in/cdn/shop/articles/1e31d5353b95970dd2d9f4c8a4abc755.jpg?v=1646740243'
-                    },
-                    'Pashmina': {
-                        'description': 'Pashmina refers to a fine type of Kashmir wool and the textiles made from it. Known for its exceptional warmth, softness, and lightweight quality, it is derived from the fine undercoat fibers of the Changthangi goat.',
-                        'image_url': 'https://media.istockphoto.com/id/1429359526/photo/lao-silk-scarf-at-night-market-at-lunag-prabang-with-wat-may-souvannapoumaram-in-the.jpg?s=612x612&w=0&k=20&c=ITcJxlyoupDZznv-X3qOxwBB74FASOXm5oPDSjfFyzc='
-                    },
-                    'Chikankari': {
-                        'description': 'Chikankari is a traditional embroidery style from Lucknow, Uttar Pradesh. It involves white thread embroidery on fine white cotton fabric, creating a shadow work effect.',
-                        'image_url': 'https://t3.ftcdn.net/jpg/12/14/79/94/360_F_1214799416_Jqnavj8Hc866yW3JZS1z1icxcOWs4l8B.jpg'
-                    },
-                    'Blue Pottery': {
-                        'description': 'Blue Pottery is a traditional craft of Jaipur, Rajasthan. It is made from quartz stone powder, not clay, and is known for its vibrant blue dye and distinctive Persian patterns.',
-                        'image_url': 'https://media.istockphoto.com/id/497537972/photo/chinese-style-porcelain-pottery.jpg?s=612x612&w=0&k=20&c=hr702O-4YrezRL6L4ZyotCNSMdM9jT5cwPf0EVsK2xU='
-                    },
-                    'Brass Work': {
-                        'description': 'Brass work is a significant craft tradition in Uttar Pradesh, particularly in Moradabad, which is known as the "Brass City." Artisans create intricately designed utensils, decorative items, and religious artifacts.',
-                        'image_url': 'https://www.gitagged.com/wp-content/uploads/2022/10/MBC-002-RAM-DARBHAR-BIG-2.jpg'
-                    },
-                    'Bidriware': {
-                        'description': 'Bidriware is a metal handicraft from Bidar, Karnataka. It involves inlaying silver or gold on a blackened metal alloy of zinc and copper, creating striking contrast designs.',
-                        'image_url': 'https://www.ibef.org/experienceindia/images/bidriware/bidri-image-1.png'
-                    },
-                    'Bandhani': {
-                        'description': 'Bandhani is a tie-dye textile technique from Gujarat and Rajasthan. It involves tying portions of cloth before dyeing, resulting in intricate patterns of dots.',
-                        'image_url': 'https://t3.ftcdn.net/jpg/09/49/56/84/360_F_949568481_ZVT2qxC7FmtZwOyDoBndGiVbV6ha5ZQF.jpg'
-                    },
-                    'Phulkari': {
-                        'description': 'Phulkari is an embroidery technique from Punjab, where colorful threads are used to create floral patterns on shawls and other garments. The term means "flower work" in Punjabi.',
-                        'image_url': 'https://static.fibre2fashion.com//articleresources/images/57/5630/AdobeStock_968996166-s_Small.jpg'
-                    },
-                    'Terracotta': {
-                        'description': 'Terracotta crafts involve creating objects from baked clay. In West Bengal, particularly in Bankura district, artisans are famous for creating the Bankura horse and other figurines.',
-                        'image_url': 'https://cdn.shopify.com/s/files/1/0486/7712/6297/files/Add-a-subheading_2_600x600.webp?v=1687850806'
-                    },
-                    'Dokra': {
-                        'description': 'Dokra is a non-ferrous metal casting technique using the lost-wax casting method. It is practiced in tribal areas of Chhattisgarh, West Bengal, and Odisha, creating distinctive figurines.',
-                        'image_url': 'https://www.gitagged.com/wp-content/uploads/2020/10/Bastar-Dhokra-Swan-Art-GiTAGGED-4.jpg'
-                    },
-                    'Chanderi': {
-                        'description': 'Chanderi is a traditional handwoven fabric made in Chanderi, Madhya Pradesh. Known for its sheer texture and lightweight, it often features gold and silver zari work.',
-                        'image_url': 'https://www.shutterstock.com/image-photo/hand-weaving-silk-handloom-sarees-600nw-2552045721.jpg'
-                    },
-                    'Zardozi': {
-                        'description': 'Zardozi is a form of heavy and elaborate metal embroidery on fabric. It originated in Persia and was brought to India during the Mughal era. It uses gold and silver threads to create intricate designs.',
-                        'image_url': 'https://5.imimg.com/data5/WW/TR/YB/ANDROID-49526605/imtemp1573397807473-png-500x500.png'
-                    },
-                    'Meenakari': {
-                        'description': 'Meenakari is the art of coloring and ornamenting the surface of metals by fusing brilliant colors in an intricate design. Rajasthan, particularly Jaipur, is famous for this craft.',
-                        'image_url': 'https://i.pinimg.com/736x/5d/75/5e/5d755e1d31fd4dbe44fe3827c869c0e7.jpg'
-                    },
-                    'Aari Work': {
-                        'description': 'Aari work is a type of embroidery done using a hooked needle (aari) from Kashmir. It produces a chain stitch on the fabric surface and is characterized by minute detailing and elaborate patterns.',
-                        'image_url': 'https://i.ytimg.com/vi/HXkfSlhzb0A/hq720.jpg?sqp=-oaymwEhCK4FEIIDSFryq4qpAxMIARUAAAAAGAElAADIQj0AgKJD&rs=AOn4CLDyDZqGgBth1bQP_4-_7BS_zjtBUg'
-                    },
-                    'Kasuti': {
-                        'description': 'Kasuti is a traditional form of folk embroidery from Karnataka. It involves intricate stitches to create geometric patterns on clothing, particularly sarees.',
-                        'image_url': 'https://www.hunarcourses.com/blog/wp-content/uploads/2022/08/Image-1-13.jpg'
-                    },
-                    'Bamboo Craft': {
-                        'description': 'Bamboo Craft is a traditional art form widely practiced in Assam and other northeastern states of India. Artisans create intricate baskets, mats, furniture, and decorative items using sustainable bamboo, known for its flexibility and strength.',
-                        'image_url': 'https://5.imimg.com/data5/IH/OU/MY-12266299/bamboo-work-handicraft-500x500.jpg'
-                    },
-                    'Assam Silk': {
-                        'description': 'Assam Silk, particularly Eri, Muga, and Pat silk, is renowned for its rich texture and natural sheen. Woven in Assam, these silks are used for traditional garments like Mekhela Chador, celebrated for their durability and elegance.',
-                        'image_url': 'https://media.assettype.com/outlooktraveller%2Fimport%2Foutlooktraveller%2Fpublic%2Fuploads%2Farticles%2Ftravelnews%2F2018%2F06%2Fassamese-traditional-assam-silk-featured.jpg'
-                    },
-                    'Stone Carving': {
-                        'description': 'Stone Carving is a traditional craft practiced across India, especially in Odisha and Rajasthan. Artisans sculpt intricate designs on marble, sandstone, and other stones to create statues, temple architecture, and decorative pieces.',
-                        'image_url': 'https://i.pinimg.com/564x/0b/41/26/0b4126948b738c40103e957585eb05b3.jpg'
-                    },
-                    'Kalamkari': {
-                        'description': 'Kalamkari is a traditional hand-painting or block-printing technique from Andhra Pradesh and Telangana, using natural dyes to create intricate narrative designs on cotton or silk, often depicting mythological themes.',
-                        'image_url': 'https://curatorscart.com/cdn/shop/files/hand-painted-blue-orange-red-kalamkari-wall-plate.jpg?v=1695364899'
-                    },
-                    'Puppetry': {
-                        'description': 'Puppetry, particularly Kathputli from Rajasthan, is a traditional performing art using wooden puppets adorned with colorful costumes. These puppets are used to narrate folktales and historical stories through performances.',
-                        'image_url': 'https://media.licdn.com/dms/image/v2/D5612AQH7Wryn-xzTog/article-cover_image-shrink_600_2000/article-cover_image-shrink_600_2000/0/1726808503325?e=2147483647&v=beta&t=TO0eLlFZljF5niQfbkn5APvpMp9Ou4EXh4krCPu8kPg'
-                    },
-                    'Applique Work': {
-                        'description': 'Applique Work, prominent in Gujarat and Odisha, involves stitching colorful fabric patches onto a base cloth to create vibrant patterns, often used for wall hangings, canopies, and traditional garments like Pipli applique.',
-                        'image_url': 'https://www.utsavpedia.com/wp-content/uploads/2013/05/3429d5d3507b40c594d235c73e13a5c7.jpg'
-                    },
-                    'Muga Silk': {
-                        'description': 'Muga Silk, exclusive to Assam, is a golden-yellow silk known for its natural luster and durability. Used in traditional Assamese attire, it is one of the costliest silks, prized for its cultural significance.',
-                        'image_url': 'https://www.utsavpedia.com/wp-content/uploads/2013/06/Muga-Silk-Fabric3.jpg'
-                    },
-                    'Wood Carving': {
-                        'description': 'Wood Carving is a traditional craft in states like Kerala and Karnataka, where artisans create detailed sculptures, furniture, and decorative panels, often featuring mythological figures and intricate floral patterns.',
-                        'image_url': 'https://www.shutterstock.com/image-photo/wood-carving-tools-carpenters-hands-600nw-2403216529.jpg'
-                    },
-                    'Kani Shawl': {
-                        'description': 'Kani Shawls from Jammu & Kashmir are woven with fine Pashmina wool using the twill-tapestry technique, featuring intricate multicolored patterns that reflect the region’s rich textile heritage.',
-                        'image_url': 'https://www.pashwrap.com/cdn/shop/articles/Pashmina_Kani_Shawl.jpg?v=1697614181'
-                    },
-                    'Dhokra': {
-                        'description': 'Dhokra is an ancient metal casting craft from Chhattisgarh and Odisha, using the lost-wax technique to create intricate brass figurines, jewelry, and decorative items with a rustic aesthetic.',
-                        'image_url': 'https://i0.wp.com/utkalikaodisha.com/wp-content/uploads/2024/07/11.jpg?resize=600%2C600&ssl=1'
-                    },
-                    'Bagh Print': {
-                        'description': 'Bagh Print is a traditional block-printing technique from Madhya Pradesh, using natural dyes and hand-carved wooden blocks to create vibrant geometric and floral patterns on cotton and silk fabrics.',
-                        'image_url': 'https://s7ap1.scene7.com/is/image/incredibleindia/bagh-prints-of-madhya-pradesh-1-craft-body?qlt=82&ts=1726641261156'
-                    },
-                    'Kashida': {
-                        'description': 'Kashida is an embroidery style from Jammu & Kashmir, featuring intricate thread work with floral and paisley motifs, often used to embellish shawls, sarees, and home furnishings.',
-                        'image_url': 'https://i.pinimg.com/736x/03/3e/96/033e96a5f80ac0b85abf69de11346b02.jpg'
-                    },
-                    'Sujani': {
-                        'description': 'Sujani is a traditional quilt-making craft from Bihar, where layers of old cloth are stitched together with colorful threads to create vibrant quilts and bedspreads, often depicting social themes.',
-                        'image_url': 'https://akm-img-a-in.tosshub.com/indiatoday/images/story/202404/sujani-084407387-16x9_0.jpg?VersionId=LeAtqhxQCWQthiG.ezumwiO0IRl2rY3V'
-                    },
-                    'Marble Inlay': {
-                        'description': 'Marble Inlay, practiced in Rajasthan, involves embedding semi-precious stones into marble to create intricate floral and geometric designs, commonly seen in tabletops and decorative items.',
-                        'image_url': 'https://themarbleartstudio.com/wp-content/uploads/2022/08/Patten-Inlay-Work3.jpg'
-                    },
-                    'Kullu Shawl': {
-                        'description': 'Kullu Shawls from Himachal Pradesh are handwoven woolen shawls known for their vibrant geometric patterns and bright colors, often used for warmth and cultural expression.',
-                        'image_url': 'https://5.imimg.com/data5/SELLER/Default/2020/11/GW/DK/NO/117116792/kullu-shawls-500x500.jpg'
-                    },
-                    'Pithora Painting': {
-                        'description': 'Pithora Painting is a ritualistic tribal art form from Gujarat, created by the Rathwa and Bhil tribes. These vibrant wall paintings depict mythological stories and are considered sacred.',
-                        'image_url': 'https://www.memeraki.com/cdn/shop/articles/the-ritual-art-of-pithora-wall-paintings-420449_1200x1200.jpg?v=1661329608'
-                    },
-                    'Jute Craft': {
-                        'description': 'Jute Craft, popular in West Bengal, involves creating eco-friendly products like bags, mats, and home decor using durable jute fibers, known for their sustainability and rustic appeal.',
-                        'image_url': 'https://images-na.ssl-images-amazon.com/images/I/616PjMqbBpL.jpg'
-                    },
-                    'Shell Craft': {
-                        'description': 'Shell Craft, practiced in coastal regions like Goa, uses seashells to create decorative items, jewelry, and home furnishings, showcasing intricate designs inspired by marine life.',
-                        'image_url': 'https://i.pinimg.com/474x/62/93/1b/62931bb9db2d7ed6d20a355586896c04.jpg'
-                    },
-                    'Sohrai Painting': {
-                        'description': 'Sohrai Painting is a tribal art form from Jharkhand, traditionally painted on mud walls during festivals. It features natural motifs like animals and plants, using earth-based colors.',
-                        'image_url': 'https://dirumsbucket.blob.core.windows.net/dirumsbucket/download-2022.1.23_19.7.26-dirums-(dirums.com)/media/sohrai-painting-peacock-natural-color-on-handmade-paper-painting-for-living-room-office-worspace-dirums-frame-1.jpg'
-                    },
-                    'Leather Craft': {
-                        'description': 'Leather Craft, prevalent in Andhra Pradesh and Rajasthan, involves creating durable goods like footwear, bags, and decorative items using embossed and dyed leather, often with intricate patterns.',
-                        'image_url': 'https://www.truetridentleather.com/wp-content/uploads/2020/04/custom-leather-working.jpg'
-                    }
-                }
+                craft_info = CRAFT_INFO
             
+                prefetch_images(craft_info, width=400)
                 if selected_craft in craft_info:
                     st.markdown(f"### {selected_craft}")
                     st.markdown(craft_info[selected_craft]['description'])
@@ -3093,6 +5386,7 @@ def integrate_with_existing_app():
         
             # Additional Visual: GI Registrations from CSV
             st.markdown("<h2 class='sub-header'>Geographical Indications (GI) for Crafts</h2>", unsafe_allow_html=True)
+            gi_state_df = datasets['gi_state']
             if not gi_state_df.empty:
                 fig_gi = px.bar(gi_state_df, x='State/UT', y='Total', color='State/UT',
                                 title='GI Registrations by State (2014-2023)',
@@ -3157,285 +5451,9 @@ def integrate_with_existing_app():
                     heritage_data['Site'].tolist()
                 )
             
-                site_info = {
-                    'Taj Mahal': {
-                        'description': 'Built by Emperor Shah Jahan in memory of his beloved wife Mumtaz Mahal, the Taj Mahal is a masterpiece of Mughal architecture, combining elements from Persian, Ottoman Turkish, and Indian architectural styles.',
-                        'image_url': 'https://static.toiimg.com/photo/62022874.cms',
-                        'year': '1983',
-                        'fact': 'The Taj Mahal changes its color subtly throughout the day, appearing pinkish in the morning, white during the day, and golden at night under moonlight.'
-                    },
-                    'Ajanta Caves': {
-                        'description': 'The Ajanta Caves are 30 rock-cut Buddhist cave monuments dating from the 2nd century BCE to about 480 CE. The caves include paintings and sculptures considered to be masterpieces of Buddhist religious art.',
-                        'image_url': 'https://cdn.getyourguide.com/img/tour/5b881032cf989.jpeg/146.jpg',
-                        'year': '1983',
-                        'fact': 'The Ajanta Caves were forgotten until 1819 when a British officer accidentally discovered them while hunting tigers.'
-                    },
-                    'Ellora Caves': {
-                        'description': 'The Ellora Caves are a UNESCO World Heritage Site featuring Buddhist, Hindu and Jain cave temples and monasteries, built between the 6th and 10th century CE. The most remarkable is the Kailasa Temple, a huge monolithic structure carved out of a single rock.',
-                        'image_url': 'https://www.worldhistory.org/img/c/p/1200x900/4565.jpg',
-                        'year': '1983',
-                        'fact': 'The Kailasa Temple at Ellora is carved out of a single rock, making it one of the largest monolithic structures in the world.'
-                    },
-                    'Agra Fort': {
-                        'description': 'Agra Fort is a historical fort built by Akbar in 1565. It was the main residence of the emperors of the Mughal Dynasty until 1638 when the capital was shifted from Agra to Delhi.',
-                        'image_url': 'https://www.holidify.com/images/cmsuploads/compressed/6799416268_822e8d98f5_b_20180814155943.jpg',
-                        'year': '1983',
-                        'fact': 'Shah Jahan, who built the Taj Mahal, was imprisoned by his son Aurangzeb in Agra Fort. He spent his last years gazing at the Taj Mahal from a window in the fort.'
-                    },
-                    'Khajuraho': {
-                        'description': 'The Khajuraho Group of Monuments are a group of Hindu and Jain temples known for their nagara-style architectural symbolism and erotic sculptures. Built between 950 and 1050 by the Chandela dynasty, only about 20 temples remain from the original 85.',
-                        'image_url': 'https://theindosphere.com/wp-content/uploads/2024/08/image-4.jpg',
-                        'year': '1986',
-                        'fact': 'Only about 10% of the sculptures at Khajuraho are erotic in nature, while the rest depict various aspects of everyday life and mythological narratives.'
-                    },
-                    'Fatehpur Sikri': {
-                        'description': 'Fatehpur Sikri, built by Emperor Akbar in the late 16th century, served as the capital of the Mughal Empire for a short time. The city is an architectural masterpiece blending Persian, Indian, and Islamic influences.',
-                        'image_url': 'https://www.raffaeleferrari.com/wp-content/uploads/2020/03/Fateh.jpg',
-                        'year': '1986',
-                        'fact': 'Fatehpur Sikri was abandoned shortly after its completion due to water scarcity in the region.'
-                    },
-                    'Mahabalipuram': {
-                        'description': 'Mahabalipuram, also known as Mamallapuram, is famous for its rock-cut temples and sculptures created by the Pallava dynasty in the 7th and 8th centuries. The site features the Shore Temple and remarkable bas-relief carvings.',
-                        'image_url': 'https://live.staticflickr.com/5654/23173189005_86a20afdf6_b.jpg',
-                        'year': '1984',
-                        'fact': 'The “Descent of the Ganges” sculpture at Mahabalipuram is one of the largest open-air rock reliefs in the world.'
-                        },
-                    'Kaziranga National Park': {
-                        'description': 'Kaziranga National Park, located in Assam, is home to the largest population of the Indian one-horned rhinoceros. The park is a biodiversity hotspot and also shelters tigers, elephants, and a variety of bird species.',
-                        'image_url': 'https://kaziranganationalparkassam.in/wp-content/uploads/2024/09/IMG_20240719_074806_954-2.jpg',
-                        'year': '1985',
-                        'fact': 'Kaziranga hosts over two-thirds of the world’s population of the Indian one-horned rhinoceros.'
-                    },
-                    'Qutub Minar': {
-                        'description': 'Qutub Minar in Delhi is a 73-meter tall tower built in the early 13th century by Qutb-ud-din Aibak and his successors. It is a UNESCO World Heritage Site known for its intricate carvings and towering presence.',
-                        'image_url': 'https://imgmediagumlet.lbb.in/media/2019/10/5d99cb588780ab0635aed883_1570360152711.jpg',
-                        'year': '1993',
-                        'fact': 'Qutub Minar is the tallest brick minaret in the world and has survived several earthquakes.'
-                    },
-                    'Jantar Mantar': {
-                        'description': 'Jantar Mantar in Jaipur is an astronomical observatory built in the 18th century by Maharaja Jai Singh II. It features the world’s largest stone sundial and numerous instruments for measuring time, predicting eclipses, and tracking stars.',
-                        'image_url': 'https://media.istockphoto.com/id/486396268/photo/historic-observatory.jpg?s=612x612&w=0&k=20&c=3D6GNFqEba-wnA4oLgelezGKSfl1FxOEYf_pU90B8qI=',
-                        'year': '2010',
-                        'fact': 'The instruments at Jantar Mantar are so large and precise that they can be used with the naked eye for accurate astronomical measurements.'
-                    },
-                    'Red Fort': {
-                        'description': 'The Red Fort in Delhi was the main residence of the Mughal emperors for nearly 200 years. Built in 1648 by Shah Jahan, it is an outstanding example of Mughal architecture, combining Persian, Timurid, and Indian elements.',
-                        'image_url': 'https://rukminim2.flixcart.com/image/850/1000/xif0q/poster/y/b/k/small-red-fort-poster-437-red-fort-poster-multicolor-photo-paper-original-imaghwgpmybwuu8e.jpeg?q=90&crop=false',
-                        'year': '2007',
-                        'fact': 'The Indian Prime Minister hoists the national flag at the Red Fort every Independence Day since 1947.'
-                    },
-                    'Humayun\'s Tomb': {
-                        'description': 'Humayun’s Tomb in Delhi, built in 1572, is the first garden-tomb in the Indian subcontinent. It inspired several major architectural innovations, including the Taj Mahal.',
-                        'image_url': 'https://cdn.britannica.com/57/91457-050-CEC85B47/Humayun-tomb-Delhi-India.jpg',
-                        'year': '1993',
-                        'fact': 'Humayun’s Tomb was the first structure in India to use red sandstone on such a grand scale.'
-                    },
-                    'Konark Sun Temple': {
-                        'description': 'The Konark Sun Temple, built in the 13th century by King Narasimhadeva I of the Eastern Ganga dynasty, is designed in the shape of a colossal chariot with intricately carved stone wheels, pillars, and walls. It is dedicated to the Sun God, Surya.',
-                        'image_url': 'https://media.istockphoto.com/id/96668487/photo/ancient-hindu-sun-temple-at-konark.jpg?s=612x612&w=0&k=20&c=tfjyAU_J1jmhxXTIu31E-6WcH3vcedUOhN-a2Z-YtCY=',
-                        'year': '1984',
-                        'fact': 'The temple’s 24 carved wheels are not just decorative — they also function as sundials.'
-                    },
-                    'Western Ghats': {
-                        'description': 'The Western Ghats, also known as the Sahyadri Hills, is a mountain range along the western coast of India. It is one of the world’s eight “hottest hotspots” of biological diversity and includes numerous protected areas and endemic species.',
-                        'image_url': 'https://plus.unsplash.com/premium_photo-1697730334419-fba83fe143b7?fm=jpg&q=60&w=3000&ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxzZWFyY2h8NXx8d2VzdGVybiUyMGdoYXRzfGVufDB8fDB8fHww',
-                        'year': '2012',
-                        'fact': 'The Western Ghats influence the Indian monsoon weather pattern and are older than the Himalayas.'
-                    },
-                    'Hampi': {
-                        'description': 'Hampi, located in Karnataka, was the capital of the Vijayanagara Empire in the 14th century. The site is known for its well-preserved ruins, majestic temples like the Virupaksha Temple, and unique architecture blending Hindu and Islamic styles.',
-                        'image_url': 'https://www.solitarytraveller.com/wp-content/uploads/2023/03/package_hampi_banner.jpg',
-                        'year': '1986',
-                        'fact': 'Hampi was once one of the richest cities in the world, attracting traders from Persia and Portugal.'
-                    },
-                    "Cellular Jail": {
-                        "description": "Located in Port Blair, Andaman and Nicobar Islands, the Cellular Jail, also known as Kala Pani, was a colonial prison used by the British to exile political prisoners. It is now a national memorial showcasing India’s freedom struggle.",
-                        "image_url": "https://s7ap1.scene7.com/is/image/incredibleindia/cellular-jail-port-blair-andaman-and-nicobar-islands-1-attr-hero?qlt=82&ts=1726816912863",
-                        "year": "1998",
-                        "fact": "The Cellular Jail had 698 cells designed to prevent communication between prisoners, symbolizing its role in isolating freedom fighters."
-                    },
-                    "Tirupati Temple": {
-                        "description": "Sri Venkateswara Temple in Tirupati, Andhra Pradesh, is one of the most revered Hindu pilgrimage sites, dedicated to Lord Vishnu. It is renowned for its Dravidian architecture and massive devotee footfall.",
-                        "image_url": "https://thefederal.com/file/2023/01/Tirupatitemple.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The temple is one of the richest religious institutions in the world, receiving millions of devotees and donations annually."
-                    },
-                    "Tawang Monastery": {
-                        "description": "Located in Arunachal Pradesh, Tawang Monastery is the largest Buddhist monastery in India, founded in the 17th century. It is a significant spiritual center for Tibetan Buddhism.",
-                        "image_url": "https://i.cdn.newsbytesapp.com/images/l33420241024094000.jpeg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The monastery houses a 28-foot-high golden statue of Lord Buddha, making it a focal point for Buddhist pilgrims."
-                    },
-                    "Kamakhya Temple": {
-                        "description": "Situated in Guwahati, Assam, the Kamakhya Temple is a major Shakti Peetha dedicated to Goddess Kamakhya. It is known for its unique tantric worship practices.",
-                        "image_url": "https://s7ap1.scene7.com/is/image/incredibleindia/kamakhya-temple-dispur-assam-2-attr-hero?qlt=82&ts=1726741392778",
-                        "year": "Not a UNESCO site",
-                        "fact": "The temple hosts the annual Ambubachi Mela, attracting thousands to celebrate the goddess’s menstruation cycle."
-                    },
-                    "Mahabodhi Temple": {
-                        "description": "Located in Bodh Gaya, Bihar, the Mahabodhi Temple marks the spot where Gautama Buddha attained enlightenment. It is a UNESCO World Heritage Site and a major Buddhist pilgrimage destination.",
-                        "image_url": "https://s7ap1.scene7.com/is/image/incredibleindia/mahabodhi-temple-gaya-bihar-4-attr-hero?qlt=82&ts=1726740645749",
-                        "year": "2002",
-                        "fact": "The temple’s Bodhi Tree is a direct descendant of the original tree under which Buddha meditated."
-                    },
-                    "Rock Garden": {
-                        "description": "The Rock Garden in Chandigarh, created by Nek Chand, is a unique sculpture garden made from recycled materials like ceramics, stones, and industrial waste, showcasing artistic ingenuity.",
-                        "image_url": "https://www.gardendesign.com/pictures/images/650x490Exact_48x0/site_3/asian-style-rock-garden-rock-garden-with-blue-screen-garden-design_15639.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The garden spans 40 acres and was secretly built by Nek Chand over decades before being officially recognized."
-                    },
-                    "Chitrakoot Falls": {
-                        "description": "Located in Chhattisgarh, Chitrakoot Falls is one of India’s widest waterfalls, often called the 'Niagara Falls of India,' surrounded by lush greenery.",
-                        "image_url": "https://static.toiimg.com/photo/38796013.cms",
-                        "year": "Not a UNESCO site",
-                        "fact": "The falls are named after the nearby Chitrakoot, associated with Lord Rama’s exile in the Ramayana."
-                    },
-                    "Diu Fort": {
-                        "description": "Built by the Portuguese in 1535, Diu Fort in Diu is a well-preserved coastal fortress, reflecting colonial architecture and strategic maritime history.",
-                        "image_url": "https://makeithappen.co.in/wp-content/uploads/2021/12/Diu-Fort-G1-4.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The fort houses a lighthouse and cannons, offering panoramic views of the Arabian Sea."
-                    },
-                    "Basilica of Bom Jesus": {
-                        "description": "Located in Goa, the Basilica of Bom Jesus is a UNESCO World Heritage Site famous for housing the mortal remains of St. Francis Xavier, showcasing Baroque architecture.",
-                        "image_url": "https://cdn-iladmib.nitrocdn.com/htBCYuNetSQrkeDEiUPoyTCbyIlIyAQV/assets/images/optimized/rev-0efd0da/www.soultravelling.in/blog/wp-content/uploads/2024/12/4-6-1024x685.jpg",
-                        "year": "1986",
-                        "fact": "The body of St. Francis Xavier, preserved in the basilica, is displayed every 10 years during a public exposition."
-                    },
-                    "Somnath Temple": {
-                        "description": "Located in Gujarat, the Somnath Temple is one of the twelve Jyotirlinga shrines of Lord Shiva, known for its historical significance and coastal location.",
-                        "image_url": "https://dynamic-media-cdn.tripadvisor.com/media/photo-o/0e/61/81/52/il-tempio.jpg?w=900&h=500&s=1",
-                        "year": "Not a UNESCO site",
-                        "fact": "The temple has been rebuilt multiple times after being destroyed by invaders, symbolizing resilience."
-                    },
-                    "Kurukshetra": {
-                        "description": "Kurukshetra in Haryana is a historic city associated with the Mahabharata, known for its sacred sites like Jyotisar, where the Bhagavad Gita was delivered.",
-                        "image_url": "https://static.toiimg.com/thumb/50366039,width-96,height-65.cms",
-                        "year": "Not a UNESCO site",
-                        "fact": "The city is believed to be the battlefield of the epic Mahabharata war between the Pandavas and Kauravas."
-                    },
-                    "Kullu Valley": {
-                        "description": "Nestled in Himachal Pradesh, Kullu Valley is known for its scenic beauty, adventure sports, and vibrant Dussehra festival, surrounded by the Himalayas.",
-                        "image_url": "https://i0.wp.com/traveltoyournature.com/wp-content/uploads/2023/10/nature-activities-with-views-in-Kullu-Valley-1024x768.jpg?resize=1024%2C768",
-                        "year": "Not a UNESCO site",
-                        "fact": "Kullu’s Dussehra festival is unique, celebrating Lord Raghunath with grand processions."
-                    },
-                    "Vaishno Devi Temple": {
-                        "description": "Located in Katra, Jammu and Kashmir, the Vaishno Devi Temple is a major Hindu pilgrimage site dedicated to Goddess Vaishno Devi, situated in the Trikuta Mountains.",
-                        "image_url": "https://thetempleguru.com/wp-content/uploads/2024/08/Vaishno-Devi-Temple-katra-jk-3.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "Devotees trek 12 km to reach the cave shrine, which is one of India’s most visited pilgrimage sites."
-                    },
-                    "Betla National Park": {
-                        "description": "Located in Jharkhand, Betla National Park is a tiger reserve known for its biodiversity, waterfalls, and historic forts amidst dense forests.",
-                        "image_url": "https://site.outlookindia.com/traveller/wp-content/uploads/2017/06/jharkhand1_Betla-NP_FI.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The park is home to the 16th-century Betla Fort, adding historical significance to its natural beauty."
-                    },
-                    "Periyar National Park": {
-                        "description": "Situated in Kerala, Periyar National Park is a biodiversity hotspot and tiger reserve, famous for its elephant and tiger populations and scenic Periyar Lake.",
-                        "image_url": "https://www.periyarnationalparkonline.in/images/wildlife-wonders-periyar.jpg",
-                        "year": "2010",
-                        "fact": "The park’s lake, formed by the Mullaperiyar Dam, offers unique boat safaris for wildlife viewing."
-                    },
-                    "Leh Palace": {
-                        "description": "Located in Ladakh, Leh Palace is a 17th-century royal palace built in Tibetan architectural style, offering panoramic views of the Himalayas.",
-                        "image_url": "https://www.go2ladakh.in/img/shared/gallery/28a3d6951d94be8c08426de8da80e78b.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The palace, resembling a smaller Potala Palace, was once home to the Namgyal dynasty."
-                    },
-                    "Agatti Island": {
-                        "description": "Part of Lakshadweep, Agatti Island is known for its coral reefs, turquoise lagoons, and pristine beaches, making it a paradise for water sports and marine life enthusiasts.",
-                        "image_url": "https://static.tripzilla.in/media/51542/conversions/df4b93dd-5f80-4e21-a4fa-e7d530506ed1-w768.webp",
-                        "year": "Not a UNESCO site",
-                        "fact": "Agatti has one of the few airports in Lakshadweep, serving as a gateway to the islands."
-                    },
-                    "Khajuraho Temples": {
-                        "description": "The Khajuraho Temples in Madhya Pradesh, a UNESCO World Heritage Site, are renowned for their intricate erotic carvings and Nagara-style architecture, built between 950-1050 CE.",
-                        "image_url": "https://www.holidify.com/images/cmsuploads/compressed/shutterstock_1032564361_20200219140048.jpg",
-                        "year": "1986",
-                        "fact": "Only about 20 of the original 85 temples remain, showcasing exquisite medieval Indian art."
-                    },
-                    "Loktak Lake": {
-                        "description": "Located in Manipur, Loktak Lake is the largest freshwater lake in Northeast India, famous for its floating phumdis (vegetation islands) and Keibul Lamjao National Park.",
-                        "image_url": "https://www.savaari.com/blog/wp-content/uploads/2022/12/loktak-lake-in-india.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "Keibul Lamjao, on the lake, is the world’s only floating national park, home to the endangered Sangai deer."
-                    },
-                    "Living Root Bridges": {
-                        "description": "Found in Meghalaya, the Living Root Bridges are hand-crafted by the Khasi and Jaintia tribes using the roots of rubber trees, creating sustainable natural bridges.",
-                        "image_url": "https://faw-marketing.transforms.svdcdn.com/production/images/A-living-root-bridge.jpg?w=600&h=400&q=80&auto=format&fit=crop&crop=focalpoint&fp-x=0.5&fp-y=0.5&dm=1542707094&s=a6f7365df9bdffff06bce06f32310013",
-                        "year": "Not a UNESCO site",
-                        "fact": "The double-decker root bridge in Nongriat is one of the most iconic, taking decades to grow."
-                    },
-                    "Vantawng Falls": {
-                        "description": "Located in Mizoram, Vantawng Falls is the state’s highest waterfall, cascading through lush forests and offering breathtaking views.",
-                        "image_url": "https://cdn.tripuntold.com/media/photos/location/2018/08/14/fbd0dbd7-7cdc-4f46-8394-e97485dab7dc.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The falls are named after Vantawnga, a legendary Mizo hunter who discovered them."
-                    },
-                    "Kohima War Cemetery": {
-                        "description": "In Kohima, Nagaland, this cemetery commemorates Allied soldiers who died in the 1944 Battle of Kohima, a turning point in World War II.",
-                        "image_url": "https://travelsetu.com/apps/uploads/new_destinations_photos/destination/2024/01/18/e6b0b1fd4bb207ec797bc528045e21b2_1000x1000.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The cemetery’s epitaph reads, ‘When you go home, tell them of us and say, for your tomorrow, we gave our today.’"
-                    },
-                    "Auroville": {
-                        "description": "Located in Puducherry, Auroville is an experimental township founded in 1968, aiming to be a universal community based on peace and human unity, centered around the Matrimandir.",
-                        "image_url": "https://static.toiimg.com/thumb/99391984/Matrimandir-in-Puducherry.jpg?width=1200&height=900",
-                        "year": "Not a UNESCO site",
-                        "fact": "The Matrimandir, a golden spherical meditation center, is Auroville’s spiritual and architectural highlight."
-                    },
-                    "Golden Temple": {
-                        "description": "Located in Amritsar, Punjab, the Golden Temple (Harmandir Sahib) is the holiest Sikh shrine, known for its stunning golden architecture and communal kitchen serving free meals.",
-                        "image_url": "https://www.whyweseek.com/wp-content/uploads/2020/01/facebook-amritsar.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The temple’s langar serves up to 100,000 meals daily, open to all regardless of faith or status."
-                    },
-                    "Amber Fort": {
-                        "description": "Situated in Jaipur, Rajasthan, Amber Fort is a majestic hilltop fortress known for its Rajput architecture, intricate mirror work, and stunning views.",
-                        "image_url": "https://www.rajasthanbhumitours.com/blog/wp-content/uploads/2024/08/Amber-Fort-and-Palace-The-Guardian-of-Rajput-Glory.jpg",
-                        "year": "2013",
-                        "fact": "The fort’s Sheesh Mahal features thousands of tiny mirrors, creating a dazzling effect when lit."
-                    },
-                    "Rumtek Monastery": {
-                        "description": "Located in Sikkim, Rumtek Monastery is a key center for Tibetan Buddhism, known for its traditional architecture and as the seat of the Karmapa.",
-                        "image_url": "https://www.elginhotels.com/wp-content/uploads/2020/03/rumtek-monastery-01.jpg.webp",
-                        "year": "Not a UNESCO site",
-                        "fact": "The monastery houses rare Buddhist relics, including a golden stupa containing the remains of the 16th Karmapa."
-                    },
-                    "Meenakshi Temple": {
-                        "description": "Located in Madurai, Tamil Nadu, the Meenakshi Temple is a historic Dravidian temple dedicated to Goddess Meenakshi and Lord Sundareswarar, famous for its towering gopurams.",
-                        "image_url": "https://thrillingtravel.in/wp-content/uploads/2018/02/Golden-Lotus-Pond-at-Meenakshi-Temple.jpg",
-                        "year": "Not a UNESCO site",
-                        "fact": "The temple’s 14 gopurams are adorned with over 33,000 sculptures, showcasing intricate craftsmanship."
-                    },
-                    "Charminar": {
-                        "description": "Built in 1591 in Hyderabad, Telangana, the Charminar is an iconic monument and mosque, known for its four minarets and vibrant surrounding markets.",
-                        "image_url": "https://media1.thrillophilia.com/filestore/3g77vc5tt9qxuuorsmeudjjscqtu_Charminar.jpg?w=400&dpr=2",
-                        "year": "Not a UNESCO site",
-                        "fact": "The Charminar was built to commemorate the end of a deadly plague in Hyderabad."
-                    },
-                    "Ujjayantha Palace": {
-                        "description": "Located in Agartala, Tripura, Ujjayantha Palace is a 19th-century royal palace, now a museum, showcasing the history and culture of Tripura.",
-                        "image_url": "https://dynamic-media-cdn.tripadvisor.com/media/photo-o/17/9f/9b/ef/img-20190308-132059-largejpg.jpg?w=900&h=500&s=1",
-                        "year": "Not a UNESCO site",
-                        "fact": "The palace was named by Rabindranath Tagore, who was a frequent visitor."
-                    },
-                    "Valley of Flowers": {
-                        "description": "Located in Uttarakhand, the Valley of Flowers is a UNESCO World Heritage Site known for its vibrant alpine meadows and rare flora, nestled in the Himalayas.",
-                        "image_url": "https://www.holidify.com/images/bgImages/VALLEY-OF-FLOWERS.jpg",
-                        "year": "2005",
-                        "fact": "The valley is home to over 500 species of wildflowers, blooming vividly during the monsoon season."
-                    },
-                    "Victoria Memorial": {
-                        "description": "Located in Kolkata, West Bengal, the Victoria Memorial is a grand marble monument built in memory of Queen Victoria, now a museum showcasing colonial history.",
-                        "image_url": "https://images.unsplash.com/photo-1558431382-9b06d0507edc?ixid=MnwzODM4MzZ8MHwxfGFsbHx8fHx8fHx8fDE2NzAxNjMwNTg&ixlib=rb-4.0.3&fm=jpg&q=85&fit=crop&w=2560&h=1920",
-                        "year": "Not a UNESCO site",
-                        "fact": "The memorial houses a vast collection of artifacts, including paintings and manuscripts from the British Raj era."
-                    }
-                }
+                site_info = SITE_INFO
             
+                prefetch_images(site_info, width=400)
                 if selected_site in site_info:
                     st.markdown(f"### {selected_site}")
                     site_data = heritage_data[heritage_data['Site'] == selected_site].iloc[0]
@@ -3454,29 +5472,32 @@ def integrate_with_existing_app():
                     st.markdown(f"**Year Inscribed:** {site_data['Year_Inscribed']}")
                     st.markdown(f"**Annual Visitors:** {site_data['Visitors_Annual']:,}")
                     st.write(f"Detailed information about {selected_site} is not available.")
+
+                # Nearby places from the spatial index
+                st.markdown("#### Nearby")
+                radius_km = st.slider("Within (km):", min_value=25, max_value=500, value=100, step=25)
+                spatial_index = get_spatial_index()
+                nearby = spatial_index.within(site_data['lat'], site_data['lon'], radius_km)
+                nearby = nearby[nearby['Name'] != selected_site]
+                if nearby.empty:
+                    nearby = spatial_index.nearest(site_data['lat'], site_data['lon'], k=4)
+                    nearby = nearby[nearby['Name'] != selected_site]
+                    st.write(f"Nothing else within {radius_km} km. The closest places are:")
+                st.dataframe(nearby[['Name', 'Kind', 'State', 'Distance_km']].head(10),
+                             use_container_width=True, hide_index=True)
         
             st.markdown("<h2 class='sub-header'>Geographical Distribution of UNESCO Heritage Sites</h2>", unsafe_allow_html=True)
         
-            m = folium.Map(location=[20.5937, 78.9629], zoom_start=5, tiles='cartodbpositron')
-            marker_cluster = MarkerCluster().add_to(m)
-        
-            for _, row in heritage_data.iterrows():
-                popup_content = f"""
-                <b>{row['Site']}</b><br>
-                State: {row['State']}<br>
-                Year Inscribed: {row['Year_Inscribed']}<br>
-                Visitors: {row['Visitors_Annual']:,}<br>
-                Type: {row['Type']}
-                """
-                folium.Marker(
-                    location=[row['lat'], row['lon']],
-                    popup=folium.Popup(popup_content, max_width=300),
-                    tooltip=row['Site'],
-                    icon=folium.Icon(color='blue', icon='landmark', prefix='fa')
-                ).add_to(marker_cluster)
-        
-            map_html = m._repr_html_()
-            components.html(map_html, height=600)
+            show_marker_map(
+                ('unesco', dataset_version(heritage_data)), len(heritage_data),
+                lambda: marker_rows(
+                    heritage_data, 'Site',
+                    [('State', 'State'), ('Year Inscribed', 'Year_Inscribed'),
+                     ('Visitors', heritage_data['Visitors_Annual'].map('{:,}'.format)), ('Type', 'Type')],
+                    color='blue', icon='landmark',
+                ),
+                key='unesco_map',
+            )
     
         with site_category[1]:
             st.markdown("<h2 class='sub-header'>Archaeological Monuments and Sites</h2>", unsafe_allow_html=True)
@@ -3510,6 +5531,7 @@ def integrate_with_existing_app():
             
             # Additional Visual: Monument Distribution from CSV
             st.markdown("<h2 class='sub-header'>Monument Distribution from ASI Data</h2>", unsafe_allow_html=True)
+            monuments_df = datasets['monuments']
             if not monuments_df.empty:
                 fig_treemap = px.treemap(monuments_df, path=['State/UT'], values='No_of_Monuments',
                                          title="State-wise Monument Distribution (ASI Data)",
@@ -3590,9 +5612,13 @@ def integrate_with_existing_app():
                 st.markdown(f"**{selected_state}**")
                 st.markdown(f"- Foreign Tourist Visits (2022): **{state_data['FTV_2022']:,}**")
                 st.markdown(f"- Percentage Share: **{state_data['Percentage_Share_2022']}%**")
+                state_2021 = query_table('visitors', columns=('STATE_UT', 'FTVS_2021'), state=selected_state)
+                if not state_2021.empty and pd.notna(state_2021['2021 - FTVs'].iloc[0]):
+                    st.markdown(f"- Foreign Tourist Visits (2021): **{state_2021['2021 - FTVs'].iloc[0]:,.0f}**")
         
             # Additional Visual: Visitor Trends from CSV
             st.markdown("<h2 class='sub-header'>Foreign Visitor Trends (2019-2021)</h2>", unsafe_allow_html=True)
+            visitors_df = query_table('visitors', columns=('STATE_UT', 'FTVS_2021'))
             if not visitors_df.empty:
                 fig_visitors = px.bar(visitors_df, x='State/UT', y='2021 - FTVs', color='State/UT',
                                       title='Foreign Tourist Visits by State (2021)',
@@ -3630,9 +5656,13 @@ def integrate_with_existing_app():
                 st.markdown(f"**{selected_state}**")
                 st.markdown(f"- Domestic Tourist Visits (2022): **{state_data['DTV_2022_millions']:.2f} million**")
                 st.markdown(f"- Percentage Share: **{state_data['Percentage_Share_2022']}%**")
+                state_2021 = query_table('visitors', columns=('STATE_UT', 'DTVS_2021'), state=selected_state)
+                if not state_2021.empty and pd.notna(state_2021['2021 - DTVs'].iloc[0]):
+                    st.markdown(f"- Domestic Tourist Visits (2021): **{state_2021['2021 - DTVs'].iloc[0]:,.0f}**")
         
             # Additional Visual: Domestic Visitor Trends from CSV
             st.markdown("<h2 class='sub-header'>Domestic Visitor Trends (2019-2021)</h2>", unsafe_allow_html=True)
+            visitors_df = query_table('visitors', columns=('STATE_UT', 'DTVS_2021'))
             if not visitors_df.empty:
                 fig_visitors = px.bar(visitors_df, x='State/UT', y='2021 - DTVs', color='State/UT',
                                       title='Domestic Tourist Visits by State (2021)',
@@ -3755,159 +5785,10 @@ def integrate_with_existing_app():
                 events_data['Event'].tolist()
             )
 
-            event_info = {
-				'Kumbh Mela': {
-						'description': 'The Kumbh Mela is a major Hindu pilgrimage and festival held every 12 years at four sacred river-bank locations. It is the world’s largest religious gathering, attracting millions of devotees.',
-						'image_url': 'https://images.theconversation.com/files/642200/original/file-20250114-15-oucsvl.jpg?ixlib=rb-4.1.0&rect=0%2C85%2C4063%2C2031&q=45&auto=format&w=1356&h=668&fit=crop'
-				},
-				'Pushkar Camel Fair': {
-						'description': 'The Pushkar Camel Fair is an annual livestock fair held in Pushkar, Rajasthan, featuring camel trading, cultural performances, and religious ceremonies.',
-						'image_url': 'https://blog.dookinternational.com/wp-content/uploads/2017/06/a24.jpg'
-				},
-				'Rann Utsav': {
-						'description': 'Rann Utsav is a cultural festival held in the Great Rann of Kutch, Gujarat, showcasing traditional crafts, folk music, and dance under the full moon in the white salt desert.',
-						'image_url': 'https://c.ndtvimg.com/2024-10/beukk88_rann-utsav_625x300_23_October_24.jpg?im=FaceCrop,algorithm=dnn,width=545,height=307'
-				},
-				'Hornbill Festival': {
-						'description': 'The Hornbill Festival in Nagaland is a vibrant celebration of Naga culture, featuring traditional dances, indigenous games, and tribal crafts, uniting all Naga tribes.',
-						'image_url': 'https://img.theweek.in/content/dam/week/week/news/tourism/images/2024/11/30/hornbill-file-photo.jpg'
-				},
-				'Onam': {
-						'description': 'Onam is a harvest festival in Kerala, marked by floral decorations, traditional feasts, snake boat races, and the mythical return of King Mahabali.',
-						'image_url': 'https://currentaffairs.adda247.com/wp-content/uploads/multisite/sites/5/2021/08/23081756/Onam-Celebration-in-Kerala-1024x660-1.jpg'
-				},
-				'Durga Puja': {
-						'description': 'Durga Puja is a major Hindu festival in West Bengal, celebrating the victory of Goddess Durga over Mahishasura, with elaborate pandals, idol immersions, and cultural performances.',
-						'image_url': 'https://surojitpalmal.com/wp-content/uploads/2023/10/Best-Durga-Puja-in-Hyderabad.webp'
-				},
-				'Diwali in Varanasi': {
-						'description': 'Diwali in Varanasi is a spectacular celebration with thousands of oil lamps lighting up the ghats, fireworks, and devotional music, symbolizing the victory of light over darkness.',
-						'image_url': 'https://www.nativeplanet.com/img/2023/09/illuminated-city-of-varanasi-during-the-divine-festival-of-dev-diwali_1695797197486-1200x675-20230927122601.jpg'
-				},
-				'Hemis Festival': {
-						'description': 'The Hemis Festival in Ladakh commemorates the birth of Guru Padmasambhava with vibrant masked dances, traditional music, and Buddhist rituals at the Hemis Monastery.',
-						'image_url': 'https://images.indianexpress.com/2023/06/hemis-new.png'
-				},
-				'Holi in Mathura': {
-						'description': 'Holi in Mathura, the birthplace of Lord Krishna, is a vibrant festival of colors with temple rituals, folk songs, and playful throwing of colored powders.',
-						'image_url': 'https://clubmahindra.gumlet.io/blog/media/section_images/holifestiv-a5b10b7c01f70d2.jpg?w=376&dpr=2.6'
-				},
-				'Pongal': {
-						'description': 'Pongal is a Tamil harvest festival dedicated to the Sun God, marked by cooking a special rice dish, traditional dances, and cattle worship over four days.',
-						'image_url': 'https://cdn.shopify.com/s/files/1/0525/5285/9819/files/4_2_1024x1024.jpg?v=1734523615'
-				},
-				'Bihu': {
-						'description': 'Bihu is Assam’s harvest festival, celebrated with vigorous Bihu dances, traditional music, and feasts, marking the Assamese New Year and agricultural cycles.',
-						'image_url': 'https://media.istockphoto.com/id/1482254684/photo/rongali-bihu-festival.jpg?s=612x612&w=0&k=20&c=OKRcAAc6HMqMluMBQFQmPypo5uZZ_AO6xIVkI-TV6Pw='
-				},
-				'Ganesh Chaturthi': {
-						'description': 'Ganesh Chaturthi in Maharashtra celebrates Lord Ganesha’s birth with grand idol installations, prayers, and processions, culminating in idol immersions.',
-						'image_url': 'https://images.mid-day.com/images/images/2022/aug/Ganesh-Chaturthi-Mumbai.jpg'
-				},
-				'Navratri': {
-						'description': 'Navratri is a nine-night Hindu festival celebrating Goddess Durga, with Garba and Dandiya dances in Gujarat, fasting, and vibrant worship across India.',
-						'image_url': 'https://www.travelandtourworld.com/wp-content/uploads/2024/09/pikaso_texttoimage_Navratri-Fest.jpg'
-				},
-				'Jaipur Literature Festival': {
-						'description': 'The Jaipur Literature Festival in Rajasthan is the world’s largest free literary festival, attracting global authors, poets, and intellectuals for discussions and cultural events.',
-						'image_url': 'https://akm-img-a-in.tosshub.com/indiatoday/images/story/201601/jaipur-lit-fest_647_012016104450.jpg?VersionId=smUFj19HBJPNugmvaxtHMaTxb_1tVQeh'
-				},
-				'Khajuraho Dance Festival': {
-						'description': 'The Khajuraho Dance Festival in Madhya Pradesh showcases classical Indian dance forms against the backdrop of the Khajuraho temples, celebrating India’s performing arts heritage.',
-						'image_url': 'https://www.theweek.in/content/dam/week/news/entertainment/images/2023/2/19/khajuraho-dance-fest.jpg.transform/schema-1x1/image.jpg'
-				},
-				'Thrissur Pooram': {
-						'description': 'Thrissur Pooram is a vibrant Hindu temple festival in Kerala, known for its spectacular elephant processions, traditional music, and fireworks, held at the Vadakkunnathan Temple.',
-						'image_url': 'https://thrissurpooramfestival.com/engine1/bnr_img/bnr01.jpg'
-				},
-				'Baisakhi': {
-						'description': 'Baisakhi is a harvest festival celebrated in Punjab, marking the Sikh New Year with vibrant processions, traditional dances like Bhangra, and communal feasts.',
-						'image_url': 'https://static.toiimg.com/thumb/msid-90802194,width-1280,height-720,imgsize-178800,resizemode-6,overlay-toi_sw,pt-32,y_pad-40/photo.jpg'
-				},
-				'Chhath Puja': {
-						'description': 'Chhath Pooja is a Hindu festival primarily in Bihar, dedicated to the Sun God, involving rituals, fasting, and offerings at riverbanks over four days.',
-						'image_url': 'https://121clicks.com/wp-content/uploads/2017/11/chhath_puja_mass_prayer_to_the_sun_photo_story_121_clicks_arup_biswas_27.jpg'
-				},
-				'Teej': {
-						'description': 'Teej is a women-centric festival celebrated in Rajasthan and other northern states, marked by fasting, colorful attire, and traditional dances to honor Goddess Parvati.',
-						'image_url': 'https://s7ap1.scene7.com/is/image/incredibleindia/teej%20festival-1-regional-fes-hero?qlt=82&ts=1726639479648'
-				},
-				'Losar': {
-						'description': 'Losar is the Tibetan New Year celebrated in Ladakh with Buddhist rituals, vibrant dances, and feasts, marking the beginning of the lunar calendar.',
-						'image_url': 'https://i0.wp.com/www.tusktravel.com/blog/wp-content/uploads/2021/02/Losar-Festival-Ladakh.jpg?fit=1024%2C683&ssl=1'
-				},
-				'Goa Carnival': {
-						'description': 'Goa Carnival is a lively pre-Lenten festival in Goa, featuring colorful parades, street dancing, and vibrant costumes, reflecting Portuguese cultural influences.',
-						'image_url': 'https://static.toiimg.com/photo/62649959.cms'
-				},
-				'Torgya Festival': {
-						'description': 'Torgya Festival in Arunachal Pradesh is a monastic festival at Tawang Monastery, featuring ritualistic dances to ward off evil spirits and promote prosperity.',
-						'image_url': 'https://currentaffairs.adda247.com/wp-content/uploads/multisite/sites/5/2022/02/03080344/arunachal-festival-01.jpg'
-				},
-				'Sangai Festival': {
-						'description': 'Sangai Festival in Manipur showcases the state’s cultural heritage with traditional dances, indigenous sports, and crafts, named after the endangered Sangai deer.',
-						'image_url': 'https://static2.tripoto.com/media/filter/tst/img/172710/TripDocument/1542010952_sangai_41.jpg'
-				},
-				'Konark Dance Festival': {
-						'description': 'Konark Dance Festival in Odisha celebrates classical Indian dance forms like Odissi and Bharatanatyam, set against the backdrop of the historic Konark Sun Temple.',
-						'image_url': 'https://odishatourism.gov.in/content/dam/tourism/home/upcoming-events/konark_dance_festival/stb/img1.jpg'
-				},
-				'Makar Sankranti': {
-						'description': 'Makar Sankranti is a harvest festival celebrated across India, marking the sun’s transition into Capricorn with kite flying, bonfires, and traditional sweets.',
-						'image_url': 'https://www.stmarys-school.in/wp-content/uploads/2023/01/1-1.jpg'
-				},
-				'Vishu': {
-						'description': 'Vishu is the Malayalam New Year in Kerala, celebrated with traditional rituals, Vishukkani arrangements, and feasts to mark prosperity and new beginnings.',
-						'image_url': 'https://cdn.pixabay.com/photo/2022/01/27/06/35/happy-vishu-6971252_960_720.jpg'
-				},
-				'Bathukamma': {
-						'description': 'Bathukamma is a floral festival in Telangana, where women create vibrant flower arrangements and sing folk songs to honor Goddess Gauri.',
-						'image_url': 'https://www.sakshi.com/gallery_images/2023/10/13/bathukamma%20celebrations%20in%20hyderabad-1.jpg'
-				},
-				'Wangala Festival': {
-						'description': 'Wangala Festival in Meghalaya is a harvest celebration of the Garo tribe, featuring traditional drum beating, dances, and offerings to the Sun God.',
-						'image_url': 'https://i0.wp.com/www.tusktravel.com/blog/wp-content/uploads/2023/11/100-Drums-Festival-of-Meghalay.jpg?fit=1024%2C768&ssl=1'
-				},
-				'Chapchar Kut': {
-						'description': 'Chapchar Kut is a spring festival in Mizoram, celebrating the sowing season with traditional Mizo dances, music, and feasts, showcasing tribal unity.',
-						'image_url': 'https://assamtribune.com/h-upload/2025/03/08/1694809-chapchar-kut-mizo-fest.jpg'
-				},
-				'Gudi Padwa': {
-						'description': 'Gudi Padwa marks the Marathi New Year in Maharashtra, celebrated with colorful rangolis, hoisting of Gudi flags, and traditional feasts.',
-						'image_url': 'https://cdn.cdnparenting.com/articles/2018/09/19150407/Gudi-Padwa-1.webp'
-				},
-				'Ambubachi Mela': {
-						'description': 'Ambubachi Mela in Assam is a tantric festival at Kamakhya Temple, celebrating the menstruation of Goddess Kamakhya with rituals and pilgrimages.',
-						'image_url': 'https://thehillstimes.in/wp-content/uploads/2024/06/image_editor_output_image1737499973-1652978579963.jpg'
-				},
-				'Sankranti': {
-						'description': 'Sankranti, celebrated in Andhra Pradesh, is a harvest festival with traditional rituals, kite flying, and offerings to mark the sun’s northward journey.',
-						'image_url': 'https://assets.thehansindia.com/h-upload/2025/01/07/1512814-haridasu.webp'
-				},
-				'Lohri': {
-						'description': 'Lohri is a Punjabi festival marking the winter solstice, celebrated with bonfires, folk songs, and dances like Bhangra, symbolizing harvest and prosperity.',
-						'image_url': 'https://i.pinimg.com/736x/e7/07/c5/e707c568aa174eae63e3fd677a81bb05.jpg'
-				},
-				'Modhera Dance Festival': {
-						'description': 'Modhera Dance Festival in Gujarat showcases classical dance forms like Garba and Dandiya, performed at the historic Sun Temple in Modhera.',
-						'image_url': 'https://creativeyatra.com/wp-content/uploads/2017/02/RDSC01292-1-bw.jpg'
-                        
-				},
-				'Ladakh Festival': {
-						'description': 'Ladakh Festival celebrates the region’s Buddhist heritage with traditional dances, polo matches, and cultural exhibitions in Leh and surrounding areas.',
-						'image_url': 'https://lifeontheplanetladakh.com/wp-content/uploads/2024/07/IMG_5991.jpeg'
-				},
-				'Tansen Samaroh': {
-						'description': 'Tansen Samaroh in Madhya Pradesh is a classical music festival honoring Tansen, featuring performances by renowned musicians near his tomb in Gwalior.',
-						'image_url': 'https://www.festivalsofindia.in/images/tansen.jpg'
-				},
-				'Lakshadweep Cultural Fest': {
-						'description': 'Lakshadweep Cultural Festival showcases the islands’ unique traditions with folk dances, music, and local crafts, celebrating the vibrant island culture.',
-						'image_url': 'https://tripxl.com/blog/wp-content/uploads/2024/10/Milad-un-Nabi.jpg'
-				}
-		    }
+            event_info = EVENT_INFO
            
         
+            prefetch_images(event_info, width=400)
             if selected_event in event_info:
                 st.markdown(f"### {selected_event}")
                 event_data = events_data[events_data['Event'] == selected_event].iloc[0]
@@ -3985,32 +5866,17 @@ def integrate_with_existing_app():
         if events_data.empty:
             st.error("No valid data with latitude and longitude available to display on the map.")
         else:
-            # Create the Folium map (unchanged)
-            m = folium.Map(location=[20.5937, 78.9629], zoom_start=5, tiles='cartodbpositron')
-            marker_cluster = MarkerCluster().add_to(m)
-
-            # Iterate through events data to create markers (unchanged)
-            for _, row in events_data.iterrows():
-                state = row['State']
-                if state in event_coords:  # This check is retained from the original code
-                    lat, lon = event_coords[state]
-                    popup_content = f"""
-                    <b>{row['Event']}</b><br>
-                    State: {row['State']}<br>
-                    Month: {row['Month']}<br>
-                    Visitors: {row['Visitors_Estimate']:,}<br>
-                    Significance: {row['Cultural_Significance']}/10
-                    """
-                    folium.Marker(
-                        location=[lat, lon],
-                        popup=folium.Popup(popup_content, max_width=300),
-                        tooltip=row['Event'],
-                        icon=folium.Icon(color='green', icon='calendar', prefix='fa')
-                    ).add_to(marker_cluster)
-
-            # Render the map in Streamlit
-            map_html = m._repr_html_()
-            components.html(map_html, height=600)
+            show_marker_map(
+                ('events', dataset_version(events_data)), len(events_data),
+                lambda: marker_rows(
+                    events_data, 'Event',
+                    [('State', 'State'), ('Month', 'Month'),
+                     ('Visitors', events_data['Visitors_Estimate'].map('{:,}'.format)),
+                     ('Significance', events_data['Cultural_Significance'].astype(str) + '/10')],
+                    color='green', icon='calendar',
+                ),
+                key='events_map',
+            )
 
     # Cultural Economy Page
     elif page == "Cultural Economy":
@@ -4066,6 +5932,7 @@ def integrate_with_existing_app():
 
             # Additional Visual: Budget Trends from CSV
             st.markdown("<h2 class='sub-header'>Cultural Budget Trends</h2>", unsafe_allow_html=True)
+            budget_df = datasets['budget']
             if not budget_df.empty:
                 #change
                 #fig_budget = px.bar(budget_df, x='Year', y='Budget', color='Scheme',
@@ -4420,20 +6287,8 @@ def integrate_with_existing_app():
 
         crafts_data = load_crafts_data()[['Craft', 'State']].rename(columns={'Craft': 'Name'})
         # Assign approximate coordinates for crafts (using state centroids)
-        state_coords = {
-            'Jammu & Kashmir': [34.0837, 74.7973],
-            'Uttar Pradesh': [26.8467, 80.9462],
-            'Rajasthan': [26.9124, 75.7873],
-            'Karnataka': [15.3173, 75.7139],
-            'Tamil Nadu': [11.1271, 78.6569],
-            'Gujarat': [23.0225, 72.5714],
-            'Punjab': [31.1471, 75.3412],
-            'West Bengal': [22.5726, 88.3639],
-            'Chhattisgarh': [21.2787, 81.8661],
-            'Madhya Pradesh': [23.2599, 77.4126]
-        }
-        crafts_data['lat'] = crafts_data['State'].map(lambda x: state_coords.get(x, [20.5937, 78.9629])[0])
-        crafts_data['lon'] = crafts_data['State'].map(lambda x: state_coords.get(x, [20.5937, 78.9629])[1])
+        crafts_data['lat'] = crafts_data['State'].map(lambda x: STATE_CENTROIDS.get(x, [20.5937, 78.9629])[0])
+        crafts_data['lon'] = crafts_data['State'].map(lambda x: STATE_CENTROIDS.get(x, [20.5937, 78.9629])[1])
         crafts_data['Category'] = 'Crafts'
 
         events_data = load_cultural_events_data()[['Event', 'State', 'Month']].rename(columns={'Event': 'Name'})
@@ -4469,8 +6324,9 @@ def integrate_with_existing_app():
 
         st.markdown("<h2 class='sub-header'>Explore on Map</h2>", unsafe_allow_html=True)
 
-        m = folium.Map(location=[20.5937, 78.9629], zoom_start=5, tiles='cartodbpositron')
-        marker_cluster = MarkerCluster().add_to(m)
+        viewport_mode = st.toggle("Load only the places in view", value=False,
+                                  help="Sends the map just the markers inside the visible area, "
+                                       "or grouped counts when zoomed out.")
 
         category_icons = {
             'Heritage Sites': {'color': 'blue', 'icon': 'landmark'},
@@ -4479,22 +6335,15 @@ def integrate_with_existing_app():
             'Events': {'color': 'green', 'icon': 'calendar'}
         }
 
-        for _, row in filtered_data.iterrows():
-            popup_content = f"""
-            <b>{row['Name']}</b><br>
-            State: {row['State']}<br>
-            Category: {row['Category']}<br>
-            """
-            if 'Month' in row and pd.notna(row['Month']):
-                popup_content += f"Month: {row['Month']}<br>"
-
-            icon_info = category_icons.get(row['Category'], {'color': 'gray', 'icon': 'info'})
-            folium.Marker(
-                location=[row['lat'], row['lon']],
-                popup=folium.Popup(popup_content, max_width=300),
-                tooltip=row['Name'],
-                icon=folium.Icon(color=icon_info['color'], icon=icon_info['icon'], prefix='fa')
-            ).add_to(marker_cluster)
+        # Reruns with the same data and filters (or from unrelated widgets) reuse the rendered map or
+        # point index, so the marker rows are built only when this key is new
+        map_key = ('explorer', dataset_version(combined_data), selected_state, selected_category, selected_month)
+        build_map_rows = lambda: marker_rows(
+            filtered_data, 'Name',
+            [('State', 'State'), ('Category', 'Category'), ('Month', 'Month')],
+            color=filtered_data['Category'].map(lambda c: category_icons.get(c, {'color': 'gray'})['color']),
+            icon=filtered_data['Category'].map(lambda c: category_icons.get(c, {'icon': 'info'})['icon']),
+        )
         
         # Load custom CSS for modern styling
         st.markdown("""
@@ -4568,8 +6417,10 @@ def integrate_with_existing_app():
         }
         </style>
         """, unsafe_allow_html=True)
-        map_html = m._repr_html_()
-        components.html(map_html, height=600)
+        if viewport_mode:
+            viewport_map(map_key, build_map_rows, key='explorer_viewport_map')
+        else:
+            show_marker_map(map_key, len(filtered_data), build_map_rows, key='explorer_map')
 
         st.markdown("<h2 class='sub-header'>Filtered Results</h2>", unsafe_allow_html=True)
         st.dataframe(filtered_data[['Name', 'State', 'Category']], use_container_width=True)